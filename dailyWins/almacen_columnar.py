@@ -0,0 +1,260 @@
+from datetime import date
+import numpy as np
+from logro import Logro, EPOCA, MINUTOS_POR_DIA
+
+
+class LogroStore:
+    """
+    Almacén columnar de logros respaldado por arreglos de NumPy.
+    Guarda día (ordinal), código de categoría y minuto del día en
+    arreglos paralelos, y las descripciones en una lista aparte.
+
+    Implementa las consultas agregadas que usa Estadisticas como
+    `fuente`, resolviéndolas con operaciones vectorizadas.
+    """
+
+    CAPACIDAD_INICIAL = 1024
+
+    def __init__(self, capacidad=CAPACIDAD_INICIAL):
+        """
+        Constructor del almacén.
+
+        Args:
+            capacidad (int): Cantidad de registros reservados inicialmente
+        """
+        self.n = 0
+        self.version = 0  # Se incrementa con cada logro agregado
+        self._dias = np.empty(capacidad, dtype=np.int32)
+        self._categorias = np.empty(capacidad, dtype=np.int16)
+        self._minutos = np.empty(capacidad, dtype=np.int16)
+        self.descripciones = []
+
+        # Diccionario de categorías: código <-> nombre
+        self.nombres_categorias = []
+        self._codigos_categoria = {}
+
+    # ----- Columnas (vistas sin copia sobre la parte ocupada) -----
+
+    @property
+    def dias(self):
+        """np.ndarray[int32]: Día de cada logro como ordinal de fecha."""
+        return self._dias[:self.n]
+
+    @property
+    def categorias(self):
+        """np.ndarray[int16]: Código de categoría de cada logro."""
+        return self._categorias[:self.n]
+
+    @property
+    def minutos(self):
+        """np.ndarray[int16]: Minuto del día (0-1439) de cada logro."""
+        return self._minutos[:self.n]
+
+    # ----- Construcción -----
+
+    @classmethod
+    def desde_logros(cls, logros):
+        """
+        Construye un almacén a partir de una colección de logros.
+
+        Args:
+            logros (Iterable[Logro]): Logros a incorporar
+
+        Returns:
+            LogroStore: Almacén con todos los logros
+        """
+        store = cls()
+        for logro in logros:
+            store.agregar(logro)
+        return store
+
+    def codigo_categoria(self, categoria):
+        """
+        Retorna el código de una categoría, registrándola si es nueva.
+
+        Args:
+            categoria (str): Nombre de la categoría
+
+        Returns:
+            int: Código de la categoría
+        """
+        codigo = self._codigos_categoria.get(categoria)
+        if codigo is None:
+            codigo = len(self.nombres_categorias)
+            self.nombres_categorias.append(categoria)
+            self._codigos_categoria[categoria] = codigo
+        return codigo
+
+    def _asegurar_capacidad(self, requerida):
+        """Duplica la capacidad de los arreglos hasta alcanzar la requerida."""
+        capacidad = len(self._dias)
+        if requerida <= capacidad:
+            return
+
+        while capacidad < requerida:
+            capacidad *= 2
+        self._dias = np.resize(self._dias, capacidad)
+        self._categorias = np.resize(self._categorias, capacidad)
+        self._minutos = np.resize(self._minutos, capacidad)
+
+    def agregar(self, logro):
+        """
+        Agrega un logro al final del almacén (O(1) amortizado).
+
+        Args:
+            logro (Logro): Logro a agregar
+        """
+        self._asegurar_capacidad(self.n + 1)
+
+        self._dias[self.n] = logro.dia
+        self._categorias[self.n] = self.codigo_categoria(logro.categoria)
+        self._minutos[self.n] = logro.minuto % MINUTOS_POR_DIA
+        self.descripciones.append(logro.descripcion)
+        self.n += 1
+        self.version += 1
+
+    # ----- Materialización -----
+
+    def _crear_logro(self, i):
+        """Reconstruye el Logro de la posición i."""
+        minuto = (int(self._dias[i]) - EPOCA) * MINUTOS_POR_DIA + int(self._minutos[i])
+        return Logro(self.descripciones[i], self.nombres_categorias[self._categorias[i]], minuto)
+
+    def obtener_todos(self):
+        """
+        Returns:
+            list[Logro]: Todos los logros, en orden de registro
+        """
+        return [self._crear_logro(i) for i in range(self.n)]
+
+    def obtener_ultimos(self, n):
+        """
+        Args:
+            n (int): Cantidad de logros a retornar
+
+        Returns:
+            list[Logro]: Últimos N logros, en orden de registro
+        """
+        return [self._crear_logro(i) for i in range(max(0, self.n - n), self.n)]
+
+    # ----- Consultas agregadas (vectorizadas) -----
+
+    def contar_total(self):
+        """
+        Returns:
+            int: Cantidad total de logros
+        """
+        return self.n
+
+    def _mascara_rango(self, desde, hasta):
+        """Máscara booleana de los logros entre dos fechas (inclusive)."""
+        mascara = np.ones(self.n, dtype=bool)
+        if desde is not None:
+            mascara &= self.dias >= date.fromisoformat(desde).toordinal()
+        if hasta is not None:
+            mascara &= self.dias <= date.fromisoformat(hasta).toordinal()
+        return mascara
+
+    def contar_en_rango(self, desde=None, hasta=None):
+        """
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD, inclusive) o None
+            hasta (str): Última fecha (YYYY-MM-DD, inclusive) o None
+
+        Returns:
+            int: Cantidad de logros en el rango
+        """
+        return int(np.count_nonzero(self._mascara_rango(desde, hasta)))
+
+    def obtener_en_rango(self, desde=None, hasta=None):
+        """
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD, inclusive) o None
+            hasta (str): Última fecha (YYYY-MM-DD, inclusive) o None
+
+        Returns:
+            list[Logro]: Logros del rango, ordenados por fecha y hora
+        """
+        posiciones = np.flatnonzero(self._mascara_rango(desde, hasta))
+        orden = np.lexsort((self.minutos[posiciones], self.dias[posiciones]))
+        return [self._crear_logro(int(i)) for i in posiciones[orden]]
+
+    def logros_por_dia_en_rango(self, desde=None, hasta=None):
+        """
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD, inclusive) o None
+            hasta (str): Última fecha (YYYY-MM-DD, inclusive) o None
+
+        Returns:
+            dict: {fecha: cantidad} de los días con logros en el rango
+        """
+        dias, conteos = np.unique(self.dias[self._mascara_rango(desde, hasta)], return_counts=True)
+        return {
+            date.fromordinal(int(dia)).isoformat(): int(cantidad)
+            for dia, cantidad in zip(dias, conteos)
+        }
+
+    def contar_por_categoria(self):
+        """
+        Returns:
+            dict: {categoria: cantidad}
+        """
+        conteos = np.bincount(self.categorias, minlength=len(self.nombres_categorias))
+        return {
+            nombre: int(cantidad)
+            for nombre, cantidad in zip(self.nombres_categorias, conteos)
+            if cantidad > 0
+        }
+
+    def logros_por_dia(self):
+        """
+        Returns:
+            dict: {fecha: cantidad}
+        """
+        dias, conteos = np.unique(self.dias, return_counts=True)
+        return {
+            date.fromordinal(int(dia)).isoformat(): int(cantidad)
+            for dia, cantidad in zip(dias, conteos)
+        }
+
+    def dias_unicos(self):
+        """
+        Returns:
+            np.ndarray[int32]: Ordinales de los días con logros, ordenados
+        """
+        if self.n == 0:
+            return np.empty(0, dtype=np.int32)
+        # Conteo por día en O(n + días del historial), sin ordenar los n logros
+        primero = int(self.dias.min())
+        return (np.flatnonzero(np.bincount(self.dias - primero)) + primero).astype(np.int32)
+
+    def intervalos_racha(self):
+        """
+        Rachas de días consecutivos, calculadas sobre los días únicos:
+        una racha se corta donde la diferencia entre días seguidos no es 1.
+
+        Returns:
+            tuple: (inicios, fines) como listas de ordinales, en orden
+        """
+        dias = self.dias_unicos()
+        if len(dias) == 0:
+            return [], []
+        cortes = np.flatnonzero(np.diff(dias) != 1) + 1
+        inicios = dias[np.concatenate(([0], cortes))]
+        fines = dias[np.concatenate((cortes - 1, [len(dias) - 1]))]
+        return inicios.tolist(), fines.tolist()
+
+
+# ===== PRUEBA DE LA CLASE (Eliminar después) =====
+if __name__ == "__main__":
+    from gestor_logros import GestorLogros
+    from estadisticas import Estadisticas
+
+    gestor = GestorLogros()
+    store = LogroStore.desde_logros(gestor.obtener_todos())
+
+    stats = Estadisticas(fuente=store)
+    print(f"Total: {store.contar_total()}")
+    print(f"Por categoría: {stats.contar_por_categoria()}")
+    print(f"Por día: {stats.logros_por_dia()}")
+    print(f"Racha actual: {stats.calcular_racha()} días")
@@ -0,0 +1,187 @@
+import mmap
+import os
+from datetime import date
+import numpy as np
+from almacenamiento import BackendAlmacenamiento
+from indice_fechas import limites_en_minutos
+from logro import Logro, EPOCA, MINUTOS_POR_DIA
+from snapshot_binario import REGISTRO, leer_cabecera
+
+# Vista NumPy de un registro del snapshot (mismo layout que REGISTRO)
+DTYPE_REGISTRO = np.dtype([
+    ('minuto', '<i4'),
+    ('categoria', '<u2'),
+    ('inicio', '<u4'),
+    ('largo', '<u4'),
+])
+assert DTYPE_REGISTRO.itemsize == REGISTRO.size
+
+
+class BackendMapeado(BackendAlmacenamiento):
+    """
+    Backend de solo lectura sobre un snapshot binario mapeado en memoria.
+
+    Los registros se exponen como vistas NumPy sobre el mapa (sin
+    copiar), así que los conteos, rangos y distribuciones se resuelven
+    vectorizados sin construir objetos Logro. Varios procesos que leen
+    el mismo archivo comparten las páginas del caché del sistema.
+
+    Los Logro solo se crean para las consultas que retornan logros
+    (rangos, últimos N, historial completo).
+    """
+
+    def __init__(self, archivo):
+        """
+        Args:
+            archivo (str): Ruta del snapshot binario (.dwb)
+        """
+        self.archivo = archivo
+        self._mapa = None
+        self._vaciar()
+
+    def _vaciar(self):
+        """Deja el backend sin datos (y sin vistas sobre el mapa)."""
+        self.categorias_nombres = []
+        self.registros = np.empty(0, dtype=DTYPE_REGISTRO)
+        self._inicio_heap = 0
+        self._ordenado = True
+
+    # ----- Columnas (vistas sin copia) -----
+
+    @property
+    def minutos(self):
+        """np.ndarray[int32]: Minutos desde la época de cada logro."""
+        return self.registros['minuto']
+
+    @property
+    def categorias(self):
+        """np.ndarray[uint16]: Código de categoría de cada logro."""
+        return self.registros['categoria']
+
+    # ----- Ciclo de vida -----
+
+    def cargar(self):
+        self.cerrar()
+        if not os.path.exists(self.archivo):
+            return False
+
+        try:
+            with open(self.archivo, 'rb') as f:
+                self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+            nombres, cantidad, inicio_registros, inicio_heap = leer_cabecera(self._mapa)
+            self.categorias_nombres = nombres
+            self.registros = np.frombuffer(
+                self._mapa, dtype=DTYPE_REGISTRO, count=cantidad, offset=inicio_registros
+            )
+            self._inicio_heap = inicio_heap
+
+            # Si los minutos están ordenados, los rangos usan búsqueda binaria
+            self._ordenado = bool(np.all(self.minutos[1:] >= self.minutos[:-1]))
+            return True
+        except Exception as e:
+            print(f"Error al cargar: {e}")
+            self.cerrar()
+            return False
+
+    def cerrar(self):
+        # Las vistas deben soltarse antes de cerrar el mapa
+        self._vaciar()
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+
+    def agregar(self, logro):
+        raise PermissionError("El modo mapeado es de solo lectura")
+
+    def agregar_lote(self, logros):
+        raise PermissionError("El modo mapeado es de solo lectura")
+
+    def guardar(self):
+        # No hay cambios que persistir
+        return True
+
+    # ----- Materialización -----
+
+    def _crear_logro(self, i):
+        """Construye el Logro de la posición i leyendo su descripción del heap."""
+        minuto, codigo, inicio, largo = self.registros[i]
+        inicio = self._inicio_heap + int(inicio)
+        descripcion = self._mapa[inicio:inicio + int(largo)].decode('utf-8')
+        return Logro(descripcion, self.categorias_nombres[codigo], int(minuto))
+
+    def iterar_logros(self):
+        for i in range(len(self.registros)):
+            yield self._crear_logro(i)
+
+    def obtener_todos(self):
+        return list(self.iterar_logros())
+
+    def obtener_ultimos(self, n):
+        total = len(self.registros)
+        return [self._crear_logro(i) for i in range(max(0, total - n), total)]
+
+    # ----- Consultas agregadas (vectorizadas, sin copiar registros) -----
+
+    def contar_total(self):
+        return len(self.registros)
+
+    def _posiciones_en_rango(self, desde, hasta):
+        """
+        Posiciones de los logros del rango: un slice si los minutos
+        están ordenados (búsqueda binaria), si no un arreglo de índices.
+        """
+        inicio, fin = limites_en_minutos(desde, hasta)
+        if self._ordenado:
+            i = 0 if inicio is None else int(np.searchsorted(self.minutos, inicio, 'left'))
+            j = len(self.registros) if fin is None else int(np.searchsorted(self.minutos, fin, 'left'))
+            return slice(i, max(i, j))
+
+        mascara = np.ones(len(self.registros), dtype=bool)
+        if inicio is not None:
+            mascara &= self.minutos >= inicio
+        if fin is not None:
+            mascara &= self.minutos < fin
+        return np.flatnonzero(mascara)
+
+    def contar_en_rango(self, desde=None, hasta=None):
+        return len(self.minutos[self._posiciones_en_rango(desde, hasta)])
+
+    def obtener_en_rango(self, desde=None, hasta=None):
+        posiciones = np.arange(len(self.registros))[self._posiciones_en_rango(desde, hasta)]
+        orden = np.argsort(self.minutos[posiciones], kind='stable')
+        return [self._crear_logro(int(i)) for i in posiciones[orden]]
+
+    def _por_dia(self, minutos):
+        """Agrupa minutos por día y retorna {fecha: cantidad}."""
+        dias, conteos = np.unique(minutos // MINUTOS_POR_DIA, return_counts=True)
+        return {
+            date.fromordinal(int(dia) + EPOCA).isoformat(): int(cantidad)
+            for dia, cantidad in zip(dias, conteos)
+        }
+
+    def logros_por_dia_en_rango(self, desde=None, hasta=None):
+        return self._por_dia(self.minutos[self._posiciones_en_rango(desde, hasta)])
+
+    def contar_por_categoria(self):
+        conteos = np.bincount(self.categorias, minlength=len(self.categorias_nombres))
+        return {
+            nombre: int(cantidad)
+            for nombre, cantidad in zip(self.categorias_nombres, conteos)
+            if cantidad > 0
+        }
+
+    def logros_por_dia(self):
+        return self._por_dia(self.minutos)
+
+
+# ===== PRUEBA DE LA CLASE (Eliminar después) =====
+if __name__ == "__main__":
+    from gestor_logros import GestorLogros
+    from estadisticas import Estadisticas
+
+    # Requiere un snapshot: GestorLogros(modo="binario") lo genera
+    gestor = GestorLogros(modo="mapeado")
+    print(Estadisticas(fuente=gestor).generar_reporte())
+    print(f"Desde 2026-02-01: {gestor.contar_en_rango('2026-02-01')}")
+    gestor.cerrar()
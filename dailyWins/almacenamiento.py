@@ -0,0 +1,1392 @@
+import atexit
+import heapq
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter, deque
+from logro import Logro, minuto_desde
+from indice_fechas import IndiceFechas, limites_en_minutos
+from snapshot_binario import escribir_snapshot, leer_snapshot
+from escritura_atomica import archivo_atomico
+
+TAMANO_BLOQUE = 1 << 16  # Caracteres leídos por vez al parsear en streaming
+
+# Criterios de orden de obtener_pagina (a igual valor, por fecha y hora)
+CLAVES_ORDEN = {
+    "fecha": lambda logro: logro.minuto,
+    "categoria": lambda logro: (logro.categoria, logro.minuto),
+    "descripcion": lambda logro: (logro.descripcion.casefold(), logro.minuto),
+}
+
+
+def _cortar_pagina(vista, inicio, cantidad, descendente):
+    """
+    Recorta una página de una lista ya ordenada de forma ascendente.
+
+    Args:
+        vista (list[Logro]): Logros ordenados de menor a mayor
+        inicio (int): Posición del primer logro de la página
+        cantidad (int): Tamaño de la página
+        descendente (bool): True para paginar desde el final
+
+    Returns:
+        list[Logro]: Logros de la página
+    """
+    if descendente:
+        fin = max(0, len(vista) - inicio)
+        return vista[max(0, fin - cantidad):fin][::-1]
+    return vista[inicio:inicio + cantidad]
+
+
+def crear_logro(item):
+    """
+    Reconstruye un Logro desde su diccionario serializado.
+
+    Args:
+        item (dict): Diccionario con descripcion, categoria, fecha y hora
+
+    Returns:
+        Logro: Logro con su fecha y hora originales
+    """
+    return Logro.desde_dict(item)
+
+
+def iterar_json(archivo, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Recorre un arreglo JSON de registros sin cargarlo completo.
+    Lee el archivo por bloques y decodifica un elemento a la vez, por lo
+    que la memoria usada no depende del tamaño del historial.
+
+    Args:
+        archivo (str): Ruta del archivo con un arreglo JSON
+        tamano_bloque (int): Caracteres leídos por vez
+
+    Yields:
+        dict: Cada elemento del arreglo
+
+    Raises:
+        ValueError: Si el archivo no contiene un arreglo JSON válido
+    """
+    decodificador = json.JSONDecoder()
+
+    with open(archivo, 'r', encoding='utf-8') as f:
+        buffer = f.read(tamano_bloque)
+        fin_archivo = not buffer
+        pos = 0
+        en_arreglo = False
+
+        while True:
+            # Saltar espacios y separadores
+            while pos < len(buffer) and (buffer[pos].isspace() or (en_arreglo and buffer[pos] == ',')):
+                pos += 1
+
+            if pos >= len(buffer):
+                if fin_archivo:
+                    raise ValueError("Arreglo JSON incompleto")
+                buffer = f.read(tamano_bloque)
+                fin_archivo = not buffer
+                pos = 0
+                continue
+
+            if not en_arreglo:
+                if buffer[pos] != '[':
+                    raise ValueError("Se esperaba un arreglo JSON")
+                en_arreglo = True
+                pos += 1
+                continue
+
+            if buffer[pos] == ']':
+                return
+
+            try:
+                item, pos = decodificador.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if fin_archivo:
+                    raise
+                # Elemento cortado por el bloque: leer más y reintentar
+                bloque = f.read(tamano_bloque)
+                fin_archivo = not bloque
+                buffer = buffer[pos:] + bloque
+                pos = 0
+                continue
+
+            yield item
+
+
+class BackendAlmacenamiento:
+    """
+    Interfaz común de los backends de almacenamiento de GestorLogros.
+    Cada backend decide cómo persistir los logros y cómo responder
+    las consultas agregadas.
+    """
+
+    def cargar(self):
+        """
+        Prepara el backend para su uso (lee archivos, abre conexiones).
+
+        Returns:
+            bool: True si se cargó exitosamente
+        """
+        raise NotImplementedError
+
+    def agregar(self, logro):
+        """
+        Persiste un logro nuevo.
+
+        Args:
+            logro (Logro): Logro a agregar
+
+        Returns:
+            bool: True si se guardó exitosamente
+        """
+        raise NotImplementedError
+
+    def agregar_lote(self, logros):
+        """
+        Persiste varios logros nuevos con una única escritura.
+
+        Args:
+            logros (list[Logro]): Logros a agregar
+
+        Returns:
+            bool: True si se guardaron exitosamente
+        """
+        raise NotImplementedError
+
+    def guardar(self):
+        """
+        Persiste el estado completo del backend.
+
+        Returns:
+            bool: True si se guardó exitosamente
+        """
+        raise NotImplementedError
+
+    def iterar_logros(self):
+        """
+        Recorre los logros en orden de registro sin materializar la
+        lista completa cuando el backend no la tiene en memoria.
+
+        Yields:
+            Logro: Cada logro registrado
+        """
+        yield from self.obtener_todos()
+
+    def obtener_todos(self):
+        """
+        Returns:
+            list[Logro]: Lista completa de logros, en orden de registro
+        """
+        raise NotImplementedError
+
+    def obtener_ultimos(self, n):
+        """
+        Args:
+            n (int): Cantidad de logros a retornar
+
+        Returns:
+            list[Logro]: Últimos N logros, en orden de registro
+        """
+        raise NotImplementedError
+
+    def contar_total(self):
+        """
+        Returns:
+            int: Cantidad total de logros
+        """
+        raise NotImplementedError
+
+    def contar_en_rango(self, desde=None, hasta=None):
+        """
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD, inclusive) o None
+            hasta (str): Última fecha (YYYY-MM-DD, inclusive) o None
+
+        Returns:
+            int: Cantidad de logros en el rango
+        """
+        raise NotImplementedError
+
+    def obtener_en_rango(self, desde=None, hasta=None):
+        """
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD, inclusive) o None
+            hasta (str): Última fecha (YYYY-MM-DD, inclusive) o None
+
+        Returns:
+            list[Logro]: Logros del rango, ordenados por fecha y hora
+        """
+        raise NotImplementedError
+
+    def logros_por_dia_en_rango(self, desde=None, hasta=None):
+        """
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD, inclusive) o None
+            hasta (str): Última fecha (YYYY-MM-DD, inclusive) o None
+
+        Returns:
+            dict: {fecha: cantidad} para los días con logros en el rango
+        """
+        raise NotImplementedError
+
+    def obtener_pagina(self, inicio, cantidad, categoria=None, orden="fecha", descendente=True):
+        """
+        Obtiene una página de logros filtrados y ordenados.
+        Por defecto recorre el almacenamiento en streaming conservando
+        solo los primeros inicio + cantidad logros (heap), sin cargarlo.
+
+        Args:
+            inicio (int): Posición del primer logro de la página
+            cantidad (int): Tamaño de la página
+            categoria (str): Solo logros de esta categoría; None = todas
+            orden (str): "fecha", "categoria" o "descripcion"
+            descendente (bool): True para ordenar de mayor a menor
+
+        Returns:
+            list[Logro]: Logros de la página
+        """
+        clave = CLAVES_ORDEN[orden]
+        logros = (
+            logro for logro in self.iterar_logros()
+            if categoria is None or logro.categoria == categoria
+        )
+        seleccion = heapq.nlargest if descendente else heapq.nsmallest
+        return seleccion(inicio + cantidad, logros, key=clave)[inicio:]
+
+    def contar_por_categoria(self):
+        """
+        Returns:
+            dict: {categoria: cantidad}
+        """
+        raise NotImplementedError
+
+    def logros_por_dia(self):
+        """
+        Returns:
+            dict: {fecha: cantidad}
+        """
+        raise NotImplementedError
+
+    def cerrar(self):
+        """Libera los recursos del backend (conexiones, archivos)."""
+        pass
+
+
+class BackendMemoria(BackendAlmacenamiento):
+    """
+    Base para backends que mantienen el historial completo en memoria
+    y responden las consultas recorriendo la lista.
+
+    La lista se carga la primera vez que se usa. Mientras no esté
+    cargada, las consultas agregadas recorren el almacenamiento en
+    streaming (ver iterar_logros) sin retener los logros.
+
+    Las consultas por rango de fechas usan un IndiceFechas que se
+    construye en la primera consulta y luego se mantiene con cada alta.
+    """
+
+    def __init__(self):
+        self._logros = None
+        self._indice = None
+        self._vistas = {}  # {(categoria, orden): logros ordenados} para paginar
+
+    @property
+    def logros(self):
+        """list[Logro]: Historial en memoria (se carga al primer uso)."""
+        if self._logros is None:
+            self._logros = []
+            self.cargar()
+        return self._logros
+
+    @logros.setter
+    def logros(self, logros):
+        self._logros = logros
+        self._indice = None  # Se reconstruye en la próxima consulta
+        self._vistas = {}
+
+    @property
+    def indice(self):
+        """IndiceFechas: Índice ordenado por fecha (se construye al primer uso)."""
+        if self._indice is None:
+            self._indice = IndiceFechas(self.logros)
+        return self._indice
+
+    def _incorporar(self, logros):
+        """
+        Agrega logros a la lista en memoria y al índice, si existe.
+
+        Args:
+            logros (list[Logro]): Logros nuevos
+        """
+        self.logros.extend(logros)
+        self._vistas = {}
+        if self._indice is not None:
+            for logro in logros:
+                self._indice.agregar(logro)
+
+    @property
+    def cargado(self):
+        """bool: True si el historial ya está en memoria."""
+        return self._logros is not None
+
+    def cargar(self):
+        return True
+
+    def _iterar_almacenamiento(self):
+        """
+        Recorre los logros persistidos sin cargarlos en memoria.
+
+        Yields:
+            Logro: Cada logro persistido
+        """
+        return iter(())
+
+    def iterar_logros(self):
+        if self.cargado:
+            return iter(self._logros)
+        return self._iterar_almacenamiento()
+
+    def agregar(self, logro):
+        self._incorporar([logro])
+        return True
+
+    def agregar_lote(self, logros):
+        self._incorporar(logros)
+        return True
+
+    def obtener_todos(self):
+        return self.logros
+
+    def obtener_ultimos(self, n):
+        if not self.cargado:
+            return list(deque(self.iterar_logros(), maxlen=n))
+        return self.logros[-n:] if len(self.logros) >= n else self.logros
+
+    def contar_total(self):
+        if not self.cargado:
+            return sum(1 for _ in self.iterar_logros())
+        return len(self.logros)
+
+    def _filtrar_en_rango(self, desde, hasta):
+        """Recorre en streaming los logros del rango (sin índice)."""
+        inicio, fin = limites_en_minutos(desde, hasta)
+        for logro in self.iterar_logros():
+            if (inicio is None or logro.minuto >= inicio) and (fin is None or logro.minuto < fin):
+                yield logro
+
+    def contar_en_rango(self, desde=None, hasta=None):
+        if not self.cargado:
+            return sum(1 for _ in self._filtrar_en_rango(desde, hasta))
+        return self.indice.contar_en_rango(desde, hasta)
+
+    def obtener_en_rango(self, desde=None, hasta=None):
+        if not self.cargado:
+            return sorted(self._filtrar_en_rango(desde, hasta), key=lambda logro: logro.minuto)
+        return self.indice.obtener_en_rango(desde, hasta)
+
+    def logros_por_dia_en_rango(self, desde=None, hasta=None):
+        if not self.cargado:
+            logros = self._filtrar_en_rango(desde, hasta)
+        else:
+            logros = self.indice.obtener_en_rango(desde, hasta)
+        return dict(Counter(logro.fecha for logro in logros))
+
+    def obtener_pagina(self, inicio, cantidad, categoria=None, orden="fecha", descendente=True):
+        if not self.cargado:
+            return super().obtener_pagina(inicio, cantidad, categoria, orden, descendente)
+
+        # El orden por fecha sin filtro es el del índice; los demás se
+        # ordenan una vez y se reutilizan hasta el próximo alta
+        if orden == "fecha" and categoria is None:
+            vista = self.indice.logros
+        else:
+            vista = self._vistas.get((categoria, orden))
+            if vista is None:
+                vista = sorted(
+                    (logro for logro in self.logros if categoria is None or logro.categoria == categoria),
+                    key=CLAVES_ORDEN[orden]
+                )
+                self._vistas[(categoria, orden)] = vista
+
+        return _cortar_pagina(vista, inicio, cantidad, descendente)
+
+    def contar_por_categoria(self):
+        return dict(Counter(logro.categoria for logro in self.iterar_logros()))
+
+    def logros_por_dia(self):
+        return dict(Counter(logro.fecha for logro in self.iterar_logros()))
+
+
+class BackendJSON(BackendMemoria):
+    """
+    Guarda el historial completo en un único archivo JSON,
+    reescribiéndolo en cada alta (de forma atómica: ver archivo_atomico).
+    """
+
+    def __init__(self, archivo):
+        """
+        Args:
+            archivo (str): Ruta del archivo JSON
+        """
+        super().__init__()
+        self.archivo = archivo
+
+    def agregar(self, logro):
+        self._incorporar([logro])
+        return self.guardar()  # Guardar automáticamente
+
+    def agregar_lote(self, logros):
+        self._incorporar(logros)
+        return self.guardar()  # Una sola reescritura para todo el lote
+
+    def guardar(self):
+        return self._escribir(self.logros)
+
+    def _escribir(self, logros):
+        """
+        Persiste el historial indicado reemplazando el archivo.
+
+        Args:
+            logros (list[Logro]): Historial completo a escribir
+
+        Returns:
+            bool: True si se guardó exitosamente
+        """
+        try:
+            datos = [logro.to_dict() for logro in logros]
+            with archivo_atomico(self.archivo) as f:
+                json.dump(datos, f, ensure_ascii=False, indent=2)
+            return True
+        except Exception as e:
+            print(f"Error al guardar: {e}")
+            return False
+
+    def _existe_almacenamiento(self):
+        """bool: True si hay algo persistido para cargar."""
+        return os.path.exists(self.archivo)
+
+    def cargar(self):
+        if not self._existe_almacenamiento():
+            if not self.cargado:
+                self._logros = []
+            return False
+
+        try:
+            # Reconstruir objetos Logro a medida que se parsean
+            self.logros = list(self._iterar_almacenamiento())
+            return True
+        except Exception as e:
+            print(f"Error al cargar: {e}")
+            if not self.cargado:
+                self._logros = []
+            return False
+
+    def _iterar_almacenamiento(self):
+        if os.path.exists(self.archivo):
+            for item in iterar_json(self.archivo):
+                yield crear_logro(item)
+
+
+class BackendJournal(BackendJSON):
+    """
+    Snapshot JSON más un journal append-only (una línea JSON por logro).
+    Cada alta solo escribe su propia línea; compactar() integra el
+    journal en el snapshot.
+
+    La primera línea del journal es una cabecera {"base": N} con la
+    cantidad de logros que tenía el snapshot cuando se empezó el
+    journal. Si al cargar el snapshot tiene más logros que esa base, es
+    que una compactación lo reemplazó pero se cortó antes de reiniciar
+    el journal: las primeras líneas ya están en el snapshot y se saltean.
+    """
+
+    def __init__(self, archivo):
+        """
+        Args:
+            archivo (str): Ruta del snapshot JSON; el journal se guarda
+                junto a él con extensión .journal.jsonl
+        """
+        super().__init__(archivo)
+        self.archivo_journal = os.path.splitext(archivo)[0] + ".journal.jsonl"
+        self._journal_revisado = False  # Se revisa el final una vez antes de agregar
+
+    def agregar(self, logro):
+        """
+        Agrega un logro al final del journal.
+
+        El costo no depende del tamaño del historial: solo se escribe
+        la línea nueva. Si el historial no está en memoria, no se carga.
+        """
+        if self.cargado:
+            self._incorporar([logro])
+        try:
+            linea = json.dumps(logro.to_dict(), ensure_ascii=False)
+            with self._abrir_journal(1) as f:
+                f.write(linea + "\n")
+            return True
+        except Exception as e:
+            print(f"Error al escribir journal: {e}")
+            return False
+
+    def agregar_lote(self, logros):
+        """Agrega todas las líneas del lote al journal en una sola apertura."""
+        if self.cargado:
+            self._incorporar(logros)
+        try:
+            with self._abrir_journal(len(logros)) as f:
+                f.writelines(
+                    json.dumps(logro.to_dict(), ensure_ascii=False) + "\n"
+                    for logro in logros
+                )
+            return True
+        except Exception as e:
+            print(f"Error al escribir journal: {e}")
+            return False
+
+    @staticmethod
+    def _cabecera(base):
+        """Línea inicial del journal: logros del snapshot al empezarlo."""
+        return json.dumps({"base": base}) + "\n"
+
+    def _abrir_journal(self, nuevos):
+        """
+        Abre el journal para agregar líneas; si no existe (o quedó
+        vacío), lo crea con su cabecera.
+
+        Args:
+            nuevos (int): Logros del alta ya incorporados a la memoria
+
+        Returns:
+            file: Journal abierto en modo append
+        """
+        if not self._journal_revisado:
+            self._descartar_linea_incompleta()
+            self._journal_revisado = True
+        if os.path.exists(self.archivo_journal) and os.path.getsize(self.archivo_journal) > 0:
+            return open(self.archivo_journal, 'a', encoding='utf-8')
+
+        if self.cargado:
+            base = len(self._logros) - nuevos
+        elif os.path.exists(self.archivo):
+            base = sum(1 for _ in iterar_json(self.archivo))  # Solo sin journal previo
+        else:
+            base = 0
+        f = open(self.archivo_journal, 'a', encoding='utf-8')
+        f.write(self._cabecera(base))
+        return f
+
+    def _descartar_linea_incompleta(self):
+        """
+        Recorta el journal hasta su último salto de línea. Un corte a
+        mitad de una escritura deja una línea sin terminar (nunca
+        confirmada); si no se quita, la próxima línea se pegaría a ella
+        y ambas se descartarían al cargar.
+        """
+        if not os.path.exists(self.archivo_journal):
+            return
+
+        with open(self.archivo_journal, 'rb+') as f:
+            fin = f.seek(0, os.SEEK_END)
+            if fin == 0:
+                return
+            f.seek(fin - 1)
+            if f.read(1) == b"\n":
+                return
+
+            # Buscar hacia atrás, por bloques, el último salto de línea
+            posicion = fin
+            while posicion > 0:
+                inicio = max(0, posicion - TAMANO_BLOQUE)
+                f.seek(inicio)
+                salto = f.read(posicion - inicio).rfind(b"\n")
+                if salto != -1:
+                    f.truncate(inicio + salto + 1)
+                    return
+                posicion = inicio
+            f.truncate(0)  # Ni la cabecera llegó a escribirse completa
+
+    def _escribir(self, logros):
+        """
+        Escribe el snapshot completo y reinicia el journal (solo con su
+        cabecera), ya que el snapshot pasa a contener todo el historial.
+        El snapshot se reemplaza primero: un corte entre ambos pasos
+        deja un journal cuyas líneas se saltean al cargar.
+        """
+        if not super()._escribir(logros):
+            return False
+
+        try:
+            with archivo_atomico(self.archivo_journal) as f:
+                f.write(self._cabecera(len(logros)))
+            return True
+        except Exception as e:
+            print(f"Error al vaciar journal: {e}")
+            return False
+
+    def compactar(self):
+        """
+        Integra el journal en el snapshot JSON y lo vacía.
+
+        Returns:
+            bool: True si se compactó exitosamente
+        """
+        return self.guardar()
+
+    def _existe_almacenamiento(self):
+        return os.path.exists(self.archivo) or os.path.exists(self.archivo_journal)
+
+    def _iterar_journal(self, en_snapshot=0):
+        """
+        Recorre los logros registrados en el journal.
+
+        Las líneas incompletas o corruptas (por ejemplo, tras un corte
+        durante la escritura) se descartan, igual que las que el
+        snapshot ya contiene según la cabecera.
+
+        Args:
+            en_snapshot (int): Logros leídos del snapshot
+
+        Yields:
+            Logro: Cada logro del journal, en orden de registro
+        """
+        if not os.path.exists(self.archivo_journal):
+            return
+
+        saltar = 0
+        with open(self.archivo_journal, 'r', encoding='utf-8') as f:
+            for linea in f:
+                linea = linea.strip()
+                if not linea:
+                    continue
+                try:
+                    item = json.loads(linea)
+                except json.JSONDecodeError:
+                    continue
+                if "base" in item:
+                    saltar = max(0, en_snapshot - item["base"])  # Ya compactadas
+                    continue
+                if saltar:
+                    saltar -= 1
+                    continue
+                yield crear_logro(item)
+
+    def _iterar_almacenamiento(self):
+        """Recorre el snapshot y luego reproduce el journal."""
+        en_snapshot = 0
+        for logro in super()._iterar_almacenamiento():
+            en_snapshot += 1
+            yield logro
+        yield from self._iterar_journal(en_snapshot)
+
+
+class BackendBinario(BackendJSON):
+    """
+    Guarda el historial completo como snapshot binario (ver
+    snapshot_binario.py): registros de ancho fijo más un heap con las
+    descripciones. Cargarlo no requiere parsear texto, por lo que el
+    inicio es mucho más rápido que con el JSON indentado.
+
+    Si todavía no existe el snapshot pero sí el JSON, se carga el JSON
+    y se escribe el snapshot. El JSON sigue disponible como exportación
+    (ver exportador.exportar_json).
+    """
+
+    def __init__(self, archivo, archivo_legado=None):
+        """
+        Args:
+            archivo (str): Ruta del snapshot binario
+            archivo_legado (str): logros.json a migrar si no hay snapshot
+        """
+        super().__init__(archivo)
+        self.archivo_legado = archivo_legado
+
+    def _escribir(self, logros):
+        try:
+            escribir_snapshot(logros, self.archivo)
+            return True
+        except Exception as e:
+            print(f"Error al guardar: {e}")
+            return False
+
+    def _migrando(self):
+        """bool: True si hay que leer el JSON legado en lugar del snapshot."""
+        return (not os.path.exists(self.archivo) and self.archivo_legado is not None
+                and os.path.exists(self.archivo_legado))
+
+    def _existe_almacenamiento(self):
+        return os.path.exists(self.archivo) or self._migrando()
+
+    def cargar(self):
+        migrando = self._migrando()
+        cargado = super().cargar()
+        if cargado and migrando:
+            return self.guardar()
+        return cargado
+
+    def _iterar_almacenamiento(self):
+        if self._migrando():
+            for item in iterar_json(self.archivo_legado):
+                yield crear_logro(item)
+        elif os.path.exists(self.archivo):
+            yield from leer_snapshot(self.archivo)
+
+
+class BackendSQLite(BackendAlmacenamiento):
+    """
+    Guarda los logros en una base SQLite con índices sobre fecha y
+    categoría. Nada se carga en memoria al iniciar: cada consulta se
+    resuelve en la base.
+    """
+
+    def __init__(self, archivo, archivo_legado=None):
+        """
+        Args:
+            archivo (str): Ruta de la base de datos SQLite
+            archivo_legado (str): logros.json a importar la primera vez,
+                cuando la tabla está vacía (opcional)
+        """
+        self.archivo = archivo
+        self.archivo_legado = archivo_legado
+        self._conexion = None
+
+    @property
+    def conexion(self):
+        """sqlite3.Connection: Conexión a la base (se abre al primer uso)."""
+        if self._conexion is None:
+            self.cargar()
+        return self._conexion
+
+    def cargar(self):
+        try:
+            self._conexion = sqlite3.connect(self.archivo)
+            self._conexion.executescript("""
+                CREATE TABLE IF NOT EXISTS logros (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    descripcion TEXT NOT NULL,
+                    categoria TEXT NOT NULL,
+                    fecha TEXT NOT NULL,
+                    hora TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_logros_fecha ON logros(fecha);
+                CREATE INDEX IF NOT EXISTS idx_logros_categoria ON logros(categoria);
+            """)
+            if self.archivo_legado and os.path.exists(self.archivo_legado):
+                self._migrar_legado()
+            return True
+        except Exception as e:
+            print(f"Error al cargar: {e}")
+            return False
+
+    def _migrar_legado(self):
+        """Importa un logros.json existente si la tabla todavía está vacía."""
+        if self._conexion.execute("SELECT 1 FROM logros LIMIT 1").fetchone() is not None:
+            return
+        with self._conexion:  # Una única transacción: se migra todo o nada
+            self._conexion.executemany(
+                "INSERT INTO logros (descripcion, categoria, fecha, hora) VALUES (?, ?, ?, ?)",
+                ((l.descripcion, l.categoria, l.fecha, l.hora)
+                 for l in map(crear_logro, iterar_json(self.archivo_legado)))
+            )
+
+    def agregar(self, logro):
+        try:
+            with self.conexion:
+                self.conexion.execute(
+                    "INSERT INTO logros (descripcion, categoria, fecha, hora) "
+                    "VALUES (?, ?, ?, ?)",
+                    (logro.descripcion, logro.categoria, logro.fecha, logro.hora)
+                )
+            return True
+        except Exception as e:
+            print(f"Error al guardar: {e}")
+            return False
+
+    def agregar_lote(self, logros):
+        try:
+            with self.conexion:  # Una única transacción para todo el lote
+                self.conexion.executemany(
+                    "INSERT INTO logros (descripcion, categoria, fecha, hora) "
+                    "VALUES (?, ?, ?, ?)",
+                    ((l.descripcion, l.categoria, l.fecha, l.hora) for l in logros)
+                )
+            return True
+        except Exception as e:
+            print(f"Error al guardar: {e}")
+            return False
+
+    def guardar(self):
+        # Cada alta se confirma en su propia transacción
+        return True
+
+    def _filas_a_logros(self, filas):
+        for descripcion, categoria, fecha, hora in filas:
+            yield Logro(descripcion, categoria, minuto_desde(fecha, hora))
+
+    def iterar_logros(self):
+        filas = self.conexion.execute(
+            "SELECT descripcion, categoria, fecha, hora FROM logros ORDER BY id"
+        )
+        return self._filas_a_logros(filas)
+
+    def obtener_todos(self):
+        return list(self.iterar_logros())
+
+    def obtener_ultimos(self, n):
+        filas = self.conexion.execute(
+            "SELECT descripcion, categoria, fecha, hora FROM logros "
+            "ORDER BY id DESC LIMIT ?",
+            (n,)
+        ).fetchall()
+        return list(self._filas_a_logros(reversed(filas)))
+
+    def contar_total(self):
+        return self.conexion.execute("SELECT COUNT(*) FROM logros").fetchone()[0]
+
+    def _condicion_rango(self, desde, hasta):
+        """Arma la cláusula WHERE (sobre el índice de fecha) de un rango."""
+        condiciones, parametros = [], []
+        if desde is not None:
+            condiciones.append("fecha >= ?")
+            parametros.append(desde)
+        if hasta is not None:
+            condiciones.append("fecha <= ?")
+            parametros.append(hasta)
+        where = " WHERE " + " AND ".join(condiciones) if condiciones else ""
+        return where, parametros
+
+    def contar_en_rango(self, desde=None, hasta=None):
+        where, parametros = self._condicion_rango(desde, hasta)
+        return self.conexion.execute(
+            "SELECT COUNT(*) FROM logros" + where, parametros
+        ).fetchone()[0]
+
+    def obtener_en_rango(self, desde=None, hasta=None):
+        where, parametros = self._condicion_rango(desde, hasta)
+        filas = self.conexion.execute(
+            "SELECT descripcion, categoria, fecha, hora FROM logros" + where +
+            " ORDER BY fecha, hora, id", parametros
+        )
+        return list(self._filas_a_logros(filas))
+
+    def logros_por_dia_en_rango(self, desde=None, hasta=None):
+        where, parametros = self._condicion_rango(desde, hasta)
+        return dict(self.conexion.execute(
+            "SELECT fecha, COUNT(*) FROM logros" + where + " GROUP BY fecha", parametros
+        ))
+
+    def obtener_pagina(self, inicio, cantidad, categoria=None, orden="fecha", descendente=True):
+        columnas = {
+            "fecha": ["fecha", "hora", "id"],
+            "categoria": ["categoria", "fecha", "hora", "id"],
+            "descripcion": ["descripcion COLLATE NOCASE", "fecha", "hora", "id"],
+        }[orden]
+        sentido = " DESC" if descendente else ""
+        where, parametros = ("", []) if categoria is None else (" WHERE categoria = ?", [categoria])
+
+        filas = self.conexion.execute(
+            "SELECT descripcion, categoria, fecha, hora FROM logros" + where +
+            " ORDER BY " + ", ".join(columna + sentido for columna in columnas) +
+            " LIMIT ? OFFSET ?",
+            parametros + [cantidad, inicio]
+        )
+        return list(self._filas_a_logros(filas))
+
+    def contar_por_categoria(self):
+        return dict(self.conexion.execute(
+            "SELECT categoria, COUNT(*) FROM logros GROUP BY categoria"
+        ))
+
+    def logros_por_dia(self):
+        return dict(self.conexion.execute(
+            "SELECT fecha, COUNT(*) FROM logros GROUP BY fecha"
+        ))
+
+    def cerrar(self):
+        if self._conexion is not None:
+            self._conexion.close()
+            self._conexion = None
+
+
+class BackendSegmentos(BackendAlmacenamiento):
+    """
+    Guarda el historial particionado por mes: un archivo JSON por mes
+    (YYYY-MM.json) más un manifiesto con los conteos de cada mes por
+    categoría y por día.
+
+    Al iniciar solo se lee el manifiesto. Los totales, las
+    distribuciones y los conteos por rango se responden desde él; los
+    segmentos se abren la primera vez que una consulta necesita sus
+    logros (rangos, últimos N, historial completo) y quedan en memoria.
+    Cada alta reescribe solo el segmento de su mes y el manifiesto.
+
+    El orden de registro es cronológico por mes: un logro importado con
+    fecha antigua queda en el segmento de su mes.
+    """
+
+    MANIFIESTO = "manifiesto.json"
+
+    def __init__(self, directorio, archivo_legado=None):
+        """
+        Args:
+            directorio (str): Carpeta de los segmentos y el manifiesto
+            archivo_legado (str): logros.json a migrar la primera vez
+                que se usa el directorio (opcional)
+        """
+        self.directorio = directorio
+        self.archivo_legado = archivo_legado
+        self.manifiesto = None  # {mes: {"total", "categorias", "dias"}}
+        self._segmentos = {}    # {mes: list[Logro]} de los meses abiertos
+        self._vistas = {}       # {(categoria, orden): logros ordenados} para paginar
+
+    # ----- Manifiesto y segmentos -----
+
+    def _ruta_segmento(self, mes):
+        return os.path.join(self.directorio, f"{mes}.json")
+
+    def _ruta_manifiesto(self):
+        return os.path.join(self.directorio, self.MANIFIESTO)
+
+    def _meses(self, desde=None, hasta=None):
+        """
+        Meses con logros que se solapan con un rango de fechas.
+
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD) o None
+            hasta (str): Última fecha (YYYY-MM-DD) o None
+
+        Returns:
+            list[str]: Meses (YYYY-MM) en orden cronológico
+        """
+        if self.manifiesto is None:
+            self.cargar()
+        return [
+            mes for mes in sorted(self.manifiesto)
+            if (desde is None or mes >= desde[:7]) and (hasta is None or mes <= hasta[:7])
+        ]
+
+    def _segmento(self, mes):
+        """
+        Logros de un mes; el archivo se lee la primera vez que se pide.
+
+        Args:
+            mes (str): Mes en formato YYYY-MM
+
+        Returns:
+            list[Logro]: Logros del mes, en orden de registro
+        """
+        if mes not in self._segmentos:
+            ruta = self._ruta_segmento(mes)
+            if os.path.exists(ruta):
+                self._segmentos[mes] = [crear_logro(item) for item in iterar_json(ruta)]
+            else:
+                self._segmentos[mes] = []
+        return self._segmentos[mes]
+
+    def _registrar_en_manifiesto(self, mes, logros):
+        """Suma los logros nuevos a los conteos del mes en el manifiesto."""
+        entrada = self.manifiesto.setdefault(mes, {"total": 0, "categorias": {}, "dias": {}})
+        entrada["total"] += len(logros)
+        for logro in logros:
+            entrada["categorias"][logro.categoria] = entrada["categorias"].get(logro.categoria, 0) + 1
+            entrada["dias"][logro.fecha] = entrada["dias"].get(logro.fecha, 0) + 1
+
+    def _escribir_segmento(self, mes):
+        datos = [logro.to_dict() for logro in self._segmentos[mes]]
+        with archivo_atomico(self._ruta_segmento(mes)) as f:
+            json.dump(datos, f, ensure_ascii=False, indent=2)
+
+    def _escribir_manifiesto(self):
+        with archivo_atomico(self._ruta_manifiesto()) as f:
+            json.dump(self.manifiesto, f, ensure_ascii=False, indent=2)
+
+    def _migrar_legado(self):
+        """Reparte un logros.json existente en segmentos mensuales."""
+        for item in iterar_json(self.archivo_legado):
+            logro = crear_logro(item)
+            mes = logro.fecha[:7]
+            self._segmento(mes).append(logro)
+            self._registrar_en_manifiesto(mes, [logro])
+        self.guardar()
+
+    # ----- Interfaz del backend -----
+
+    def cargar(self):
+        self.manifiesto = {}
+        self._segmentos = {}
+        self._vistas = {}
+        try:
+            os.makedirs(self.directorio, exist_ok=True)
+            if os.path.exists(self._ruta_manifiesto()):
+                with open(self._ruta_manifiesto(), 'r', encoding='utf-8') as f:
+                    self.manifiesto = json.load(f)
+            elif self.archivo_legado and os.path.exists(self.archivo_legado):
+                self._migrar_legado()
+            return True
+        except Exception as e:
+            print(f"Error al cargar: {e}")
+            self.manifiesto = {}
+            self._segmentos = {}
+            return False
+
+    def agregar(self, logro):
+        return self.agregar_lote([logro])
+
+    def agregar_lote(self, logros):
+        if self.manifiesto is None:
+            self.cargar()
+
+        por_mes = {}
+        for logro in logros:
+            por_mes.setdefault(logro.fecha[:7], []).append(logro)
+        self._vistas = {}
+
+        try:
+            for mes, nuevos in por_mes.items():
+                self._segmento(mes).extend(nuevos)
+                self._registrar_en_manifiesto(mes, nuevos)
+                self._escribir_segmento(mes)  # Solo se reescribe el mes afectado
+            self._escribir_manifiesto()
+            return True
+        except Exception as e:
+            print(f"Error al guardar: {e}")
+            return False
+
+    def guardar(self):
+        if self.manifiesto is None:
+            return True
+        try:
+            for mes in self._segmentos:
+                self._escribir_segmento(mes)
+            self._escribir_manifiesto()
+            return True
+        except Exception as e:
+            print(f"Error al guardar: {e}")
+            return False
+
+    def deduplicar(self):
+        """
+        Elimina los logros repetidos (misma descripción, categoría, fecha
+        y hora) conservando la primera aparición. Como un duplicado solo
+        puede estar en el mismo mes, se procesa un segmento a la vez: se
+        reescriben los meses que cambian y, al final, el manifiesto con
+        los conteos recalculados.
+
+        Returns:
+            tuple: (cantidad de logros leídos, cantidad de duplicados eliminados)
+        """
+        if self.manifiesto is None:
+            self.cargar()
+
+        leidos = eliminados = 0
+        for mes in self._meses():
+            abierto = mes in self._segmentos
+            logros = self._segmento(mes)
+            vistos = set()
+            unicos = []
+            for logro in logros:
+                if logro.clave not in vistos:
+                    vistos.add(logro.clave)
+                    unicos.append(logro)
+            leidos += len(logros)
+            eliminados += len(logros) - len(unicos)
+
+            if len(unicos) < len(logros):
+                self._segmentos[mes] = unicos
+                del self.manifiesto[mes]
+                self._registrar_en_manifiesto(mes, unicos)
+                self._escribir_segmento(mes)
+            if not abierto:
+                del self._segmentos[mes]  # Solo un mes en memoria a la vez
+
+        if eliminados:
+            self._vistas = {}
+            self._escribir_manifiesto()
+        return leidos, eliminados
+
+    def iterar_logros(self):
+        for mes in self._meses():
+            if mes in self._segmentos:
+                yield from self._segmentos[mes]
+            else:
+                # Sin retener el segmento: recorrido en streaming
+                for item in iterar_json(self._ruta_segmento(mes)):
+                    yield crear_logro(item)
+
+    def obtener_todos(self):
+        return [logro for mes in self._meses() for logro in self._segmento(mes)]
+
+    def obtener_ultimos(self, n):
+        # Se abren meses desde el más reciente hasta juntar n logros
+        ultimos = []
+        for mes in reversed(self._meses()):
+            if len(ultimos) >= n:
+                break
+            ultimos = self._segmento(mes) + ultimos
+        return ultimos[-n:] if n > 0 else []
+
+    def obtener_pagina(self, inicio, cantidad, categoria=None, orden="fecha", descendente=True):
+        if orden != "fecha":
+            # Los demás órdenes se calculan una vez y se reutilizan hasta el próximo alta
+            vista = self._vistas.get((categoria, orden))
+            if vista is None:
+                vista = sorted(
+                    (logro for logro in self.iterar_logros()
+                     if categoria is None or logro.categoria == categoria),
+                    key=CLAVES_ORDEN[orden]
+                )
+                self._vistas[(categoria, orden)] = vista
+            return _cortar_pagina(vista, inicio, cantidad, descendente)
+
+        # Por fecha: los meses ya están en orden; los que quedan antes de la
+        # página se saltan con los conteos del manifiesto, sin abrirlos
+        meses = self._meses()
+        pagina = []
+        saltar = inicio
+        for mes in (reversed(meses) if descendente else meses):
+            if len(pagina) >= cantidad:
+                break
+            entrada = self.manifiesto[mes]
+            total = entrada["total"] if categoria is None else entrada["categorias"].get(categoria, 0)
+            if saltar >= total:
+                saltar -= total
+                continue
+
+            logros = sorted(
+                (logro for logro in self._segmento(mes)
+                 if categoria is None or logro.categoria == categoria),
+                key=lambda logro: logro.minuto
+            )
+            pagina += _cortar_pagina(logros, saltar, cantidad - len(pagina), descendente)
+            saltar = 0
+        return pagina
+
+    def contar_total(self):
+        return sum(self.manifiesto[mes]["total"] for mes in self._meses())
+
+    def contar_en_rango(self, desde=None, hasta=None):
+        return sum(self.logros_por_dia_en_rango(desde, hasta).values())
+
+    def obtener_en_rango(self, desde=None, hasta=None):
+        inicio, fin = limites_en_minutos(desde, hasta)
+        logros = [
+            logro for mes in self._meses(desde, hasta) for logro in self._segmento(mes)
+            if (inicio is None or logro.minuto >= inicio) and (fin is None or logro.minuto < fin)
+        ]
+        return sorted(logros, key=lambda logro: logro.minuto)
+
+    def logros_por_dia_en_rango(self, desde=None, hasta=None):
+        return {
+            fecha: cantidad
+            for mes in self._meses(desde, hasta)
+            for fecha, cantidad in sorted(self.manifiesto[mes]["dias"].items())
+            if (desde is None or fecha >= desde) and (hasta is None or fecha <= hasta)
+        }
+
+    def contar_por_categoria(self):
+        conteo = Counter()
+        for mes in self._meses():
+            conteo.update(self.manifiesto[mes]["categorias"])
+        return dict(conteo)
+
+    def logros_por_dia(self):
+        return self.logros_por_dia_en_rango()
+
+
+class BackendDiferido(BackendAlmacenamiento):
+    """
+    Escritura diferida (write-behind) sobre un backend JSON, journal o
+    binario: las altas solo actualizan la memoria y retornan de
+    inmediato; un hilo persiste los cambios acumulados a lo sumo
+    `ventana` segundos después del primer alta pendiente, con una sola
+    reescritura atómica para todas las altas de ese intervalo.
+
+    Si el proceso termina de golpe se pierden, como máximo, las altas
+    de la última ventana; el archivo nunca queda truncado. Las consultas
+    se delegan en el backend envuelto y ya ven las altas pendientes.
+    """
+
+    def __init__(self, backend, ventana=1.0):
+        """
+        Args:
+            backend (BackendJSON): Backend que persiste el historial completo
+            ventana (float): Segundos máximos entre un alta y su escritura
+
+        Raises:
+            ValueError: Si el backend no mantiene el historial en memoria
+        """
+        if not isinstance(backend, BackendJSON):
+            raise ValueError("La escritura diferida requiere el modo json, journal o binario")
+
+        self.backend = backend
+        self.ventana = ventana
+        self._condicion = threading.Condition()
+        self._escritura = threading.Lock()  # Una escritura a la vez
+        self._pendiente_desde = None  # time.monotonic() del primer alta sin escribir
+        self._cerrando = False
+
+        self._hilo = threading.Thread(target=self._escribir_en_segundo_plano,
+                                      name="escritura-diferida", daemon=True)
+        self._hilo.start()
+        atexit.register(self.cerrar)  # No perder la última ventana al salir
+
+    def _escribir_en_segundo_plano(self):
+        """Espera altas pendientes y las escribe al vencer la ventana."""
+        while True:
+            with self._condicion:
+                while self._pendiente_desde is None and not self._cerrando:
+                    self._condicion.wait()
+                if self._cerrando:
+                    return  # cerrar() hace la última escritura
+
+                espera = self._pendiente_desde + self.ventana - time.monotonic()
+                if espera > 0:
+                    self._condicion.wait(espera)
+                    continue
+            self.sincronizar()
+
+    def sincronizar(self):
+        """
+        Escribe ya las altas pendientes (flush), sin esperar a la ventana.
+
+        Returns:
+            bool: True si no quedó nada pendiente
+        """
+        with self._escritura:
+            with self._condicion:
+                if self._pendiente_desde is None:
+                    return True
+                # Copia bajo el candado: las altas siguen sin esperar la escritura
+                logros = list(self.backend.logros)
+                self._pendiente_desde = None
+
+            if self.backend._escribir(logros):
+                return True
+
+            with self._condicion:  # Se reintenta en la próxima ventana
+                if self._pendiente_desde is None:
+                    self._pendiente_desde = time.monotonic()
+                self._condicion.notify()
+            return False
+
+    # ----- Interfaz del backend -----
+
+    def cargar(self):
+        self.sincronizar()  # Recargar no debe descartar altas pendientes
+        return self.backend.cargar()
+
+    def agregar(self, logro):
+        return self.agregar_lote([logro])
+
+    def agregar_lote(self, logros):
+        with self._condicion:
+            self.backend._incorporar(logros)
+            if self._pendiente_desde is None:
+                self._pendiente_desde = time.monotonic()
+                self._condicion.notify()
+        return True
+
+    def guardar(self):
+        with self._condicion:
+            if self._pendiente_desde is None:
+                self._pendiente_desde = time.monotonic()
+        return self.sincronizar()
+
+    def cerrar(self):
+        with self._condicion:
+            if self._cerrando:
+                return
+            self._cerrando = True
+            self._condicion.notify()
+        self._hilo.join()
+        self.sincronizar()
+        self.backend.cerrar()
+        atexit.unregister(self.cerrar)
+
+    def iterar_logros(self):
+        return self.backend.iterar_logros()
+
+    def obtener_todos(self):
+        return self.backend.obtener_todos()
+
+    def obtener_ultimos(self, n):
+        return self.backend.obtener_ultimos(n)
+
+    def contar_total(self):
+        return self.backend.contar_total()
+
+    def contar_en_rango(self, desde=None, hasta=None):
+        return self.backend.contar_en_rango(desde, hasta)
+
+    def obtener_en_rango(self, desde=None, hasta=None):
+        return self.backend.obtener_en_rango(desde, hasta)
+
+    def logros_por_dia_en_rango(self, desde=None, hasta=None):
+        return self.backend.logros_por_dia_en_rango(desde, hasta)
+
+    def obtener_pagina(self, inicio, cantidad, categoria=None, orden="fecha", descendente=True):
+        return self.backend.obtener_pagina(inicio, cantidad, categoria, orden, descendente)
+
+    def contar_por_categoria(self):
+        return self.backend.contar_por_categoria()
+
+    def logros_por_dia(self):
+        return self.backend.logros_por_dia()
+
+
+def crear_backend(modo, archivo):
+    """
+    Crea el backend correspondiente a un modo de almacenamiento.
+
+    Args:
+        modo (str): "json", "journal", "sqlite", "segmentos", "binario"
+            o "mapeado" (solo lectura, requiere NumPy)
+        archivo (str): Ruta base de persistencia; en modo sqlite se usa
+            la misma ruta con extensión .db, en los modos binario y
+            mapeado con extensión .dwb y en modo segmentos una carpeta
+            <nombre>_segmentos (sqlite, binario y segmentos migran el
+            archivo si existe)
+
+    Returns:
+        BackendAlmacenamiento: Backend listo para cargar
+    """
+    if modo == "json":
+        return BackendJSON(archivo)
+    if modo == "journal":
+        return BackendJournal(archivo)
+    if modo == "sqlite":
+        return BackendSQLite(os.path.splitext(archivo)[0] + ".db", archivo)
+    if modo == "segmentos":
+        return BackendSegmentos(os.path.splitext(archivo)[0] + "_segmentos", archivo)
+    if modo == "binario":
+        return BackendBinario(os.path.splitext(archivo)[0] + ".dwb", archivo)
+    if modo == "mapeado":
+        from almacen_mapeado import BackendMapeado  # Requiere NumPy
+        return BackendMapeado(os.path.splitext(archivo)[0] + ".dwb")
+    raise ValueError(f"Modo de almacenamiento desconocido: {modo}")
+
+
+# ===== PRUEBA DEL JOURNAL (Eliminar después) =====
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo = os.path.join(directorio, "logros.json")
+        journal = BackendJournal(archivo)
+        journal.cargar()
+        journal.agregar(Logro("Antes del corte", "salud"))
+
+        # Corte a mitad de una escritura: la última línea queda sin "\n"
+        with open(journal.archivo_journal, 'a', encoding='utf-8') as f:
+            f.write('{"descripcion": "Escritura cort')
+
+        journal = BackendJournal(archivo)
+        journal.cargar()
+        journal.agregar(Logro("Después del corte", "trabajo"))
+
+        recargado = BackendJournal(archivo)
+        recargado.cargar()
+        descripciones = [logro.descripcion for logro in recargado.obtener_todos()]
+        print(f"Tras el corte: {descripciones}")
+        assert descripciones == ["Antes del corte", "Después del corte"]
@@ -0,0 +1,186 @@
+import math
+from busqueda import normalizar
+from logro import MINUTOS_POR_DIA
+
+VIDA_MEDIA_DIAS = 30  # Un uso de hace 30 días pesa la mitad que uno de hoy
+MAX_SUGERENCIAS = 8  # Sugerencias guardadas por nodo
+
+
+class _Nodo:
+    """Nodo del trie comprimido: una arista con varias letras."""
+
+    __slots__ = ("etiqueta", "hijos", "mejores")
+
+    def __init__(self, etiqueta, mejores=None):
+        self.etiqueta = etiqueta  # Letras de la arista que llega al nodo
+        self.hijos = None  # {primera letra de la arista: _Nodo}, se crea al dividir
+        self.mejores = mejores if mejores is not None else []  # Claves con mayor puntaje
+
+
+class Autocompletado:
+    """
+    Sugerencias de descripciones a medida que se escribe.
+
+    Las descripciones normalizadas (ver busqueda.normalizar) forman un
+    trie comprimido: cada arista guarda varias letras, así que hay a lo
+    sumo dos nodos por descripción distinta. Cada nodo guarda sus
+    MAX_SUGERENCIAS mejores descripciones, por lo que sugerir es bajar
+    por el prefijo y leer una lista, sin recorrer el subárbol.
+
+    El puntaje combina frecuencia y recencia: cada uso suma
+    2^(día / VIDA_MEDIA_DIAS), de modo que usar una descripción hoy
+    vale el doble que hace un mes. Como los puntajes solo crecen, las
+    listas de cada nodo se mantienen correctas con cada logro nuevo.
+
+    Se suscribe a un GestorLogros y se actualiza con cada logro nuevo.
+    """
+
+    def __init__(self, gestor):
+        """
+        Constructor del autocompletado.
+
+        Args:
+            gestor (GestorLogros): Gestor cuyas descripciones se sugieren
+        """
+        self.gestor = gestor
+        self.reconstruir()
+        gestor.suscribir(self.registrar, self.reconstruir)
+
+    def reconstruir(self):
+        """
+        Arma el trie de nuevo con todo el historial del gestor.
+        Primero se suman los usos y luego se insertan las descripciones
+        de mayor a menor puntaje: cada nodo se queda con las primeras
+        que lo alcanzan, sin reordenar listas.
+        """
+        self.raiz = _Nodo("")
+        self.entradas = {}  # {clave: [puntaje (log2), descripción más reciente, minuto]}
+        for logro in self.gestor.iterar_logros():
+            self._sumar_uso(logro)
+
+        for clave in sorted(self.entradas, key=lambda c: self.entradas[c][0], reverse=True):
+            for nodo in self._insertar(clave):
+                if len(nodo.mejores) < MAX_SUGERENCIAS:
+                    nodo.mejores.append(clave)
+
+    def registrar(self, logro):
+        """
+        Suma un uso de la descripción del logro y actualiza las
+        sugerencias de los nodos de su camino.
+
+        Args:
+            logro (Logro): Logro recién agregado
+        """
+        clave = self._sumar_uso(logro)
+        if clave is not None:
+            for nodo in self._insertar(clave):
+                self._proponer(nodo, clave)
+
+    def _sumar_uso(self, logro):
+        """
+        Suma el uso del logro al puntaje de su descripción.
+
+        Returns:
+            str: Clave normalizada de la descripción (None si está vacía)
+        """
+        clave = ' '.join(normalizar(logro.descripcion).split())
+        if not clave:
+            return None
+
+        # Puntajes en log2 para que 2^(día / vida media) no desborde
+        peso = logro.minuto / (MINUTOS_POR_DIA * VIDA_MEDIA_DIAS)
+        entrada = self.entradas.get(clave)
+        if entrada is None:
+            self.entradas[clave] = [peso, logro.descripcion, logro.minuto]
+        else:
+            mayor, menor = max(entrada[0], peso), min(entrada[0], peso)
+            entrada[0] = mayor + math.log2(1 + 2 ** (menor - mayor))
+            if logro.minuto >= entrada[2]:
+                entrada[1], entrada[2] = logro.descripcion, logro.minuto  # Texto más reciente
+        return clave
+
+    def _insertar(self, clave):
+        """
+        Agrega la clave al trie (dividiendo aristas si hace falta).
+
+        Returns:
+            list[_Nodo]: Nodos del camino de la clave, sin la raíz
+        """
+        camino = []
+        nodo, i = self.raiz, 0
+        while i < len(clave):
+            if nodo.hijos is None:
+                nodo.hijos = {}
+            hijo = nodo.hijos.get(clave[i])
+            if hijo is None:
+                hijo = nodo.hijos[clave[i]] = _Nodo(clave[i:])
+                camino.append(hijo)
+                break
+
+            etiqueta = hijo.etiqueta
+            comun = 0
+            while comun < len(etiqueta) and i + comun < len(clave) and etiqueta[comun] == clave[i + comun]:
+                comun += 1
+
+            if comun < len(etiqueta):
+                # La clave se separa a mitad de la arista: nodo intermedio
+                # con las mismas sugerencias que el subárbol que cuelga de él
+                medio = _Nodo(etiqueta[:comun], list(hijo.mejores))
+                hijo.etiqueta = etiqueta[comun:]
+                medio.hijos = {hijo.etiqueta[0]: hijo}
+                nodo.hijos[clave[i]] = medio
+                hijo = medio
+
+            camino.append(hijo)
+            nodo, i = hijo, i + comun
+        return camino
+
+    def _proponer(self, nodo, clave):
+        """Ubica la clave en las mejores del nodo si su puntaje alcanza."""
+        entradas = self.entradas
+        if clave not in nodo.mejores:
+            if (len(nodo.mejores) >= MAX_SUGERENCIAS
+                    and entradas[clave][0] <= entradas[nodo.mejores[-1]][0]):
+                return
+            nodo.mejores.append(clave)
+        nodo.mejores.sort(key=lambda c: entradas[c][0], reverse=True)
+        del nodo.mejores[MAX_SUGERENCIAS:]
+
+    def sugerir(self, prefijo, cantidad=MAX_SUGERENCIAS):
+        """
+        Sugiere descripciones que empiezan con el texto escrito.
+
+        Args:
+            prefijo (str): Texto escrito (sin distinguir mayúsculas ni tildes)
+            cantidad (int): Máximo de sugerencias (hasta MAX_SUGERENCIAS)
+
+        Returns:
+            list[str]: Descripciones, de la más a la menos usada recientemente
+        """
+        prefijo = ' '.join(normalizar(prefijo).split()) + (' ' if prefijo[-1:].isspace() else '')
+        if not prefijo.strip():
+            return []
+
+        nodo, i = self.raiz, 0
+        while i < len(prefijo):
+            hijo = nodo.hijos.get(prefijo[i]) if nodo.hijos else None
+            if hijo is None:
+                return []
+            resto = prefijo[i:]
+            if resto.startswith(hijo.etiqueta):
+                nodo, i = hijo, i + len(hijo.etiqueta)
+            elif hijo.etiqueta.startswith(resto):
+                nodo = hijo  # El prefijo termina a mitad de la arista
+                break
+            else:
+                return []
+        return [self.entradas[clave][1] for clave in nodo.mejores[:cantidad]]
+
+
+# ===== PRUEBA DE LA CLASE (Eliminar después) =====
+if __name__ == "__main__":
+    from gestor_logros import GestorLogros
+
+    autocompletado = Autocompletado(GestorLogros())
+    for prefijo in ["h", "Estudi", "estudie p", "x"]:
+        print(f"{prefijo!r}: {autocompletado.sugerir(prefijo)}")
@@ -0,0 +1,800 @@
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from gestor_logros import GestorLogros
+from almacenamiento import crear_logro
+from logro import Logro
+from estadisticas import Estadisticas
+
+CATEGORIAS = ["trabajo", "salud", "aprendizaje", "personal"]
+
+# Presupuesto de arranque: milisegundos de importación acumulada por módulo
+PRESUPUESTO_ARRANQUE = {"main": 60, "gui": 120}
+# Dependencias pesadas que solo deben cargarse al pedir un gráfico
+MODULOS_DIFERIDOS = ("matplotlib", "numpy")
+# Presupuesto de actualización del dashboard embebido al registrar un logro
+PRESUPUESTO_REDIBUJO_MS = 50
+
+# Baseline de la suite: resultados de referencia para detectar regresiones
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks_baseline.json")
+
+
+def generar_registros(cantidad):
+    """
+    Genera diccionarios de logros sintéticos.
+
+    Args:
+        cantidad (int): Cantidad de logros a generar
+
+    Yields:
+        dict: Logro serializado (descripcion, categoria, fecha, hora)
+    """
+    for i in range(cantidad):
+        yield {
+            'descripcion': f"Logro de prueba {i}",
+            'categoria': CATEGORIAS[i % len(CATEGORIAS)],
+            'fecha': f"2025-{(i // 28) % 12 + 1:02d}-{i % 28 + 1:02d}",
+            'hora': f"{i % 24:02d}:{i % 60:02d}"
+        }
+
+
+def generar_historial(cantidad, semilla=0, sesgo=1.0, dias=365, hasta="2025-12-31",
+                      categorias=CATEGORIAS):
+    """
+    Genera un historial sintético reproducible: la misma semilla y los
+    mismos parámetros producen siempre los mismos logros.
+
+    Args:
+        cantidad (int): Cantidad de logros (de 1k a 10M)
+        semilla (int): Semilla del generador aleatorio
+        sesgo (float): Exponente Zipf del reparto entre categorías
+            (0 = uniforme; 1 = la primera categoría es 2x la segunda...)
+        dias (int): Cantidad de días que abarca el historial
+        hasta (str): Última fecha del historial (YYYY-MM-DD)
+        categorias (list[str]): Categorías, de la más a la menos frecuente
+
+    Yields:
+        dict: Logro serializado (descripcion, categoria, fecha, hora),
+            en orden cronológico
+    """
+    aleatorio = random.Random(semilla)
+    pesos = [1 / (i + 1) ** sesgo for i in range(len(categorias))]
+    acciones = ["Terminé", "Practiqué", "Leí", "Organicé", "Aprendí", "Completé"]
+    primer_dia = date.fromisoformat(hasta).toordinal() - dias + 1
+
+    # Se reparten los logros por día en orden, sin ordenar al final
+    for i in range(cantidad):
+        dia = primer_dia + i * dias // cantidad
+        minuto = aleatorio.randrange(24 * 60)
+        yield {
+            'descripcion': f"{aleatorio.choice(acciones)} tarea {aleatorio.randrange(10_000)}",
+            'categoria': aleatorio.choices(categorias, pesos)[0],
+            'fecha': date.fromordinal(dia).isoformat(),
+            'hora': f"{minuto // 60:02d}:{minuto % 60:02d}"
+        }
+
+
+def escribir_historial(archivo, cantidad):
+    """
+    Escribe un historial sintético de logros en formato JSON.
+
+    Args:
+        archivo (str): Ruta del archivo a generar
+        cantidad (int): Cantidad de logros a escribir
+    """
+    with open(archivo, 'w', encoding='utf-8') as f:
+        json.dump(list(generar_registros(cantidad)), f, ensure_ascii=False, indent=2)
+
+
+def poblar_sqlite(backend, cantidad):
+    """
+    Inserta un historial sintético directamente en un BackendSQLite.
+
+    Args:
+        backend (BackendSQLite): Backend ya cargado
+        cantidad (int): Cantidad de logros a insertar
+    """
+    with backend.conexion:
+        backend.conexion.executemany(
+            "INSERT INTO logros (descripcion, categoria, fecha, hora) VALUES (?, ?, ?, ?)",
+            ((d['descripcion'], d['categoria'], d['fecha'], d['hora'])
+             for d in generar_registros(cantidad))
+        )
+
+
+def medir_altas(gestor, repeticiones):
+    """
+    Mide el tiempo promedio de agregar_logro.
+
+    Args:
+        gestor (GestorLogros): Gestor sobre el que se agregan logros
+        repeticiones (int): Cantidad de altas a medir
+
+    Returns:
+        float: Microsegundos promedio por alta
+    """
+    inicio = time.perf_counter()
+    for i in range(repeticiones):
+        gestor.agregar_logro(f"Alta medida {i}", "personal")
+    return (time.perf_counter() - inicio) / repeticiones * 1e6
+
+
+def bench_altas(tamanios, repeticiones=1000, repeticiones_json=3):
+    """
+    Compara el costo de agregar_logro en cada modo de almacenamiento
+    para historiales de distintos tamaños.
+
+    Args:
+        tamanios (list[int]): Tamaños de historial a evaluar
+        repeticiones (int): Altas medidas en modos journal y sqlite
+        repeticiones_json (int): Altas medidas en modo json (son lentas)
+    """
+    print(f"{'Registros':>10} | {'json (µs/alta)':>15} | {'journal (µs/alta)':>18} | {'sqlite (µs/alta)':>17}")
+    print("-" * 70)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        for tamanio in tamanios:
+            archivo = os.path.join(directorio, f"logros_{tamanio}.json")
+
+            escribir_historial(archivo, tamanio)
+            gestor = GestorLogros(archivo, modo="json")
+            t_json = medir_altas(gestor, repeticiones_json)
+
+            escribir_historial(archivo, tamanio)
+            gestor = GestorLogros(archivo, modo="journal")
+            t_journal = medir_altas(gestor, repeticiones)
+
+            gestor = GestorLogros(archivo, modo="sqlite")
+            poblar_sqlite(gestor.backend, tamanio)
+            t_sqlite = medir_altas(gestor, repeticiones)
+            gestor.cerrar()
+
+            print(f"{tamanio:>10} | {t_json:>15.1f} | {t_journal:>18.1f} | {t_sqlite:>17.1f}")
+
+
+def medir_metricas(crear_estadisticas, repeticiones=3):
+    """
+    Mide el tiempo de cada métrica de Estadisticas. Cada intento usa
+    una instancia nueva, así que se mide el cálculo y no la caché.
+
+    Args:
+        crear_estadisticas (callable): Retorna una Estadisticas sin usar
+        repeticiones (int): Se reporta el mejor de N intentos
+
+    Returns:
+        dict: {metrica: milisegundos}
+    """
+    metricas = [
+        "contar_por_categoria", "logros_por_dia", "logros_ultima_semana",
+        "logros_ultimo_mes", "promedio_diario", "categoria_favorita",
+        "calcular_racha"
+    ]
+    return {
+        metrica: cronometrar(lambda stats: getattr(stats, metrica)(), repeticiones,
+                             preparar=crear_estadisticas)
+        for metrica in metricas
+    }
+
+
+def bench_columnar(tamanio):
+    """
+    Compara Estadisticas sobre una lista de Logro contra Estadisticas
+    sobre un LogroStore columnar.
+
+    Args:
+        tamanio (int): Cantidad de logros sintéticos
+    """
+    from almacen_columnar import LogroStore
+
+    logros = [crear_logro(d) for d in generar_registros(tamanio)]
+    store = LogroStore.desde_logros(logros)
+
+    t_lista = medir_metricas(lambda: Estadisticas(logros))
+    t_store = medir_metricas(lambda: Estadisticas(fuente=store))
+
+    print(f"{'Métrica':>22} | {'lista (ms)':>11} | {'columnar (ms)':>14} | {'speedup':>8}")
+    print("-" * 66)
+    for metrica in t_lista:
+        speedup = t_lista[metrica] / max(t_store[metrica], 1e-6)
+        print(f"{metrica:>22} | {t_lista[metrica]:>11.2f} | {t_store[metrica]:>14.2f} | {speedup:>7.1f}x")
+
+    total_lista = sum(t_lista.values())
+    total_store = sum(t_store.values())
+    print(f"{'TOTAL':>22} | {total_lista:>11.2f} | {total_store:>14.2f} | "
+          f"{total_lista / max(total_store, 1e-6):>7.1f}x")
+
+
+def racha_por_fechas(fechas):
+    """
+    Algoritmo original de calcular_racha (fechas en texto + strptime),
+    usado como referencia.
+
+    Args:
+        fechas (Iterable[str]): Fechas con logros en formato YYYY-MM-DD
+
+    Returns:
+        int: Racha actual
+    """
+    racha = 0
+    fecha_actual = datetime.now().date()
+    for fecha_str in sorted(set(fechas), reverse=True):
+        fecha_logro = datetime.strptime(fecha_str, "%Y-%m-%d").date()
+        if (fecha_actual - fecha_logro).days == racha:
+            racha += 1
+        else:
+            break
+    return racha
+
+
+def bench_rachas(anios=10, repeticiones=1000):
+    """
+    Compara la racha calculada con strptime sobre fechas en texto contra
+    las consultas del MotorRachas, con un logro diario durante N años.
+
+    Args:
+        anios (int): Años de historia diaria
+        repeticiones (int): Consultas medidas por variante
+    """
+    from rachas import MotorRachas
+
+    hoy = datetime.now().date()
+    fechas = [(hoy - timedelta(days=i)).isoformat() for i in range(anios * 365)]
+
+    inicio = time.perf_counter()
+    motor = MotorRachas.desde_fechas(fechas)
+    t_indice = (time.perf_counter() - inicio) * 1e3
+
+    def medir(funcion):
+        inicio = time.perf_counter()
+        for _ in range(repeticiones):
+            funcion()
+        return (time.perf_counter() - inicio) / repeticiones * 1e6
+
+    medidas = [
+        ("racha (strptime)", medir(lambda: racha_por_fechas(fechas))),
+        ("racha_actual", medir(motor.racha_actual)),
+        ("mas_larga", medir(lambda: motor.mas_larga)),
+        ("racha_al", medir(lambda: motor.racha_al(hoy.toordinal() - 100))),
+        ("agregar_dia (nuevo)", medir(lambda: motor.agregar_dia(hoy.toordinal() + 1))),
+    ]
+
+    print(f"Índice construido en {t_indice:.2f} ms ({len(fechas)} días)")
+    for nombre, micros in medidas:
+        print(f"{nombre:>22} | {micros:>10.2f} µs")
+
+
+class LogroLegado:
+    """
+    Réplica de la representación anterior de Logro (atributos en
+    __dict__ y fecha/hora como texto), usada como referencia de memoria.
+    """
+
+    def __init__(self, descripcion, categoria, fecha, hora):
+        self.descripcion = descripcion
+        self.categoria = categoria
+        self.fecha = fecha
+        self.hora = hora
+
+
+def medir_bytes_por_registro(fabrica, registros):
+    """
+    Mide la memoria asignada al construir una lista de objetos.
+
+    Args:
+        fabrica (callable): Recibe un dict serializado y retorna un objeto
+        registros (list[dict]): Registros a materializar
+
+    Returns:
+        float: Bytes asignados por registro
+    """
+    tracemalloc.start()
+    objetos = [fabrica(d) for d in registros]
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return memoria / len(objetos)
+
+
+def bench_memoria(tamanio):
+    """
+    Compara los bytes por registro de la representación anterior de
+    Logro contra la compacta (__slots__ + timestamp entero).
+
+    Args:
+        tamanio (int): Cantidad de logros a materializar
+    """
+    registros = list(generar_registros(tamanio))
+
+    # Cada campo de texto se copia, como ocurre al decodificar el JSON
+    def copiar(texto):
+        return texto.encode().decode()
+
+    antes = medir_bytes_por_registro(
+        lambda d: LogroLegado(copiar(d['descripcion']), copiar(d['categoria']),
+                              copiar(d['fecha']), copiar(d['hora'])),
+        registros
+    )
+    despues = medir_bytes_por_registro(
+        lambda d: Logro.desde_dict({
+            'descripcion': copiar(d['descripcion']),
+            'categoria': copiar(d['categoria']),
+            'fecha': copiar(d['fecha']),
+            'hora': copiar(d['hora'])
+        }),
+        registros
+    )
+
+    print(f"{'Representación':>16} | {'bytes/registro':>15}")
+    print("-" * 36)
+    print(f"{'anterior':>16} | {antes:>15.1f}")
+    print(f"{'compacta':>16} | {despues:>15.1f}")
+    print(f"Ahorro: {(1 - despues / antes) * 100:.1f}%")
+
+
+def bench_importacion(tamanio):
+    """
+    Mide el throughput de importación (registros/segundo) desde CSV y
+    JSONL hacia un gestor nuevo, con una única escritura por lote.
+
+    Args:
+        tamanio (int): Cantidad de filas del archivo a importar
+    """
+    import csv
+    from importador import importar_csv, importar_jsonl
+
+    with tempfile.TemporaryDirectory() as directorio:
+        origen_csv = os.path.join(directorio, "origen.csv")
+        origen_jsonl = os.path.join(directorio, "origen.jsonl")
+
+        with open(origen_csv, 'w', encoding='utf-8', newline='') as f:
+            escritor = csv.DictWriter(f, fieldnames=['descripcion', 'categoria', 'fecha', 'hora'])
+            escritor.writeheader()
+            escritor.writerows(generar_registros(tamanio))
+        with open(origen_jsonl, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(d, ensure_ascii=False) + "\n" for d in generar_registros(tamanio))
+
+        print(f"{'Formato':>8} | {'modo':>8} | {'segundos':>9} | {'registros/s':>12}")
+        print("-" * 47)
+        for formato, importar, origen in (("csv", importar_csv, origen_csv),
+                                          ("jsonl", importar_jsonl, origen_jsonl)):
+            for modo in ("json", "journal", "sqlite"):
+                destino = os.path.join(directorio, f"destino_{formato}_{modo}.json")
+                gestor = GestorLogros(destino, modo=modo)
+
+                inicio = time.perf_counter()
+                importados, errores = importar(gestor, origen)
+                segundos = time.perf_counter() - inicio
+                gestor.cerrar()
+
+                assert importados == tamanio and not errores
+                print(f"{formato:>8} | {modo:>8} | {segundos:>9.2f} | {importados / segundos:>12,.0f}")
+
+
+def bench_rangos(tamanio, repeticiones=100):
+    """
+    Compara contar logros de la última semana recorriendo la lista
+    contra la búsqueda binaria del IndiceFechas.
+
+    Args:
+        tamanio (int): Cantidad de logros sintéticos
+        repeticiones (int): Consultas medidas por variante
+    """
+    from indice_fechas import IndiceFechas
+
+    logros = [crear_logro(d) for d in generar_registros(tamanio)]
+    limite = "2025-12-01"
+
+    inicio = time.perf_counter()
+    indice = IndiceFechas(logros)
+    t_indice = (time.perf_counter() - inicio) * 1e3
+
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        lineal = sum(1 for logro in logros if logro.fecha >= limite)
+    t_lineal = (time.perf_counter() - inicio) / repeticiones * 1e6
+
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        binario = indice.contar_en_rango(limite)
+    t_binario = (time.perf_counter() - inicio) / repeticiones * 1e6
+
+    assert lineal == binario
+    print(f"Índice construido en {t_indice:.1f} ms")
+    print(f"{'recorrido lineal':>18} | {t_lineal:>12.1f} µs")
+    print(f"{'búsqueda binaria':>18} | {t_binario:>12.1f} µs")
+
+
+def cronometrar(funcion, repeticiones=3, preparar=None):
+    """
+    Mide una operación y retorna el mejor de N intentos.
+
+    Args:
+        funcion (callable): Operación a medir; recibe lo que retorne `preparar`
+        repeticiones (int): Intentos
+        preparar (callable): Se ejecuta antes de cada intento, fuera de la
+            medición (p. ej. para crear una Estadisticas sin caché)
+
+    Returns:
+        float: Milisegundos del mejor intento
+    """
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        argumento = preparar() if preparar is not None else None
+        inicio = time.perf_counter()
+        if preparar is not None:
+            funcion(argumento)
+        else:
+            funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return round(mejor * 1e3, 3)
+
+
+def bench_suite(tamanio, modo="json", semilla=0, sesgo=1.0, dias=365, repeticiones=5):
+    """
+    Mide las operaciones principales sobre un historial sintético:
+    cargar/guardar/agregar_logro del gestor, cada método de
+    Estadisticas (sin caché) y los gráficos de Visualizador sin ventanas.
+
+    Args:
+        tamanio (int): Cantidad de logros del historial
+        modo (str): Modo de almacenamiento del gestor
+        semilla (int): Semilla del generador
+        sesgo (float): Sesgo entre categorías (ver generar_historial)
+        dias (int): Días que abarca el historial
+        repeticiones (int): Se reporta el mejor de N intentos
+
+    Returns:
+        dict: {operacion: milisegundos}
+    """
+    resultados = {}
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo = os.path.join(directorio, "logros.json")
+        registros = generar_historial(tamanio, semilla, sesgo, dias)
+        GestorLogros(archivo, modo=modo).agregar_logros_lote(crear_logro(d) for d in registros)
+
+        # ----- Gestor -----
+        gestor = GestorLogros(archivo, modo=modo, perezoso=True)
+        resultados["gestor.cargar"] = cronometrar(gestor.cargar, repeticiones)
+        resultados["gestor.guardar"] = cronometrar(gestor.guardar, repeticiones)
+        resultados["gestor.agregar_logro"] = cronometrar(
+            lambda: gestor.agregar_logro("Alta medida", "personal"), repeticiones
+        )
+
+        # ----- Estadisticas (una instancia nueva por intento: sin memoria) -----
+        ultimo = gestor.obtener_ultimos(1)[0].fecha
+        desde = (date.fromisoformat(ultimo) - timedelta(days=30)).isoformat()
+        metodos = {
+            "contar_total": (), "contar_por_categoria": (), "logros_por_dia": (),
+            "contar_en_rango": (desde, ultimo), "logros_por_dia_en_rango": (desde, ultimo),
+            "calcular_racha": (), "racha_mas_larga": (), "racha_al": (ultimo,),
+            "intervalos_racha": (), "logros_ultima_semana": (), "logros_ultimo_mes": (),
+            "categoria_favorita": (), "promedio_diario": (), "generar_reporte": (),
+        }
+        for metodo, argumentos in metodos.items():
+            resultados[f"estadisticas.{metodo}"] = cronometrar(
+                lambda stats: getattr(stats, metodo)(*argumentos), repeticiones,
+                preparar=lambda: Estadisticas(fuente=gestor)
+            )
+
+        # ----- Visualizador sin ventanas (requiere matplotlib) -----
+        try:
+            import matplotlib  # noqa: F401
+        except ImportError:
+            print("⚠️ matplotlib no está instalado: se omiten los gráficos")
+        else:
+            from visualizador import Visualizador
+            for grafico in ("grafico_categorias", "grafico_tendencia",
+                            "grafico_calendario", "dashboard_completo"):
+                resultados[f"visualizador.{grafico}"] = cronometrar(
+                    lambda viz: getattr(viz, grafico)(destino=io.BytesIO()), repeticiones,
+                    preparar=lambda: Visualizador(Estadisticas(fuente=gestor), headless=True)
+                )
+        gestor.cerrar()
+
+    return resultados
+
+
+def comparar_con_baseline(resultados, baseline, tolerancia=0.5):
+    """
+    Compara resultados de la suite contra un baseline guardado.
+
+    Args:
+        resultados (dict): {tamanio: {operacion: milisegundos}}
+        baseline (dict): Mismo formato, resultados de referencia
+        tolerancia (float): Aumento relativo permitido (0.5 = 50%)
+
+    Returns:
+        list[tuple]: (tamanio, operacion, ms_baseline, ms_actual) de
+            cada operación que empeoró más que la tolerancia
+    """
+    regresiones = []
+    for tamanio, operaciones in resultados.items():
+        for operacion, actual in operaciones.items():
+            referencia = baseline.get(tamanio, {}).get(operacion)
+            # Con pocos ms el ruido domina: se exige además 2 ms de diferencia
+            if referencia is not None and actual > referencia * (1 + tolerancia) and actual - referencia > 2:
+                regresiones.append((tamanio, operacion, referencia, actual))
+    return regresiones
+
+
+def ejecutar_suite(tamanios, salida=None, baseline=BASELINE, guardar_baseline=False,
+                   tolerancia=0.5, **opciones):
+    """
+    Ejecuta la suite para varios tamaños, escribe los resultados en JSON
+    y los compara con el baseline.
+
+    Args:
+        tamanios (list[int]): Tamaños de historial
+        salida (str): Archivo JSON de resultados (None = no escribir)
+        baseline (str): Archivo del baseline
+        guardar_baseline (bool): Si es True, los resultados pasan a ser el baseline
+        tolerancia (float): Aumento relativo permitido
+        **opciones: modo, semilla, sesgo y dias para bench_suite
+
+    Returns:
+        bool: True si no hubo regresiones
+    """
+    resultados = {}
+    for tamanio in tamanios:
+        resultados[str(tamanio)] = bench_suite(tamanio, **opciones)
+
+        print(f"\n--- {tamanio:,} logros ---")
+        print(f"{'Operación':>40} | {'ms':>10}")
+        print("-" * 53)
+        for operacion, milisegundos in resultados[str(tamanio)].items():
+            print(f"{operacion:>40} | {milisegundos:>10.2f}")
+
+    documento = {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "opciones": opciones,
+        "resultados": resultados,
+    }
+    if salida is not None:
+        with open(salida, 'w', encoding='utf-8') as f:
+            json.dump(documento, f, ensure_ascii=False, indent=2)
+        print(f"\nResultados guardados en '{salida}'")
+
+    if guardar_baseline:
+        with open(baseline, 'w', encoding='utf-8') as f:
+            json.dump(documento, f, ensure_ascii=False, indent=2)
+        print(f"Baseline actualizado en '{baseline}'")
+        return True
+
+    if not os.path.exists(baseline):
+        print(f"⚠️ No hay baseline en '{baseline}' (usa --guardar-baseline)")
+        return True
+
+    with open(baseline, 'r', encoding='utf-8') as f:
+        referencia = json.load(f)["resultados"]
+
+    regresiones = comparar_con_baseline(resultados, referencia, tolerancia)
+    for tamanio, operacion, antes, ahora in regresiones:
+        print(f"❌ Regresión ({tamanio} logros) {operacion}: {antes:.2f} ms -> {ahora:.2f} ms")
+    if not regresiones:
+        print(f"✅ Sin regresiones respecto del baseline (tolerancia {tolerancia:.0%})")
+    return not regresiones
+
+
+def bench_snapshot(tamanio):
+    """
+    Compara el inicio en frío (GestorLogros + cargar()) desde el JSON
+    indentado contra el snapshot binario, con el mismo historial.
+
+    Args:
+        tamanio (int): Cantidad de logros del historial
+    """
+    from snapshot_binario import escribir_snapshot
+
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo = os.path.join(directorio, "logros.json")
+        escribir_historial(archivo, tamanio)
+        escribir_snapshot((crear_logro(d) for d in generar_registros(tamanio)),
+                          os.path.join(directorio, "logros.dwb"))
+
+        print(f"{'Formato':>8} | {'MB':>7} | {'inicio (s)':>11} | {'logros/s':>12}")
+        print("-" * 48)
+        for modo, extension in (("json", ".json"), ("binario", ".dwb")):
+            megas = os.path.getsize(os.path.join(directorio, "logros" + extension)) / 2**20
+
+            inicio = time.perf_counter()
+            gestor = GestorLogros(archivo, modo=modo)
+            segundos = time.perf_counter() - inicio
+
+            assert gestor.contar_total() == tamanio
+            print(f"{modo:>8} | {megas:>7.1f} | {segundos:>11.3f} | {tamanio / segundos:>12,.0f}")
+
+
+def bench_dashboard(tamanio, presupuesto=PRESUPUESTO_REDIBUJO_MS, repeticiones=5):
+    """
+    Verifica que actualizar el dashboard embebido tras un alta no supere
+    su presupuesto. Se usa un lienzo Agg, donde draw_idle() dibuja en el
+    acto: el tiempo incluye el dibujo completo (el peor caso en Tk).
+
+    Args:
+        tamanio (int): Cantidad de logros del historial
+        presupuesto (float): Milisegundos máximos
+        repeticiones (int): Se reporta el mejor de N intentos
+
+    Returns:
+        bool: True si cumple el presupuesto (o si falta matplotlib)
+    """
+    try:
+        from dashboard_vivo import DashboardVivo
+    except ImportError:
+        print("⚠️ matplotlib no está instalado: se omite el dashboard")
+        return True
+
+    with tempfile.TemporaryDirectory() as directorio:
+        gestor = GestorLogros(os.path.join(directorio, "logros.json"), modo="segmentos")
+        gestor.agregar_logros_lote(crear_logro(d) for d in generar_historial(tamanio))
+        tablero = DashboardVivo(None, Estadisticas(fuente=gestor), CATEGORIAS)
+        tablero.actualizar()  # Primer dibujo: layout y rótulos
+
+        def alta():
+            return gestor.agregar_logro("Alta medida", "personal")
+
+        # Cada intento mide los datos de un alta nueva (sin caché) y su dibujo
+        t_datos = cronometrar(lambda _: tablero.datos(), repeticiones, preparar=alta)
+        t_mostrar = cronometrar(tablero.mostrar, repeticiones,
+                                preparar=lambda: alta() and tablero.datos())
+        gestor.cerrar()
+
+    cumple = t_mostrar <= presupuesto
+    print(f"{'Logros':>10} | {'datos (ms)':>11} | {'mostrar (ms)':>13} | {'presupuesto':>12} | {'estado':>7}")
+    print(f"{tamanio:>10} | {t_datos:>11.2f} | {t_mostrar:>13.2f} | {presupuesto:>12} | "
+          f"{'✅' if cumple else '❌':>6}")
+    return cumple
+
+
+def medir_importacion(modulo, repeticiones=5):
+    """
+    Mide el tiempo de importación de un módulo con `python -X importtime`
+    en un intérprete nuevo (sin caché de módulos).
+
+    Args:
+        modulo (str): Módulo a importar (p. ej. "gui")
+        repeticiones (int): Se reporta el mejor de N intentos
+
+    Returns:
+        tuple: (milisegundos acumulados, set de paquetes importados)
+    """
+    directorio = os.path.dirname(os.path.abspath(__file__))
+    mejor = float("inf")
+    paquetes = set()
+
+    for _ in range(repeticiones):
+        salida = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+            cwd=directorio, capture_output=True, text=True, check=True
+        ).stderr
+
+        for linea in salida.splitlines():
+            if not linea.startswith("import time:"):
+                continue
+            _, acumulado, nombre = linea[len("import time:"):].split("|")
+            if not acumulado.strip().isdigit():
+                continue  # Encabezado
+            paquetes.add(nombre.strip().split(".")[0])
+            if nombre.strip() == modulo and not nombre.startswith("  "):
+                mejor = min(mejor, int(acumulado) / 1e3)
+
+    return mejor, paquetes
+
+
+def bench_arranque(presupuesto=PRESUPUESTO_ARRANQUE):
+    """
+    Verifica que importar la CLI y la GUI no supere su presupuesto de
+    tiempo y que no cargue matplotlib/numpy antes del primer gráfico.
+
+    Args:
+        presupuesto (dict): {modulo: milisegundos máximos}
+
+    Returns:
+        bool: True si todos los módulos cumplen el presupuesto
+    """
+    cumple = True
+    print(f"{'Módulo':>8} | {'importación (ms)':>17} | {'presupuesto':>12} | {'estado':>7}")
+    print("-" * 56)
+    for modulo, limite in presupuesto.items():
+        milisegundos, paquetes = medir_importacion(modulo)
+        diferidos = [nombre for nombre in MODULOS_DIFERIDOS if nombre in paquetes]
+        ok = milisegundos <= limite and not diferidos
+        cumple = cumple and ok
+
+        print(f"{modulo:>8} | {milisegundos:>17.1f} | {limite:>12} | {'OK' if ok else 'FALLA':>7}")
+        if diferidos:
+            print(f"         ❌ Importa al iniciar: {', '.join(diferidos)}")
+    return cumple
+
+
+# ===== PUNTO DE ENTRADA =====
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks de DailyWins")
+    parser.add_argument(
+        "--registros",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000, 1_000_000],
+        help="Tamaños de historial a evaluar"
+    )
+    parser.add_argument(
+        "--bench",
+        choices=["altas", "columnar", "rachas", "memoria", "importacion", "rangos", "snapshot",
+                 "arranque", "dashboard", "suite"],
+        nargs="+",
+        default=["altas", "columnar", "rachas", "memoria", "importacion", "rangos", "snapshot",
+                 "arranque", "dashboard", "suite"],
+        help="Benchmarks a ejecutar"
+    )
+    parser.add_argument("--modo", default="json", help="Modo de almacenamiento de la suite")
+    parser.add_argument("--semilla", type=int, default=0, help="Semilla del historial sintético")
+    parser.add_argument("--sesgo", type=float, default=1.0, help="Sesgo Zipf entre categorías")
+    parser.add_argument("--dias", type=int, default=365, help="Días que abarca el historial")
+    parser.add_argument("--salida", help="Archivo JSON donde escribir los resultados de la suite")
+    parser.add_argument("--baseline", default=BASELINE, help="Baseline contra el que se compara")
+    parser.add_argument("--guardar-baseline", action="store_true",
+                        help="Guarda los resultados de la suite como nuevo baseline")
+    parser.add_argument("--tolerancia", type=float, default=0.5,
+                        help="Aumento relativo permitido antes de marcar regresión")
+    args = parser.parse_args()
+
+    if "altas" in args.bench:
+        print("=== agregar_logro por modo de almacenamiento ===")
+        bench_altas(args.registros)
+
+    if "columnar" in args.bench:
+        for tamanio in args.registros:
+            print(f"\n=== Estadisticas: lista vs columnar ({tamanio} logros) ===")
+            bench_columnar(tamanio)
+
+    if "rachas" in args.bench:
+        print("\n=== Rachas: 10 años de datos diarios ===")
+        bench_rachas()
+
+    if "memoria" in args.bench:
+        for tamanio in args.registros:
+            print(f"\n=== Memoria por Logro ({tamanio} logros) ===")
+            bench_memoria(tamanio)
+
+    if "importacion" in args.bench:
+        for tamanio in args.registros:
+            print(f"\n=== Importación por lote ({tamanio} filas) ===")
+            bench_importacion(tamanio)
+
+    if "rangos" in args.bench:
+        for tamanio in args.registros:
+            print(f"\n=== Conteo por rango de fechas ({tamanio} logros) ===")
+            bench_rangos(tamanio)
+
+    if "snapshot" in args.bench:
+        for tamanio in args.registros:
+            print(f"\n=== Inicio en frío: JSON vs snapshot binario ({tamanio} logros) ===")
+            bench_snapshot(tamanio)
+
+    if "arranque" in args.bench:
+        print("\n=== Tiempo de importación de la CLI y la GUI ===")
+        if not bench_arranque():
+            sys.exit(1)
+
+    if "dashboard" in args.bench:
+        print("\n=== Dashboard embebido: actualización tras un alta ===")
+        if not all([bench_dashboard(tamanio) for tamanio in args.registros]):
+            sys.exit(1)
+
+    if "suite" in args.bench:
+        print("\n=== Suite: gestor, estadísticas y gráficos ===")
+        sin_regresiones = ejecutar_suite(
+            args.registros, args.salida, args.baseline, args.guardar_baseline, args.tolerancia,
+            modo=args.modo, semilla=args.semilla, sesgo=args.sesgo, dias=args.dias
+        )
+        if not sin_regresiones:
+            sys.exit(1)
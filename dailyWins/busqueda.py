@@ -0,0 +1,241 @@
+import heapq
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from functools import lru_cache
+from indice_fechas import limites_en_minutos
+
+# Palabras demasiado frecuentes para filtrar (se ignoran en las
+# búsquedas por palabras, pero sí cuentan dentro de una frase)
+PALABRAS_VACIAS = frozenset(
+    "a al con de del el en la las lo los mi mis para por que se sin su sus un una uno unos y o e".split()
+)
+
+# Filtros admitidos dentro de la consulta: categoria:salud desde:2025-01-01 hasta:2025-01-31
+_FILTRO = re.compile(r'\b(categoria|desde|hasta):(\S+)')
+_FRASE = re.compile(r'"([^"]*)"')
+_PALABRA = re.compile(r'\w+')
+
+
+def normalizar(texto):
+    """
+    Pasa un texto a minúsculas y le quita tildes y diéresis
+    ("Estudié" -> "estudie"), conservando la ñ.
+
+    Args:
+        texto (str): Texto a normalizar
+
+    Returns:
+        str: Texto normalizado
+    """
+    texto = unicodedata.normalize('NFD', texto.casefold().replace('ñ', '\0'))
+    return ''.join(c for c in texto if not unicodedata.combining(c)).replace('\0', 'ñ')
+
+
+@lru_cache(maxsize=1 << 16)
+def tokenizar(texto):
+    """
+    Separa un texto en palabras normalizadas (ver normalizar).
+    Las descripciones repetidas se tokenizan una sola vez (caché).
+
+    Args:
+        texto (str): Texto a tokenizar
+
+    Returns:
+        tuple[str]: Palabras en el orden del texto
+    """
+    return tuple(_PALABRA.findall(normalizar(texto)))
+
+
+def interpretar_consulta(consulta):
+    """
+    Interpreta el texto de una búsqueda.
+
+    Las palabras sueltas deben aparecer todas (AND), las frases entre
+    comillas deben aparecer seguidas y en orden, y los filtros
+    `categoria:`, `desde:` y `hasta:` (fechas YYYY-MM-DD) acotan el resultado.
+
+    Args:
+        consulta (str): Texto ingresado por el usuario
+
+    Returns:
+        tuple: (palabras, frases, filtros) con filtros = {categoria, desde, hasta}
+    
+    Raises:
+        ValueError: Si `desde:` o `hasta:` no es una fecha YYYY-MM-DD válida
+    """
+    filtros = {clave: valor for clave, valor in _FILTRO.findall(consulta)}
+    for clave in ('desde', 'hasta'):
+        if clave in filtros:
+            try:
+                datetime.strptime(filtros[clave], "%Y-%m-%d")
+            except ValueError:
+                raise ValueError(
+                    f"Fecha inválida en {clave}:{filtros[clave]} (usa el formato YYYY-MM-DD)"
+                ) from None
+    consulta = _FILTRO.sub(' ', consulta)
+
+    frases = [tokenizar(frase) for frase in _FRASE.findall(consulta)]
+    frases = [frase for frase in frases if frase]
+    palabras = list(tokenizar(_FRASE.sub(' ', consulta)))
+    if 'categoria' in filtros:
+        filtros['categoria'] = filtros['categoria'].lower()
+    return palabras, frases, filtros
+
+
+def _contiene(frase, palabras):
+    """True si `frase` aparece seguida y en orden dentro de `palabras`."""
+    largo = len(frase)
+    return any(palabras[i:i + largo] == frase for i in range(len(palabras) - largo + 1))
+
+
+class IndiceTexto:
+    """
+    Índice invertido sobre las descripciones de los logros.
+
+    Cada palabra normalizada apunta a la lista ordenada de posiciones
+    de los logros que la contienen, así que una búsqueda solo recorre
+    las listas de sus palabras (empezando por la más corta) en lugar
+    del historial completo. Las frases se verifican solo sobre los
+    candidatos que ya contienen todas sus palabras.
+
+    Se suscribe a un GestorLogros y se actualiza con cada logro nuevo.
+    """
+
+    def __init__(self, gestor):
+        """
+        Constructor del índice.
+
+        Args:
+            gestor (GestorLogros): Gestor cuyo historial se indexa
+        """
+        self.gestor = gestor
+        self.reconstruir()
+        gestor.suscribir(self.agregar, self.reconstruir)
+
+    def reconstruir(self):
+        """Indexa de nuevo todo el historial del gestor."""
+        self.logros = []
+        self.minutos = array('i')  # Minuto de cada logro, para ordenar y filtrar sin atributos
+        self.postings = {}  # {palabra: array de posiciones en self.logros}
+        for logro in self.gestor.iterar_logros():
+            self.agregar(logro)
+
+    def agregar(self, logro):
+        """
+        Indexa un logro nuevo (solo sus palabras, sin tocar el resto).
+
+        Args:
+            logro (Logro): Logro recién agregado
+        """
+        posicion = len(self.logros)
+        self.logros.append(logro)
+        self.minutos.append(logro.minuto)
+        for palabra in set(tokenizar(logro.descripcion)):
+            lista = self.postings.get(palabra)
+            if lista is None:
+                lista = self.postings[palabra] = array('I')
+            lista.append(posicion)
+
+    def _candidatos(self, palabras):
+        """
+        Posiciones de los logros que contienen todas las palabras.
+
+        Args:
+            palabras (set[str]): Palabras normalizadas
+
+        Returns:
+            list[int]: Posiciones ordenadas
+        """
+        listas = sorted((self.postings.get(palabra, ()) for palabra in palabras), key=len)
+        if not listas or not listas[0]:
+            return []
+
+        candidatos = listas[0]
+        for lista in listas[1:]:
+            if len(candidatos) * 20 < len(lista):
+                # Pocos candidatos: búsqueda binaria de cada uno en la lista larga
+                candidatos = [
+                    posicion for posicion in candidatos
+                    if (i := bisect_left(lista, posicion)) < len(lista) and lista[i] == posicion
+                ]
+            else:
+                # Listas parecidas: intersección de conjuntos (recorrido en C)
+                candidatos = sorted(set(candidatos).intersection(lista))
+            if not candidatos:
+                break
+        return list(candidatos)
+
+    def buscar(self, consulta, categoria=None, desde=None, hasta=None, limite=50):
+        """
+        Busca logros por su descripción.
+
+        Args:
+            consulta (str): Palabras (todas deben aparecer), frases entre
+                comillas y filtros opcionales (ver interpretar_consulta)
+            categoria (str): Solo logros de esta categoría
+            desde (str): Primera fecha (YYYY-MM-DD), inclusive
+            hasta (str): Última fecha (YYYY-MM-DD), inclusive
+            limite (int): Máximo de logros retornados; None = todos
+
+        Returns:
+            tuple: (total de coincidencias, list[Logro] más recientes primero)
+        
+        Raises:
+            ValueError: Si un filtro de fecha de la consulta no es válido
+        """
+        palabras, frases, filtros = interpretar_consulta(consulta)
+        categoria = filtros.get('categoria', categoria)
+        desde = filtros.get('desde', desde)
+        hasta = filtros.get('hasta', hasta)
+
+        requeridas = {palabra for palabra in palabras if palabra not in PALABRAS_VACIAS}
+        if not requeridas and not frases:
+            requeridas = set(palabras)  # La consulta solo tenía palabras vacías
+        for frase in frases:
+            requeridas.update(frase)
+        if not requeridas:
+            return 0, []
+
+        candidatos = self._candidatos(requeridas)
+
+        if categoria is not None or desde is not None or hasta is not None:
+            inicio, fin = limites_en_minutos(desde, hasta)
+            candidatos = [
+                posicion for posicion in candidatos
+                if (categoria is None or self.logros[posicion].categoria == categoria)
+                and (inicio is None or self.minutos[posicion] >= inicio)
+                and (fin is None or self.minutos[posicion] < fin)
+            ]
+
+        if frases:
+            candidatos = [
+                posicion for posicion in candidatos
+                if all(_contiene(frase, tokenizar(self.logros[posicion].descripcion))
+                       for frase in frases)
+            ]
+
+        minuto = self.minutos.__getitem__
+        if limite is None:
+            elegidos = sorted(candidatos, key=minuto, reverse=True)
+        else:
+            # Las posiciones siguen casi siempre el orden de registro: al recorrer
+            # desde el final los más recientes entran primero al heap
+            elegidos = heapq.nlargest(limite, reversed(candidatos), key=minuto)
+        return len(candidatos), [self.logros[posicion] for posicion in elegidos]
+
+
+# ===== PRUEBA DE LA CLASE (Eliminar después) =====
+if __name__ == "__main__":
+    from gestor_logros import GestorLogros
+
+    gestor = GestorLogros()
+    indice = IndiceTexto(gestor)
+
+    for consulta in ["estudie", "Estudié python", '"hice 20"', "categoria:salud flexiones"]:
+        total, logros = indice.buscar(consulta, limite=3)
+        print(f"{consulta!r}: {total} resultado(s)")
+        for logro in logros:
+            print(f"   {logro}")
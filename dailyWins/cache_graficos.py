@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+
+class CacheGraficos:
+    """
+    Caché de gráficos ya renderizados, direccionada por contenido.
+
+    Cada imagen se guarda bajo la huella (SHA-256) de los datos
+    agregados con los que se dibujó, así que si los datos no cambian
+    volver a abrir un gráfico es una búsqueda en lugar de un dibujado.
+    Se mantiene en memoria y, opcionalmente, en disco; ambos niveles
+    descartan lo usado hace más tiempo (LRU) al superar su tamaño máximo.
+    """
+
+    def __init__(self, directorio=None, max_memoria=32 * 2**20, max_disco=256 * 2**20):
+        """
+        Constructor de la caché.
+
+        Args:
+            directorio (str): Carpeta de la caché en disco; None = solo memoria
+            max_memoria (int): Bytes máximos de imágenes en memoria
+            max_disco (int): Bytes máximos de imágenes en disco
+        """
+        self.directorio = directorio
+        self.max_memoria = max_memoria
+        self.max_disco = max_disco
+        self._memoria = OrderedDict()  # {huella: bytes}, del más viejo al más reciente
+        self._bytes_memoria = 0
+        self.aciertos = 0
+        self.fallos = 0
+
+        if directorio is not None:
+            os.makedirs(directorio, exist_ok=True)
+
+    @staticmethod
+    def huella(*partes):
+        """
+        Calcula la huella de los datos de un gráfico.
+
+        Args:
+            *partes: Valores serializables en JSON (nombre del gráfico,
+                conteos, ventana de fechas, fecha de hoy, formato...)
+
+        Returns:
+            str: Huella hexadecimal
+        """
+        texto = json.dumps(partes, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(texto.encode('utf-8')).hexdigest()
+
+    def _ruta(self, huella):
+        return os.path.join(self.directorio, huella + ".img")
+
+    def obtener(self, huella):
+        """
+        Busca una imagen en memoria y luego en disco.
+
+        Args:
+            huella (str): Huella de los datos
+
+        Returns:
+            bytes: Imagen renderizada, o None si no está en caché
+        """
+        datos = self._memoria.get(huella)
+        if datos is not None:
+            self._memoria.move_to_end(huella)
+            self.aciertos += 1
+            return datos
+
+        if self.directorio is not None and os.path.exists(self._ruta(huella)):
+            try:
+                with open(self._ruta(huella), 'rb') as f:
+                    datos = f.read()
+                os.utime(self._ruta(huella))  # Marcar como usado recientemente
+                self._guardar_en_memoria(huella, datos)
+                self.aciertos += 1
+                return datos
+            except OSError as e:
+                print(f"Error al leer caché de gráficos: {e}")
+
+        self.fallos += 1
+        return None
+
+    def guardar(self, huella, datos):
+        """
+        Guarda una imagen renderizada en memoria y en disco.
+
+        Args:
+            huella (str): Huella de los datos
+            datos (bytes): Imagen renderizada
+        """
+        self._guardar_en_memoria(huella, datos)
+        if self.directorio is None:
+            return
+
+        try:
+            with open(self._ruta(huella), 'wb') as f:
+                f.write(datos)
+            self._recortar_disco()
+        except OSError as e:
+            print(f"Error al escribir caché de gráficos: {e}")
+
+    def _guardar_en_memoria(self, huella, datos):
+        """Agrega una imagen a la memoria, descartando las menos usadas."""
+        if huella in self._memoria:
+            self._bytes_memoria -= len(self._memoria.pop(huella))
+        self._memoria[huella] = datos
+        self._bytes_memoria += len(datos)
+
+        while self._bytes_memoria > self.max_memoria and len(self._memoria) > 1:
+            _, descartada = self._memoria.popitem(last=False)
+            self._bytes_memoria -= len(descartada)
+
+    def _recortar_disco(self):
+        """Borra las imágenes usadas hace más tiempo hasta respetar max_disco."""
+        entradas = []
+        for nombre in os.listdir(self.directorio):
+            if nombre.endswith(".img"):
+                ruta = os.path.join(self.directorio, nombre)
+                estado = os.stat(ruta)
+                entradas.append((estado.st_mtime, estado.st_size, ruta))
+
+        total = sum(tamanio for _, tamanio, _ in entradas)
+        for _, tamanio, ruta in sorted(entradas):
+            if total <= self.max_disco:
+                break
+            os.remove(ruta)
+            total -= tamanio
+
+    def info(self):
+        """
+        Resume el uso de la caché.
+
+        Returns:
+            dict: {aciertos, fallos, entradas_memoria, bytes_memoria}
+        """
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "entradas_memoria": len(self._memoria),
+            "bytes_memoria": self._bytes_memoria,
+        }
+
+
+# ===== PRUEBA DE LA CLASE (Eliminar después) =====
+if __name__ == "__main__":
+    cache = CacheGraficos(max_memoria=10)
+
+    clave = CacheGraficos.huella("categorias", {"salud": 3}, "png")
+    print(f"Antes: {cache.obtener(clave)}")
+    cache.guardar(clave, b"imagen")
+    print(f"Después: {cache.obtener(clave)}")
+    print(cache.info())
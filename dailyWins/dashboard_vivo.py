@@ -0,0 +1,149 @@
+import time
+from datetime import date, timedelta
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from perfilado import medido
+
+COLORES = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6']
+
+
+class DashboardVivo:
+    """
+    Dashboard embebido en una ventana Tk (FigureCanvasTkAgg).
+
+    La figura se construye una sola vez. Al registrar un logro solo se
+    cambian los datos de los artistas ya creados (alturas de barras,
+    datos de la línea, textos) y se pide un redibujo con draw_idle():
+    Tk lo hace cuando queda libre y junta varios pedidos seguidos en
+    uno solo, así que mostrar() no bloquea la ventana mientras dibuja.
+
+    Leer las estadísticas (datos) y dibujar (mostrar) están separados:
+    la interfaz calcula los datos en su hilo de trabajo y solo dibuja
+    en el hilo de Tk. actualizar() hace ambas cosas en el mismo hilo.
+    """
+
+    DIAS_TENDENCIA = 14
+
+    def __init__(self, contenedor, estadisticas, categorias):
+        """
+        Constructor del dashboard. El lienzo arranca vacío: los datos
+        llegan con mostrar() o actualizar().
+
+        Args:
+            contenedor (tk.Widget): Frame donde se embebe el lienzo;
+                None = lienzo Agg sin ventana (para medir el redibujo)
+            estadisticas (Estadisticas): Fuente de los datos mostrados
+            categorias (list[str]): Categorías con barra propia
+        """
+        self.stats = estadisticas
+        self.ultimo_redibujo_ms = 0.0
+        self._primer_dia = None  # Primer día de la tendencia rotulada
+
+        self.figura = Figure(figsize=(8, 4), dpi=100)
+        self.ax_barras = self.figura.add_subplot(1, 2, 1)
+        self.ax_tendencia = self.figura.add_subplot(1, 2, 2)
+        self.resumen = self.figura.text(0.5, 0.96, "", ha='center', va='top',
+                                        fontsize=12, fontweight='bold')
+
+        self._crear_barras(categorias)
+        self._crear_tendencia()
+        self.figura.tight_layout(rect=(0, 0, 1, 0.9))  # Layout solo al crear
+
+        if contenedor is None:
+            self.lienzo = FigureCanvasAgg(self.figura)
+        else:
+            self.lienzo = FigureCanvasTkAgg(self.figura, master=contenedor)
+            self.lienzo.get_tk_widget().pack(fill="both", expand=True)
+
+    def _crear_barras(self, categorias):
+        """Crea una barra (y su etiqueta de valor) por categoría."""
+        self.categorias = list(categorias)
+        self.ax_barras.clear()
+        self.ax_barras.set_title('Logros por Categoría', fontsize=11, fontweight='bold')
+
+        self.barras = self.ax_barras.bar(
+            [categoria.capitalize() for categoria in self.categorias],
+            [0] * len(self.categorias),
+            color=[COLORES[i % len(COLORES)] for i in range(len(self.categorias))]
+        )
+        self.etiquetas = [
+            self.ax_barras.text(barra.get_x() + barra.get_width() / 2, 0, "0",
+                                ha='center', va='bottom')
+            for barra in self.barras
+        ]
+
+    def _crear_tendencia(self):
+        """Crea la línea de logros por día de los últimos días."""
+        self.ax_tendencia.set_title(f'Últimos {self.DIAS_TENDENCIA} días',
+                                    fontsize=11, fontweight='bold')
+        self.linea, = self.ax_tendencia.plot(
+            range(self.DIAS_TENDENCIA), [0] * self.DIAS_TENDENCIA,
+            marker='o', linewidth=2, markersize=5, color='#3498db'
+        )
+        self.ax_tendencia.set_xticks(range(0, self.DIAS_TENDENCIA, 2))
+        self.ax_tendencia.grid(True, alpha=0.3)
+
+    def datos(self):
+        """
+        Lee de las estadísticas lo que muestra el dashboard (puede
+        correr fuera del hilo de Tk).
+
+        Returns:
+            tuple: (conteo por categoría, días de la tendencia,
+                cantidades por día, texto del resumen)
+        """
+        hoy = date.today()
+        dias = [hoy - timedelta(days=i) for i in range(self.DIAS_TENDENCIA - 1, -1, -1)]
+        por_dia = self.stats.logros_por_dia_en_rango(dias[0].isoformat(), dias[-1].isoformat())
+        cantidades = [por_dia.get(dia.isoformat(), 0) for dia in dias]
+        resumen = (
+            f"Total: {self.stats.contar_total()}   |   "
+            f"Racha: {self.stats.calcular_racha()} día(s)   |   "
+            f"Esta semana: {self.stats.logros_ultima_semana()}"
+        )
+        return self.stats.contar_por_categoria(), dias, cantidades, resumen
+
+    @medido
+    def mostrar(self, datos):
+        """
+        Actualiza los artistas con los datos dados y pide el redibujo
+        (hilo de Tk). Deja en `ultimo_redibujo_ms` lo que tardó; con el
+        lienzo Agg draw_idle() dibuja en el acto, así que incluye el dibujo.
+
+        Args:
+            datos (tuple): Resultado de datos()
+        """
+        inicio = time.perf_counter()
+        conteo, dias, cantidades, resumen = datos
+
+        # Barras por categoría (si aparece una categoría nueva se recrean)
+        nuevas = [categoria for categoria in conteo if categoria not in self.categorias]
+        if nuevas:
+            self._crear_barras(self.categorias + nuevas)
+
+        valores = [conteo.get(categoria, 0) for categoria in self.categorias]
+        for barra, etiqueta, valor in zip(self.barras, self.etiquetas, valores):
+            barra.set_height(valor)
+            etiqueta.set_y(valor)
+            etiqueta.set_text(str(valor))
+        self.ax_barras.set_ylim(0, max(valores + [1]) * 1.15)
+
+        # Tendencia: la ventana avanza si cambió el día (solo entonces se
+        # vuelven a rotular las fechas, que crea textos nuevos)
+        self.linea.set_ydata(cantidades)
+        self.ax_tendencia.set_ylim(0, max(cantidades + [1]) * 1.15)
+        if dias[0] != self._primer_dia:
+            self._primer_dia = dias[0]
+            self.ax_tendencia.set_xticklabels(
+                [dias[i].strftime('%d/%m') for i in range(0, self.DIAS_TENDENCIA, 2)]
+            )
+
+        self.resumen.set_text(resumen)
+
+        self.lienzo.draw_idle()
+        self.ultimo_redibujo_ms = (time.perf_counter() - inicio) * 1e3
+
+    def actualizar(self):
+        """Lee los datos actuales y redibuja, todo en el hilo que llama."""
+        self.mostrar(self.datos())
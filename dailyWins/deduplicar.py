@@ -0,0 +1,69 @@
+import json
+import os
+from almacenamiento import iterar_json, BackendSegmentos
+from escritura_atomica import archivo_atomico
+
+
+def deduplicar_json(origen, destino=None):
+    """
+    Elimina los logros repetidos (misma descripción, categoría, fecha y
+    hora) de un logros.json en una sola pasada, conservando la primera
+    aparición y el orden. Se lee y se escribe en streaming: en memoria
+    solo quedan las claves ya vistas.
+
+    Args:
+        origen (str): logros.json a limpiar
+        destino (str): Archivo de salida; None = reemplazar `origen`
+            (de forma atómica, al terminar)
+
+    Returns:
+        tuple: (cantidad de logros leídos, cantidad de duplicados eliminados)
+    """
+    vistos = set()
+    leidos = 0
+    with archivo_atomico(destino or origen) as f:
+        f.write("[")
+        for item in iterar_json(origen):
+            leidos += 1
+            clave = (item['descripcion'], item['categoria'], item['fecha'], item['hora'])
+            if clave in vistos:
+                continue
+
+            # Mismo formato que json.dump(..., indent=2) de la lista completa
+            f.write(",\n  " if vistos else "\n  ")
+            f.write(json.dumps(item, ensure_ascii=False, indent=2).replace("\n", "\n  "))
+            vistos.add(clave)
+        f.write("\n]" if vistos else "]")
+    return leidos, leidos - len(vistos)
+
+
+def deduplicar_segmentos(directorio):
+    """
+    Elimina los logros repetidos de un almacenamiento por segmentos
+    (modo "segmentos") y reescribe su manifiesto en el mismo paso.
+
+    Args:
+        directorio (str): Carpeta de los segmentos y el manifiesto
+
+    Returns:
+        tuple: (cantidad de logros leídos, cantidad de duplicados eliminados)
+    """
+    backend = BackendSegmentos(directorio)
+    backend.cargar()
+    return backend.deduplicar()
+
+
+# ===== PUNTO DE ENTRADA =====
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) not in (2, 3) or (os.path.isdir(sys.argv[1]) and len(sys.argv) == 3):
+        print("Uso: python deduplicar.py <logros.json> [salida.json]")
+        print("     python deduplicar.py <carpeta_segmentos>")
+        sys.exit(1)
+
+    if os.path.isdir(sys.argv[1]):
+        leidos, eliminados = deduplicar_segmentos(sys.argv[1])
+    else:
+        leidos, eliminados = deduplicar_json(*sys.argv[1:])
+    print(f"✅ {eliminados} duplicados eliminados de {leidos} logros")
@@ -0,0 +1,42 @@
+import os
+from contextlib import contextmanager
+
+
+@contextmanager
+def archivo_atomico(destino, modo='w'):
+    """
+    Abre un archivo temporal que, al cerrar el bloque sin errores,
+    reemplaza a `destino` de forma atómica: se escribe a disco (fsync)
+    y se renombra sobre el original. Un corte durante la escritura deja
+    intacta la versión anterior en lugar de un archivo truncado.
+
+    Args:
+        destino (str): Ruta del archivo a reemplazar
+        modo (str): 'w' (texto UTF-8) o 'wb'
+
+    Yields:
+        file: Archivo temporal abierto para escribir
+    """
+    temporal = destino + ".tmp"
+    try:
+        with open(temporal, modo, encoding=None if 'b' in modo else 'utf-8') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, destino)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+    _sincronizar_directorio(os.path.dirname(os.path.abspath(destino)))
+
+
+def _sincronizar_directorio(directorio):
+    """Persiste el renombrado (entrada de directorio) en sistemas POSIX."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Windows no permite abrir directorios
+    descriptor = os.open(directorio, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
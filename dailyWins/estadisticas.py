@@ -1,5 +1,41 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from collections import Counter
+from functools import wraps
+from rachas import MotorRachas
+from indice_fechas import IndiceFechas
+from perfilado import medido
+
+
+def memoizado(metodo):
+    """
+    Memoriza el resultado de un método de Estadisticas.
+    Cada entrada queda sellada con la versión de la fuente y la fecha
+    de hoy: un logro nuevo, una recarga o el cambio de día invalidan
+    toda la caché. Sin una fuente versionada se calcula siempre.
+    Los dict y listas retornados se comparten: no deben modificarse.
+    
+    Args:
+        metodo (callable): Método a memorizar (argumentos hashables)
+    
+    Returns:
+        callable: Método envuelto
+    """
+    @wraps(metodo)
+    def envoltura(self, *args, **kwargs):
+        if not self._verificar_vigencia():
+            return metodo(self, *args, **kwargs)
+        
+        clave = (metodo.__name__, args, tuple(sorted(kwargs.items())))
+        if clave in self._cache:
+            self.aciertos += 1
+            return self._cache[clave]
+        
+        self.fallos += 1
+        resultado = metodo(self, *args, **kwargs)
+        self._cache[clave] = resultado
+        return resultado
+    return envoltura
+
 
 class Estadisticas:
     """
@@ -7,15 +43,82 @@ class Estadisticas:
     Responsable de análisis de datos y generación de reportes.
     """
     
-    def __init__(self, logros):
+    def __init__(self, logros=None, fuente=None):
         """
         Constructor de estadísticas.
         
         Args:
             logros (list[Logro]): Lista de logros a analizar
+            fuente (GestorLogros): Origen que resuelve las consultas
+                agregadas (totales, conteos por categoría, por día y por
+                ventana de fechas) sin recorrer la lista de logros.
+                Si no se indica, se calcula todo sobre `logros`.
         """
-        self.logros = logros
+        self._logros = logros
+        self.fuente = fuente
+        self._rachas = None
+        self._indice = None
+        
+        # Caché de resultados sellada con (versión de la fuente, fecha)
+        self._cache = {}
+        self._sello = None
+        self.aciertos = 0
+        self.fallos = 0
     
+    def _verificar_vigencia(self):
+        """
+        Descarta los resultados memorizados si la fuente cambió de
+        versión o cambió el día.
+        
+        Returns:
+            bool: True si la fuente está versionada (se puede memorizar)
+        """
+        version = getattr(self.fuente, "version", None)
+        if version is None:
+            return False
+        
+        sello = (version, date.today())
+        if sello != self._sello:
+            self._cache.clear()
+            self._rachas = None
+            self._sello = sello
+        return True
+    
+    def info_cache(self):
+        """
+        Resume el uso de la caché de resultados.
+        
+        Returns:
+            dict: {aciertos, fallos, entradas}
+        """
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "entradas": len(self._cache),
+        }
+    
+    @property
+    def logros(self):
+        """list[Logro]: Logros analizados (se piden a la fuente al usarlos)."""
+        if self._logros is None:
+            self._logros = self.fuente.obtener_todos() if self.fuente is not None else []
+        return self._logros
+    
+    @medido
+    @memoizado
+    def contar_total(self):
+        """
+        Cuenta el total de logros analizados.
+        
+        Returns:
+            int: Cantidad total de logros
+        """
+        if self.fuente is not None:
+            return self.fuente.contar_total()
+        return len(self.logros)
+    
+    @medido
+    @memoizado
     def contar_por_categoria(self):
         """
         Cuenta cuántos logros hay en cada categoría.
@@ -23,9 +126,63 @@ class Estadisticas:
         Returns:
             dict: {categoria: cantidad}
         """
+        if self.fuente is not None:
+            return self.fuente.contar_por_categoria()
+        
         categorias = [logro.categoria for logro in self.logros]
         return dict(Counter(categorias))
     
+    def _indice_fechas(self):
+        """
+        Índice ordenado por fecha de la lista analizada (sin fuente).
+        Se construye una vez y resuelve cada rango por búsqueda binaria.
+        
+        Returns:
+            IndiceFechas: Índice de los logros
+        """
+        if self._indice is None:
+            self._indice = IndiceFechas(self.logros)
+        return self._indice
+    
+    @medido
+    @memoizado
+    def contar_en_rango(self, desde=None, hasta=None):
+        """
+        Cuenta logros entre dos fechas (ambas inclusive).
+        
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD); None = sin límite
+            hasta (str): Última fecha (YYYY-MM-DD); None = sin límite
+        
+        Returns:
+            int: Cantidad de logros en el rango
+        """
+        if self.fuente is not None:
+            return self.fuente.contar_en_rango(desde, hasta)
+        
+        return self._indice_fechas().contar_en_rango(desde, hasta)
+    
+    @medido
+    @memoizado
+    def logros_por_dia_en_rango(self, desde=None, hasta=None):
+        """
+        Agrupa por fecha los logros de un rango.
+        
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD); None = sin límite
+            hasta (str): Última fecha (YYYY-MM-DD); None = sin límite
+        
+        Returns:
+            dict: {fecha: cantidad} de los días con logros en el rango
+        """
+        if self.fuente is not None:
+            return self.fuente.logros_por_dia_en_rango(desde, hasta)
+        
+        logros = self._indice_fechas().obtener_en_rango(desde, hasta)
+        return dict(Counter(logro.fecha for logro in logros))
+    
+    @medido
+    @memoizado
     def calcular_racha(self):
         """
         Calcula la racha actual de días consecutivos con logros.
@@ -33,27 +190,67 @@ class Estadisticas:
         Returns:
             int: Número de días consecutivos (hasta hoy)
         """
-        if not self.logros:
-            return 0
+        return self.motor_rachas().racha_actual()
+    
+    @medido
+    @memoizado
+    def racha_mas_larga(self):
+        """
+        Calcula la racha más larga de toda la historia.
         
-        # Obtener fechas únicas ordenadas
-        fechas = sorted(set(logro.fecha for logro in self.logros), reverse=True)
+        Returns:
+            int: Máximo de días consecutivos con logros
+        """
+        return self.motor_rachas().mas_larga
+    
+    @medido
+    @memoizado
+    def racha_al(self, fecha):
+        """
+        Calcula la racha vigente en una fecha dada.
         
-        # Verificar racha desde hoy hacia atrás
-        racha = 0
-        fecha_actual = datetime.now().date()
+        Args:
+            fecha (str): Fecha en formato YYYY-MM-DD
         
-        for fecha_str in fechas:
-            fecha_logro = datetime.strptime(fecha_str, "%Y-%m-%d").date()
-            diferencia = (fecha_actual - fecha_logro).days
-            
-            if diferencia == racha:
-                racha += 1
-            else:
-                break
+        Returns:
+            int: Días consecutivos con logros que terminan en esa fecha
+        """
+        dia = datetime.strptime(fecha, "%Y-%m-%d").toordinal()
+        return self.motor_rachas().racha_al(dia)
+    
+    @medido
+    @memoizado
+    def intervalos_racha(self):
+        """
+        Lista todas las rachas de días consecutivos.
+        
+        Returns:
+            list[tuple]: (fecha_inicio, fecha_fin, dias) por racha
+        """
+        return self.motor_rachas().intervalos()
+    
+    def motor_rachas(self):
+        """
+        Obtiene el índice de rachas de los logros analizados.
+        Si la fuente mantiene uno en vivo se reutiliza; si no, se
+        construye una vez a partir de los días activos.
         
-        return racha
+        Returns:
+            MotorRachas: Índice de rachas
+        """
+        if hasattr(self.fuente, "rachas"):
+            return self.fuente.rachas
+        
+        self._verificar_vigencia()
+        if self._rachas is None:
+            if hasattr(self.fuente, "intervalos_racha"):
+                self._rachas = MotorRachas.desde_intervalos(*self.fuente.intervalos_racha())
+            else:
+                self._rachas = MotorRachas.desde_fechas(self.logros_por_dia())
+        return self._rachas
     
+    @medido
+    @memoizado
     def logros_ultima_semana(self):
         """
         Cuenta logros de los últimos 7 días.
@@ -64,8 +261,10 @@ class Estadisticas:
         fecha_limite = datetime.now() - timedelta(days=7)
         fecha_limite_str = fecha_limite.strftime("%Y-%m-%d")
         
-        return sum(1 for logro in self.logros if logro.fecha >= fecha_limite_str)
+        return self.contar_en_rango(fecha_limite_str)
     
+    @medido
+    @memoizado
     def logros_ultimo_mes(self):
         """
         Cuenta logros de los últimos 30 días.
@@ -76,8 +275,10 @@ class Estadisticas:
         fecha_limite = datetime.now() - timedelta(days=30)
         fecha_limite_str = fecha_limite.strftime("%Y-%m-%d")
         
-        return sum(1 for logro in self.logros if logro.fecha >= fecha_limite_str)
+        return self.contar_en_rango(fecha_limite_str)
     
+    @medido
+    @memoizado
     def categoria_favorita(self):
         """
         Identifica la categoría con más logros.
@@ -85,13 +286,15 @@ class Estadisticas:
         Returns:
             tuple: (categoria, cantidad) o (None, 0) si no hay logros
         """
-        if not self.logros:
+        conteo = self.contar_por_categoria()
+        if not conteo:
             return (None, 0)
         
-        conteo = self.contar_por_categoria()
         categoria_top = max(conteo.items(), key=lambda x: x[1])
         return categoria_top
     
+    @medido
+    @memoizado
     def promedio_diario(self):
         """
         Calcula el promedio de logros por día (desde el primer logro).
@@ -99,15 +302,13 @@ class Estadisticas:
         Returns:
             float: Promedio de logros diarios
         """
-        if not self.logros:
-            return 0.0
+        dias_activos = len(self.logros_por_dia())
         
-        fechas_unicas = set(logro.fecha for logro in self.logros)
-        dias_activos = len(fechas_unicas)
-        
-        return len(self.logros) / dias_activos if dias_activos > 0 else 0.0
+        return self.contar_total() / dias_activos if dias_activos > 0 else 0.0
     
 
+    @medido
+    @memoizado
     def logros_por_dia(self):
         """
         Agrupa logros por fecha.
@@ -115,11 +316,15 @@ class Estadisticas:
         Returns:
             dict: {fecha: cantidad}
         """
-        from collections import Counter
+        if self.fuente is not None:
+            return self.fuente.logros_por_dia()
+        
         fechas = [logro.fecha for logro in self.logros]
         return dict(Counter(fechas))
     
    
+    @medido
+    @memoizado
     def generar_reporte(self):
         """
         Genera un reporte completo en texto.
@@ -127,12 +332,13 @@ class Estadisticas:
         Returns:
             str: Reporte formateado con todas las estadísticas
         """
-        total = len(self.logros)
+        total = self.contar_total()
         
         if total == 0:
             return "📭 Aún no tienes logros registrados.\n💡 ¡Registra tu primer logro para comenzar!"
         
         racha = self.calcular_racha()
+        racha_max = self.racha_mas_larga()
         semana = self.logros_ultima_semana()
         mes = self.logros_ultimo_mes()
         cat_fav, cat_cantidad = self.categoria_favorita()
@@ -149,6 +355,7 @@ class Estadisticas:
 
 🔥 RACHA
    • Días consecutivos: {racha} día(s)
+   • Racha más larga: {racha_max} día(s)
    {"   🎉 ¡Sigue así!" if racha >= 3 else "   💪 ¡A por más días!"}
 
 📅 PERÍODO RECIENTE
@@ -178,8 +385,8 @@ if __name__ == "__main__":
     # Cargar logros existentes
     gestor = GestorLogros()
     
-    # Crear objeto estadísticas
-    stats = Estadisticas(gestor.obtener_todos())
+    # Crear objeto estadísticas (consultas resueltas por el gestor)
+    stats = Estadisticas(fuente=gestor)
     
     # Mostrar reporte completo
     print(stats.generar_reporte())
@@ -188,4 +395,5 @@ if __name__ == "__main__":
     print("\n--- PRUEBAS ADICIONALES ---")
     print(f"Racha actual: {stats.calcular_racha()} días")
     print(f"Logros última semana: {stats.logros_ultima_semana()}")
-    print(f"Categoría favorita: {stats.categoria_favorita()}")
\ No newline at end of file
+    print(f"Categoría favorita: {stats.categoria_favorita()}")
+    print(f"Caché: {stats.info_cache()}")
\ No newline at end of file
@@ -0,0 +1,180 @@
+from datetime import date
+from collections import Counter
+from rachas import MotorRachas
+
+
+class EstadisticasVivas:
+    """
+    Agregados de logros mantenidos en vivo.
+    Se suscribe a un GestorLogros y actualiza sus contadores con cada
+    logro nuevo, sin volver a recorrer el historial.
+
+    Implementa las consultas agregadas de una `fuente` de Estadisticas,
+    por lo que `Estadisticas(fuente=vivas)` genera reportes sin escanear.
+    """
+
+    def __init__(self, gestor):
+        """
+        Constructor de las estadísticas vivas.
+        Parte de los agregados del gestor y luego se actualiza por evento.
+
+        Args:
+            gestor (GestorLogros): Gestor cuyos cambios se siguen
+        """
+        self.gestor = gestor
+        self.reconstruir()
+        gestor.suscribir(self.registrar, self.reconstruir)
+
+    def reconstruir(self):
+        """
+        Recalcula todos los agregados a partir de los conteos del gestor
+        (por categoría y por día), que cada backend resuelve sin
+        materializar logros: GROUP BY en SQLite, el manifiesto en
+        segmentos, un recorrido en los modos JSON.
+        """
+        self.por_categoria = Counter(self.gestor.contar_por_categoria())
+        self.por_dia = Counter(self.gestor.logros_por_dia())
+        self.total = sum(self.por_categoria.values())
+        self.rachas = MotorRachas.desde_fechas(self.por_dia)
+
+    def registrar(self, logro):
+        """
+        Incorpora un logro nuevo a los agregados (O(1) amortizado).
+
+        Args:
+            logro (Logro): Logro recién agregado
+        """
+        self.total += 1
+        self.por_categoria[logro.categoria] += 1
+        self.por_dia[logro.fecha] += 1
+
+        if self.por_dia[logro.fecha] == 1:
+            # Primer logro del día: actualizar el índice de rachas
+            self.rachas.agregar_dia(logro.dia)
+
+    def calcular_racha(self):
+        """
+        Racha actual de días consecutivos con logros (hasta hoy).
+
+        Returns:
+            int: Número de días consecutivos
+        """
+        return self.rachas.racha_actual()
+
+    def dias_distintos(self):
+        """
+        Returns:
+            int: Cantidad de días con al menos un logro
+        """
+        return len(self.por_dia)
+
+    # ----- Consultas de fuente para Estadisticas -----
+
+    @property
+    def version(self):
+        """int: Versión de los datos (la del gestor seguido)."""
+        return self.gestor.version
+
+    def obtener_todos(self):
+        """
+        Returns:
+            list[Logro]: Historial completo (delegado al gestor)
+        """
+        return self.gestor.obtener_todos()
+
+    def contar_total(self):
+        """
+        Returns:
+            int: Cantidad total de logros
+        """
+        return self.total
+
+    def contar_por_categoria(self):
+        """
+        Returns:
+            dict: {categoria: cantidad}
+        """
+        return dict(self.por_categoria)
+
+    def logros_por_dia(self):
+        """
+        Returns:
+            dict: {fecha: cantidad}
+        """
+        return dict(self.por_dia)
+
+    def logros_por_dia_en_rango(self, desde=None, hasta=None):
+        """
+        Agrupa por fecha los logros de un rango.
+        Si el rango abarca menos días que los días activos, solo se
+        consultan los días del rango; si no, se filtran los días activos.
+
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD, inclusive) o None
+            hasta (str): Última fecha (YYYY-MM-DD, inclusive) o None
+
+        Returns:
+            dict: {fecha: cantidad} de los días con logros en el rango
+        """
+        if not self.por_dia:
+            return {}
+
+        primero = self.rachas.inicios[0]
+        ultimo = self.rachas.fines[-1]
+        inicio = primero if desde is None else max(primero, date.fromisoformat(desde).toordinal())
+        fin = ultimo if hasta is None else min(ultimo, date.fromisoformat(hasta).toordinal())
+
+        if fin < inicio:
+            return {}
+
+        if fin - inicio + 1 <= len(self.por_dia):
+            resultado = {}
+            for dia in range(inicio, fin + 1):
+                fecha = date.fromordinal(dia).isoformat()
+                cantidad = self.por_dia.get(fecha)
+                if cantidad:
+                    resultado[fecha] = cantidad
+            return resultado
+
+        return {
+            fecha: cantidad for fecha, cantidad in self.por_dia.items()
+            if (desde is None or fecha >= desde) and (hasta is None or fecha <= hasta)
+        }
+
+    def contar_en_rango(self, desde=None, hasta=None):
+        """
+        Cuenta los logros entre dos fechas (ambas inclusive).
+
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD) o None
+            hasta (str): Última fecha (YYYY-MM-DD) o None
+
+        Returns:
+            int: Cantidad de logros en el rango
+        """
+        if desde is None and hasta is None:
+            return self.total
+        return sum(self.logros_por_dia_en_rango(desde, hasta).values())
+
+    def obtener_en_rango(self, desde=None, hasta=None):
+        """
+        Returns:
+            list[Logro]: Logros del rango (delegado al índice del gestor)
+        """
+        return self.gestor.obtener_en_rango(desde, hasta)
+
+
+# ===== PRUEBA DE LA CLASE (Eliminar después) =====
+if __name__ == "__main__":
+    from gestor_logros import GestorLogros
+    from estadisticas import Estadisticas
+
+    gestor = GestorLogros()
+    vivas = EstadisticasVivas(gestor)
+    print(f"Total: {vivas.contar_total()} | Racha: {vivas.calcular_racha()}")
+
+    gestor.agregar_logro("Caminé 30 minutos", "salud")
+    print(f"Total: {vivas.contar_total()} | Racha: {vivas.calcular_racha()}")
+
+    # Reporte completo sin recorrer el historial
+    print(Estadisticas(fuente=vivas).generar_reporte())
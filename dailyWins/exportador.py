@@ -0,0 +1,79 @@
+import csv
+import json
+
+CAMPOS = ['descripcion', 'categoria', 'fecha', 'hora']
+
+
+def exportar_json(logros, destino):
+    """
+    Escribe los logros como arreglo JSON (mismo formato que logros.json),
+    uno a la vez, sin construir la lista completa en memoria.
+
+    Args:
+        logros (Iterable[Logro]): Logros a exportar (p. ej. gestor.iterar_logros())
+        destino (str): Ruta del archivo a generar
+
+    Returns:
+        int: Cantidad de logros exportados
+    """
+    cantidad = 0
+    with open(destino, 'w', encoding='utf-8') as f:
+        f.write("[")
+        for logro in logros:
+            item = json.dumps(logro.to_dict(), ensure_ascii=False, indent=2)
+            f.write(("," if cantidad else "") + "\n  " + item.replace("\n", "\n  "))
+            cantidad += 1
+        f.write("\n]" if cantidad else "]")
+    return cantidad
+
+
+def exportar_jsonl(logros, destino):
+    """
+    Escribe los logros en formato JSON Lines (un logro por línea).
+
+    Args:
+        logros (Iterable[Logro]): Logros a exportar
+        destino (str): Ruta del archivo a generar
+
+    Returns:
+        int: Cantidad de logros exportados
+    """
+    cantidad = 0
+    with open(destino, 'w', encoding='utf-8') as f:
+        for logro in logros:
+            f.write(json.dumps(logro.to_dict(), ensure_ascii=False) + "\n")
+            cantidad += 1
+    return cantidad
+
+
+def exportar_csv(logros, destino):
+    """
+    Escribe los logros en CSV con encabezado descripcion,categoria,fecha,hora.
+
+    Args:
+        logros (Iterable[Logro]): Logros a exportar
+        destino (str): Ruta del archivo a generar
+
+    Returns:
+        int: Cantidad de logros exportados
+    """
+    cantidad = 0
+    with open(destino, 'w', encoding='utf-8', newline='') as f:
+        escritor = csv.DictWriter(f, fieldnames=CAMPOS)
+        escritor.writeheader()
+        for logro in logros:
+            escritor.writerow(logro.to_dict())
+            cantidad += 1
+    return cantidad
+
+
+# ===== PRUEBA DE LAS FUNCIONES (Eliminar después) =====
+if __name__ == "__main__":
+    from gestor_logros import GestorLogros
+
+    # Sin cargar el historial: se recorre en streaming (mismo almacenamiento que main.py y gui.py)
+    gestor = GestorLogros(modo="segmentos", perezoso=True)
+
+    print(f"JSON:  {exportar_json(gestor.iterar_logros(), 'logros_export.json')} logros")
+    print(f"JSONL: {exportar_jsonl(gestor.iterar_logros(), 'logros_export.jsonl')} logros")
+    print(f"CSV:   {exportar_csv(gestor.iterar_logros(), 'logros_export.csv')} logros")
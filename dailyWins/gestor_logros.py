@@ -1,6 +1,10 @@
-import json
-import os
+from calendar import monthrange
 from logro import Logro
+from almacenamiento import crear_backend, BackendDiferido, CLAVES_ORDEN
+from perfilado import medido
+
+# Qué hacer con un logro idéntico (descripción, categoría, fecha y hora) a uno existente
+POLITICAS_DUPLICADOS = ("permitir", "avisar", "rechazar")
 
 class GestorLogros:
     """
@@ -8,17 +12,59 @@ class GestorLogros:
     Responsable de almacenamiento, recuperación y estadísticas.
     """
     
-    def __init__(self, archivo="logros.json"):
+    def __init__(self, archivo="logros.json", modo="json", backend=None, perezoso=False,
+                 ventana_escritura=None, duplicados="permitir"):
         """
         Constructor del gestor.
         
         Args:
             archivo (str): Nombre del archivo para persistencia
+            modo (str): "json" reescribe el archivo completo en cada alta;
+                "journal" agrega cada logro como una línea JSON a un
+                archivo de journal y solo reescribe el snapshot al compactar;
+                "sqlite" guarda los logros en una base SQLite indexada;
+                "segmentos" guarda un archivo por mes más un manifiesto y
+                solo abre los meses que cada consulta necesita;
+                "binario" guarda un snapshot binario de carga rápida;
+                "mapeado" lee ese snapshot en solo lectura mediante
+                memoria mapeada, sin construir objetos Logro
+            backend (BackendAlmacenamiento): Backend ya construido; si se
+                indica, tiene prioridad sobre archivo y modo
+            perezoso (bool): Si es True no se carga el historial al iniciar;
+                las consultas e iterar_logros() lo recorren en streaming,
+                lo que permite procesar historiales más grandes que la RAM
+            ventana_escritura (float): Si se indica, las altas retornan sin
+                escribir y un hilo persiste los cambios acumulados a lo
+                sumo esa cantidad de segundos después (modos json, journal
+                y binario); sincronizar() y cerrar() escriben lo pendiente
+            duplicados (str): Política ante un logro idéntico a uno ya
+                registrado: "permitir", "avisar" (se agrega e imprime un
+                aviso) o "rechazar" (no se agrega)
+        
+        Raises:
+            ValueError: Si la política de duplicados no existe
         """
-        self.logros = []
+        if duplicados not in POLITICAS_DUPLICADOS:
+            raise ValueError(f"Política de duplicados desconocida: {duplicados}")
+        
         self.archivo = archivo
-        self.cargar()  # Cargar logros existentes al iniciar
+        self.modo = modo
+        self.backend = backend if backend is not None else crear_backend(modo, archivo)
+        if ventana_escritura is not None:
+            self.backend = BackendDiferido(self.backend, ventana_escritura)
+        self._suscriptores = []
+        self.duplicados = duplicados
+        self._claves = {}  # Índice de duplicados: {mes: {Logro.clave}}, cada mes se arma al primer uso
+        self.version = 0  # Se incrementa con cada cambio en la colección
+        if not perezoso:
+            self.cargar()  # Cargar logros existentes al iniciar
+    
+    @property
+    def logros(self):
+        """list[Logro]: Todos los logros registrados."""
+        return self.backend.obtener_todos()
     
+    @medido
     def agregar_logro(self, descripcion, categoria):
         """
         Crea y agrega un nuevo logro a la colección.
@@ -28,13 +74,113 @@ class GestorLogros:
             categoria (str): Categoría del logro
         
         Returns:
-            Logro: El logro creado
+            Logro: El logro creado, o None si se rechazó por duplicado
         """
         nuevo_logro = Logro(descripcion, categoria)
-        self.logros.append(nuevo_logro)
-        self.guardar()  # Guardar automáticamente
+        if not self._admitir(nuevo_logro):
+            return None
+        
+        self.backend.agregar(nuevo_logro)  # Guardar automáticamente
+        
+        for al_agregar, _ in self._suscriptores:
+            al_agregar(nuevo_logro)
+        # La versión cambia recién con los suscriptores al día: una lectura
+        # que ya ve la versión nueva no puede memorizar agregados viejos
+        self.version += 1
         return nuevo_logro
     
+    @medido
+    def agregar_logros_lote(self, logros):
+        """
+        Agrega muchos logros ya construidos (con su fecha y hora
+        originales) y los persiste con una única escritura.
+        Los duplicados (también dentro del lote) siguen la política
+        configurada. Cada logro se registra en el índice al recibirlo.
+        
+        Args:
+            logros (Iterable[Logro]): Logros a agregar
+        
+        Returns:
+            int: Cantidad de logros agregados
+        """
+        lote = [logro for logro in logros if self._admitir(logro)]
+        if not lote:
+            return 0
+        
+        self.backend.agregar_lote(lote)  # Guardar una sola vez
+        
+        for al_agregar, _ in self._suscriptores:
+            for logro in lote:
+                al_agregar(logro)
+        self.version += 1
+        return len(lote)
+    
+    def _claves_del_mes(self, fecha):
+        """
+        Claves de los logros del mes de una fecha (un logro solo puede
+        repetir a otro de su mismo mes). El mes se lee la primera vez que
+        se necesita, solo él: en modo segmentos se abre un único archivo.
+        
+        Args:
+            fecha (str): Fecha del logro (YYYY-MM-DD)
+        
+        Returns:
+            set[tuple]: Claves de los logros registrados en ese mes
+        """
+        mes = fecha[:7]
+        claves = self._claves.get(mes)
+        if claves is None:
+            ultimo_dia = monthrange(int(mes[:4]), int(mes[5:]))[1]
+            claves = self._claves[mes] = {
+                logro.clave
+                for logro in self.backend.obtener_en_rango(f"{mes}-01", f"{mes}-{ultimo_dia:02d}")
+            }
+        return claves
+    
+    def es_duplicado(self, logro):
+        """
+        Indica si ya hay un logro idéntico registrado (solo lee su mes).
+        
+        Args:
+            logro (Logro): Logro a comprobar
+        
+        Returns:
+            bool: True si coinciden descripción, categoría, fecha y hora
+        """
+        return logro.clave in self._claves_del_mes(logro.fecha)
+    
+    def _admitir(self, logro):
+        """
+        Aplica la política de duplicados a un logro por agregar y, si se
+        admite, lo registra en el índice.
+        
+        Returns:
+            bool: True si el logro debe agregarse
+        """
+        if self.duplicados == "permitir":
+            if logro.fecha[:7] in self._claves:
+                self._claves[logro.fecha[:7]].add(logro.clave)
+            return True
+        
+        claves = self._claves_del_mes(logro.fecha)
+        if logro.clave in claves:
+            if self.duplicados == "rechazar":
+                return False
+            print(f"⚠️ Logro duplicado: {logro}")
+        claves.add(logro.clave)
+        return True
+    
+    def suscribir(self, al_agregar, al_recargar=None):
+        """
+        Registra funciones a invocar cuando cambia la colección.
+        
+        Args:
+            al_agregar (callable): Recibe cada Logro nuevo tras guardarlo
+            al_recargar (callable): Se invoca sin argumentos cuando el
+                historial se vuelve a cargar desde el almacenamiento
+        """
+        self._suscriptores.append((al_agregar, al_recargar))
+    
     def obtener_todos(self):
         """
         Retorna todos los logros registrados.
@@ -42,7 +188,18 @@ class GestorLogros:
         Returns:
             list[Logro]: Lista completa de logros
         """
-        return self.logros
+        return self.backend.obtener_todos()
+    
+    def iterar_logros(self):
+        """
+        Recorre todos los logros en orden de registro.
+        Si el historial no está en memoria se lee en streaming, sin
+        construir la lista completa.
+        
+        Returns:
+            Iterator[Logro]: Logros registrados
+        """
+        return self.backend.iterar_logros()
     
     def obtener_ultimos(self, n=5):
         """
@@ -54,7 +211,26 @@ class GestorLogros:
         Returns:
             list[Logro]: Últimos N logros (más recientes primero)
         """
-        return self.logros[-n:] if len(self.logros) >= n else self.logros
+        return self.backend.obtener_ultimos(n)
+    
+    def obtener_pagina(self, inicio, cantidad, categoria=None, orden="fecha", descendente=True):
+        """
+        Obtiene una página del historial filtrado y ordenado, para
+        mostrarlo de a partes sin materializar todos los logros.
+        
+        Args:
+            inicio (int): Posición del primer logro de la página
+            cantidad (int): Tamaño de la página
+            categoria (str): Solo logros de esta categoría; None = todas
+            orden (str): "fecha", "categoria" o "descripcion"
+            descendente (bool): True para ordenar de mayor a menor
+        
+        Returns:
+            list[Logro]: Logros de la página
+        """
+        if orden not in CLAVES_ORDEN:
+            raise ValueError(f"Orden desconocido: {orden}")
+        return self.backend.obtener_pagina(inicio, cantidad, categoria, orden, descendente)
     
     def contar_total(self):
         """
@@ -63,51 +239,124 @@ class GestorLogros:
         Returns:
             int: Cantidad total de logros
         """
-        return len(self.logros)
+        return self.backend.contar_total()
+    
+    def contar_en_rango(self, desde=None, hasta=None):
+        """
+        Cuenta los logros entre dos fechas usando el índice por fecha
+        (O(log n) en memoria; consulta indexada en SQLite).
+        
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD, inclusive); None = sin límite
+            hasta (str): Última fecha (YYYY-MM-DD, inclusive); None = sin límite
+        
+        Returns:
+            int: Cantidad de logros en el rango
+        """
+        return self.backend.contar_en_rango(desde, hasta)
+    
+    def obtener_en_rango(self, desde=None, hasta=None):
+        """
+        Obtiene los logros entre dos fechas usando el índice por fecha
+        (O(log n + k) en memoria).
+        
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD, inclusive); None = sin límite
+            hasta (str): Última fecha (YYYY-MM-DD, inclusive); None = sin límite
+        
+        Returns:
+            list[Logro]: Logros del rango, ordenados por fecha y hora
+        """
+        return self.backend.obtener_en_rango(desde, hasta)
+    
+    def logros_por_dia_en_rango(self, desde=None, hasta=None):
+        """
+        Agrupa por fecha los logros de un rango.
+        
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD, inclusive); None = sin límite
+            hasta (str): Última fecha (YYYY-MM-DD, inclusive); None = sin límite
+        
+        Returns:
+            dict: {fecha: cantidad}
+        """
+        return self.backend.logros_por_dia_en_rango(desde, hasta)
+    
+    def contar_por_categoria(self):
+        """
+        Cuenta cuántos logros hay en cada categoría.
+        
+        Returns:
+            dict: {categoria: cantidad}
+        """
+        return self.backend.contar_por_categoria()
     
+    def logros_por_dia(self):
+        """
+        Agrupa logros por fecha.
+        
+        Returns:
+            dict: {fecha: cantidad}
+        """
+        return self.backend.logros_por_dia()
+    
+    @medido
     def guardar(self):
         """
-        Guarda todos los logros en archivo JSON.
+        Guarda todos los logros en el almacenamiento configurado.
         
         Returns:
             bool: True si se guardó exitosamente
         """
-        try:
-            datos = [logro.to_dict() for logro in self.logros]
-            with open(self.archivo, 'w', encoding='utf-8') as f:
-                json.dump(datos, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            print(f"Error al guardar: {e}")
-            return False
+        return self.backend.guardar()
     
+    def sincronizar(self):
+        """
+        Escribe ya los cambios pendientes de la escritura diferida (flush).
+        Sin escritura diferida no hay nada pendiente.
+        
+        Returns:
+            bool: True si no quedaron cambios sin escribir
+        """
+        if hasattr(self.backend, "sincronizar"):
+            return self.backend.sincronizar()
+        return True
+    
+    def compactar(self):
+        """
+        Integra el journal en el snapshot JSON y lo vacía.
+        En los demás modos equivale a guardar().
+        
+        Returns:
+            bool: True si se compactó exitosamente
+        """
+        if hasattr(self.backend, "compactar"):
+            return self.backend.compactar()
+        return self.guardar()
+    
+    @medido
     def cargar(self):
         """
-        Carga los logros desde el archivo JSON.
+        Carga los logros desde el almacenamiento configurado.
         
         Returns:
             bool: True si se cargó exitosamente
         """
-        if not os.path.exists(self.archivo):
-            return False
-        
-        try:
-            with open(self.archivo, 'r', encoding='utf-8') as f:
-                datos = json.load(f)
-            
-            # Reconstruir objetos Logro desde el diccionario
-            self.logros = []
-            for item in datos:
-                logro = Logro(item['descripcion'], item['categoria'])
-                # Restaurar fecha y hora originales
-                logro.fecha = item['fecha']
-                logro.hora = item['hora']
-                self.logros.append(logro)
-            
-            return True
-        except Exception as e:
-            print(f"Error al cargar: {e}")
-            return False
+        cargado = self.backend.cargar()
+        self._claves = {}  # Se vuelve a armar con el historial recargado
+        
+        for _, al_recargar in self._suscriptores:
+            if al_recargar is not None:
+                al_recargar()
+        self.version += 1
+        return cargado
+    
+    def cerrar(self):
+        """
+        Escribe los cambios pendientes y libera los recursos del
+        almacenamiento (conexiones, archivos, hilo de escritura).
+        """
+        self.backend.cerrar()
         
 if __name__ == "__main__":
     # Crear gestor
@@ -1,10 +1,25 @@
+import base64
+import io
+import os
+import queue
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
+from concurrent.futures import ThreadPoolExecutor
+import perfilado
+perfilado.activar_desde_argumentos()  # --profile: antes de importar los módulos medidos
 from gestor_logros import GestorLogros
 from estadisticas import Estadisticas
+from estadisticas_vivas import EstadisticasVivas
 from visualizador import Visualizador
+from cache_graficos import CacheGraficos
+from almacenamiento import CLAVES_ORDEN
+from autocompletado import Autocompletado
 from datetime import datetime
 
+TAMANO_PAGINA = 200  # Logros pedidos al gestor por cada página del historial
+LIMITE_BUSQUEDA = 500  # Resultados de búsqueda mostrados en la tabla
+SUGERENCIAS_VISIBLES = 6  # Sugerencias mostradas bajo la descripción
+
 class DailyWinsGUI:
     """
     Interfaz gráfica de usuario para DailyWins.
@@ -12,19 +27,150 @@ class DailyWinsGUI:
     """
     
     def __init__(self):
-        """Constructor de la GUI."""
-        self.gestor = GestorLogros()
+        """
+        Constructor de la GUI.
+        La ventana aparece de inmediato; el historial se carga en segundo plano.
+        """
+        self.gestor = None  # Se asignan al terminar la carga
+        self.vivas = None
+        self.stats = None
+        self.buscador = None  # Índice de texto, se construye con la primera búsqueda
+        self.autocompletado = None  # Se arma en segundo plano tras cargar el historial
+        self.dashboard_vivo = None  # Se crea al abrir la pestaña de gráficos
+        self.cache_graficos = None  # Se crea junto a los datos al terminar la carga
         self.categorias = ["trabajo", "salud", "aprendizaje", "personal"]
         
+        # Carga, guardado y estadísticas corren en un único hilo de trabajo:
+        # el gestor se usa siempre desde el mismo hilo y en orden
+        self.ejecutor = ThreadPoolExecutor(max_workers=1)
+        self._resultados = queue.Queue()
+        self._pendientes = 0
+        
+        # Estado del historial paginado
+        self._orden = "fecha"
+        self._descendente = True
+        self._filtro = None
+        self._busqueda = ""  # Texto buscado; vacío = historial completo
+        self._cargados = 0
+        self._hay_mas = False
+        self._cargando_pagina = False
+        self._consulta = 0  # Cambia con cada filtro u orden nuevo
+        
         # Crear ventana principal
         self.root = tk.Tk()
         self.root.title("🎯 DailyWins - Registro de Logros")
         self.root.geometry("850x650")
         self.root.configure(bg="#f0f0f0")
+        self.root.protocol("WM_DELETE_WINDOW", self.cerrar)
         
         # Crear interfaz
         self.crear_widgets()
-        self.actualizar_dashboard()
+        self.root.after(50, self._procesar_resultados)
+        self.en_segundo_plano(self._cargar_historial, self._historial_cargado,
+                              "⏳ Cargando historial...")
+    
+    # ===== TRABAJO EN SEGUNDO PLANO =====
+    
+    def en_segundo_plano(self, tarea, al_terminar=None, mensaje="⏳ Procesando..."):
+        """
+        Ejecuta una tarea en el hilo de trabajo sin bloquear la ventana.
+        
+        Args:
+            tarea (callable): Función sin argumentos (corre fuera de Tk)
+            al_terminar (callable): Recibe el resultado; corre en el hilo de Tk
+            mensaje (str): Texto del indicador mientras la tarea está en curso;
+                None = no cambiar el indicador (tareas instantáneas)
+        """
+        self._pendientes += 1
+        if mensaje is not None:
+            self.label_estado.config(text=mensaje)
+        
+        futuro = self.ejecutor.submit(tarea)
+        futuro.add_done_callback(lambda f: self._resultados.put((f, al_terminar)))
+    
+    def _procesar_resultados(self):
+        """Entrega en el hilo de Tk los resultados de las tareas terminadas."""
+        while True:
+            try:
+                futuro, al_terminar = self._resultados.get_nowait()
+            except queue.Empty:
+                break
+            
+            self._pendientes -= 1
+            try:
+                resultado = futuro.result()
+            except Exception as e:
+                messagebox.showerror("Error", f"❌ {e}")
+                continue
+            if al_terminar is not None:
+                al_terminar(resultado)
+        
+        if self._pendientes == 0:
+            self.label_estado.config(text="")
+        self.root.after(50, self._procesar_resultados)
+    
+    def _cargar_historial(self):
+        """
+        Carga el historial y prepara las estadísticas (hilo de trabajo).
+        
+        Returns:
+            tuple: (gestor, vivas, stats, datos del dashboard)
+        """
+        # Solo se abren los meses consultados; no se registra dos veces el mismo logro
+        gestor = GestorLogros(modo="segmentos", duplicados="rechazar")
+        vivas = EstadisticasVivas(gestor)  # Se actualiza con cada logro
+        stats = Estadisticas(fuente=vivas)  # Memoriza hasta el próximo cambio
+        return gestor, vivas, stats, self._datos_dashboard(vivas, stats)
+    
+    def _historial_cargado(self, resultado):
+        """Publica el historial cargado y muestra el dashboard (hilo de Tk)."""
+        self.gestor, self.vivas, self.stats, datos = resultado
+        # Gráficos ya dibujados, guardados al lado de los datos y no del directorio actual
+        carpeta_datos = os.path.dirname(os.path.abspath(self.gestor.archivo))
+        self.cache_graficos = CacheGraficos(directorio=os.path.join(carpeta_datos, ".cache_graficos"))
+        self._mostrar_dashboard(datos)
+        self.ver_historial()  # Solo la primera página
+        self._mostrar_dashboard_vivo()
+        self.en_segundo_plano(
+            lambda: Autocompletado(self.gestor),  # Se actualiza con cada logro nuevo
+            self._autocompletado_listo,
+            "🔤 Preparando sugerencias..."
+        )
+    
+    def _autocompletado_listo(self, autocompletado):
+        """Habilita las sugerencias de descripciones (hilo de Tk)."""
+        self.autocompletado = autocompletado
+    
+    def _mostrar_dashboard_vivo(self):
+        """
+        Crea el dashboard embebido la primera vez que se ve la pestaña
+        de gráficos (importa matplotlib recién entonces).
+        """
+        if self.dashboard_vivo is not None or self.vivas is None:
+            return
+        if self.tab_graficos.master.select() != str(self.tab_graficos):
+            return  # La pestaña de gráficos no está visible
+        
+        from dashboard_vivo import DashboardVivo
+        self.dashboard_vivo = DashboardVivo(self.frame_dashboard_vivo, self.stats, self.categorias)
+        self._refrescar_dashboard_vivo()
+    
+    def _refrescar_dashboard_vivo(self):
+        """
+        Lee los datos del dashboard embebido en el hilo de trabajo (donde
+        también se registran los logros) y lo redibuja en el hilo de Tk.
+        """
+        self.en_segundo_plano(self.dashboard_vivo.datos, self.dashboard_vivo.mostrar)
+    
+    def _listo(self):
+        """
+        Returns:
+            bool: True si el historial ya está cargado; si no, avisa
+        """
+        if self.vivas is None:
+            messagebox.showinfo("Cargando", "⏳ Espera a que termine de cargar el historial")
+            return False
+        return True
     
     def limpiar_pantalla(self):
         """Limpia la pantalla de la consola."""
@@ -90,6 +236,16 @@ class DailyWinsGUI:
         )
         self.label_semana.pack(side=tk.LEFT, padx=5)
         
+        # Indicador de carga (tareas en segundo plano)
+        self.label_estado = tk.Label(
+            frame_dashboard,
+            text="",
+            font=("Arial", 10, "italic"),
+            bg="#2c3e50",
+            fg="#f1c40f"
+        )
+        self.label_estado.pack()
+        
         # ===== FRAME CENTRAL: NOTEBOOK (PESTAÑAS) =====
         notebook = ttk.Notebook(self.root)
         notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -116,6 +272,23 @@ class DailyWinsGUI:
         # Bind para registrar con Enter
         self.entry_descripcion.bind('<Return>', lambda e: self.registrar_logro())
         
+        # Sugerencias mientras se escribe (lista flotante bajo el campo)
+        self.lista_sugerencias = tk.Listbox(
+            tab_registro,
+            font=("Arial", 11),
+            height=SUGERENCIAS_VISIBLES,
+            activestyle="none"
+        )
+        self.entry_descripcion.bind('<KeyRelease>', self._actualizar_sugerencias)
+        self.entry_descripcion.bind('<Down>', lambda e: self._elegir_sugerencias())
+        self.entry_descripcion.bind('<Tab>', lambda e: self._aceptar_sugerencia(0))
+        self.entry_descripcion.bind('<Escape>', lambda e: self._ocultar_sugerencias())
+        self.entry_descripcion.bind('<FocusOut>', lambda e: self.root.after(
+            100, self._ocultar_si_sin_foco))
+        self.lista_sugerencias.bind('<Return>', lambda e: self._aceptar_sugerencia())
+        self.lista_sugerencias.bind('<ButtonRelease-1>', lambda e: self._aceptar_sugerencia())
+        self.lista_sugerencias.bind('<Escape>', lambda e: self._ocultar_sugerencias())
+        
         tk.Label(
             tab_registro,
             text="Categoría:",
@@ -148,15 +321,87 @@ class DailyWinsGUI:
         tab_historial = tk.Frame(notebook, bg="#ecf0f1")
         notebook.add(tab_historial, text="📋 Historial")
         
-        # Área de texto con scroll
-        self.text_historial = scrolledtext.ScrolledText(
-            tab_historial,
-            font=("Courier", 10),
-            wrap=tk.WORD,
-            width=80,
-            height=20
+        # Filtro por categoría
+        filtro_frame = tk.Frame(tab_historial, bg="#ecf0f1")
+        filtro_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+        
+        tk.Label(
+            filtro_frame,
+            text="Categoría:",
+            font=("Arial", 11),
+            bg="#ecf0f1"
+        ).pack(side=tk.LEFT)
+        
+        self.combo_filtro = ttk.Combobox(
+            filtro_frame,
+            values=["Todas"] + [cat.capitalize() for cat in self.categorias],
+            font=("Arial", 11),
+            state="readonly",
+            width=15
+        )
+        self.combo_filtro.current(0)
+        self.combo_filtro.pack(side=tk.LEFT, padx=5)
+        self.combo_filtro.bind('<<ComboboxSelected>>', lambda e: self.filtrar_historial())
+        
+        # Búsqueda por texto (Enter busca; vacío vuelve al historial completo)
+        tk.Label(
+            filtro_frame,
+            text="🔍 Buscar:",
+            font=("Arial", 11),
+            bg="#ecf0f1"
+        ).pack(side=tk.LEFT, padx=(15, 0))
+        
+        self.entry_busqueda = tk.Entry(
+            filtro_frame,
+            font=("Arial", 11),
+            width=25
+        )
+        self.entry_busqueda.pack(side=tk.LEFT, padx=5)
+        self.entry_busqueda.bind('<Return>', lambda e: self.buscar_historial())
+        
+        self.label_historial = tk.Label(
+            filtro_frame,
+            text="",
+            font=("Arial", 10, "italic"),
+            bg="#ecf0f1",
+            fg="#7f8c8d"
+        )
+        self.label_historial.pack(side=tk.RIGHT)
+        
+        # Tabla: solo contiene las páginas ya pedidas; se piden más al desplazarse
+        tabla_frame = tk.Frame(tab_historial)
+        tabla_frame.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        
+        columnas = {
+            "numero": ("#", 50, None),
+            "fecha": ("Fecha", 100, "fecha"),
+            "hora": ("Hora", 60, "fecha"),
+            "categoria": ("Categoría", 110, "categoria"),
+            "descripcion": ("Descripción", 420, "descripcion"),
+        }
+        self.tabla_historial = ttk.Treeview(
+            tabla_frame,
+            columns=list(columnas),
+            show="headings",
+            height=18
+        )
+        for columna, (titulo, ancho, orden) in columnas.items():
+            comando = (lambda o=orden: self.ordenar_historial(o)) if orden else ""
+            self.tabla_historial.heading(columna, text=titulo, command=comando)
+            self.tabla_historial.column(columna, width=ancho, anchor=tk.W,
+                                        stretch=(columna == "descripcion"))
+        
+        scroll_historial = ttk.Scrollbar(
+            tabla_frame,
+            orient=tk.VERTICAL,
+            command=self.tabla_historial.yview
         )
-        self.text_historial.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        self.tabla_historial.configure(
+            yscrollcommand=lambda primero, ultimo: self._al_desplazar_historial(
+                scroll_historial, primero, ultimo)
+        )
+        self.tabla_historial.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scroll_historial.pack(side=tk.RIGHT, fill=tk.Y)
         
         tk.Button(
             tab_historial,
@@ -197,88 +442,92 @@ class DailyWinsGUI:
         ).pack(side=tk.LEFT, padx=5)
         
         # PESTAÑA 4: GRÁFICOS ⭐ NUEVA
-        tab_graficos = tk.Frame(notebook, bg="#ecf0f1")
-        notebook.add(tab_graficos, text="📊 Gráficos")
+        self.tab_graficos = tk.Frame(notebook, bg="#ecf0f1")
+        notebook.add(self.tab_graficos, text="📊 Gráficos")
         
-        # Título
-        tk.Label(
-            tab_graficos,
-            text="Visualización de Datos",
-            font=("Arial", 16, "bold"),
-            bg="#ecf0f1"
-        ).pack(pady=20)
+        # El dashboard embebido se crea al abrir la pestaña por primera vez
+        notebook.bind('<<NotebookTabChanged>>', lambda e: self._mostrar_dashboard_vivo())
         
-        # Frame para botones de gráficos
-        graficos_frame = tk.Frame(tab_graficos, bg="#ecf0f1")
-        graficos_frame.pack(pady=20)
+        # Frame para botones de gráficos (abren la versión ampliada)
+        graficos_frame = tk.Frame(self.tab_graficos, bg="#ecf0f1")
+        graficos_frame.pack(side=tk.BOTTOM, pady=10)
+        
+        # Dashboard embebido (se actualiza con cada logro)
+        self.frame_dashboard_vivo = tk.Frame(self.tab_graficos, bg="#ecf0f1")
+        self.frame_dashboard_vivo.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 0))
         
         # Botón: Dashboard Completo
         tk.Button(
             graficos_frame,
             text="📊 Dashboard Completo",
-            font=("Arial", 13, "bold"),
+            font=("Arial", 10, "bold"),
             bg="#2c3e50",
             fg="white",
-            padx=25,
-            pady=15,
+            padx=8,
+            pady=6,
             command=self.mostrar_dashboard_completo,
-            width=25
-        ).pack(pady=10)
+            width=22
+        ).pack(side=tk.LEFT, padx=4)
         
         # Botón: Gráfico de Categorías
         tk.Button(
             graficos_frame,
             text="📈 Distribución por Categoría",
-            font=("Arial", 13, "bold"),
+            font=("Arial", 10, "bold"),
             bg="#3498db",
             fg="white",
-            padx=25,
-            pady=15,
+            padx=8,
+            pady=6,
             command=self.mostrar_grafico_categorias,
-            width=25
-        ).pack(pady=10)
+            width=22
+        ).pack(side=tk.LEFT, padx=4)
         
         # Botón: Tendencia Temporal
         tk.Button(
             graficos_frame,
             text="📉 Tendencia Temporal",
-            font=("Arial", 13, "bold"),
+            font=("Arial", 10, "bold"),
             bg="#e74c3c",
             fg="white",
-            padx=25,
-            pady=15,
+            padx=8,
+            pady=6,
             command=self.mostrar_grafico_tendencia,
-            width=25
-        ).pack(pady=10)
+            width=22
+        ).pack(side=tk.LEFT, padx=4)
         
         # Botón: Calendario de Actividad
         tk.Button(
             graficos_frame,
             text="🗓️ Calendario de Actividad",
-            font=("Arial", 13, "bold"),
+            font=("Arial", 10, "bold"),
             bg="#27ae60",
             fg="white",
-            padx=25,
-            pady=15,
+            padx=8,
+            pady=6,
             command=self.mostrar_grafico_calendario,
-            width=25
-        ).pack(pady=10)
-        
-        # Nota informativa
-        tk.Label(
-            tab_graficos,
-            text="💡 Tip: Registra logros durante varios días para ver gráficos más completos",
-            font=("Arial", 10, "italic"),
-            bg="#ecf0f1",
-            fg="#7f8c8d"
-        ).pack(side=tk.BOTTOM, pady=20)
+            width=22
+        ).pack(side=tk.LEFT, padx=4)
+    
+    def _datos_dashboard(self, vivas, stats):
+        """
+        Calcula los valores del dashboard superior (hilo de trabajo).
+        
+        Returns:
+            tuple: (total, racha, semana)
+        """
+        # Agregados mantenidos en vivo: no se recorre el historial
+        return vivas.contar_total(), vivas.calcular_racha(), stats.logros_ultima_semana()
     
     def actualizar_dashboard(self):
         """Actualiza las estadísticas del dashboard superior."""
-        stats = Estadisticas(self.gestor.obtener_todos())
-        total = self.gestor.contar_total()
-        racha = stats.calcular_racha()
-        semana = stats.logros_ultima_semana()
+        self.en_segundo_plano(
+            lambda: self._datos_dashboard(self.vivas, self.stats),
+            self._mostrar_dashboard
+        )
+    
+    def _mostrar_dashboard(self, datos):
+        """Muestra los valores del dashboard superior (hilo de Tk)."""
+        total, racha, semana = datos
         
         self.label_total.config(text=f"Total: {total}")
         self.label_racha.config(text=f"🔥 Racha: {racha} día(s)")
@@ -295,18 +544,38 @@ class DailyWinsGUI:
             )
             return
         
+        if not self._listo():
+            return
+        
         categoria = self.combo_categoria.get().lower()
-        logro = self.gestor.agregar_logro(descripcion, categoria)
+        
+        # Guardar y recalcular fuera del hilo de Tk
+        def guardar():
+            logro = self.gestor.agregar_logro(descripcion, categoria)
+            return logro, self._datos_dashboard(self.vivas, self.stats)
+        
+        self.en_segundo_plano(guardar, self._logro_registrado, "💾 Guardando...")
         
         # Limpiar campo
         self.entry_descripcion.delete(0, tk.END)
+        self._ocultar_sugerencias()
+    
+    def _logro_registrado(self, resultado):
+        """Actualiza el dashboard y confirma el registro (hilo de Tk)."""
+        logro, datos = resultado
+        if logro is None:
+            messagebox.showwarning("Duplicado", "⚠️ Ese logro ya está registrado "
+                                   "(misma descripción, categoría, fecha y hora)")
+            self.entry_descripcion.focus()
+            return
         
-        # Actualizar dashboard
-        self.actualizar_dashboard()
+        # Actualizar dashboard (y el gráfico embebido, en el lugar)
+        self._mostrar_dashboard(datos)
+        if self.dashboard_vivo is not None:
+            self._refrescar_dashboard_vivo()
         
         # Mensaje de éxito
-        stats = Estadisticas(self.gestor.obtener_todos())
-        racha = stats.calcular_racha()
+        racha = datos[1]
         
         mensaje = f"✅ ¡Logro registrado!\n\n{logro}"
         
@@ -320,91 +589,308 @@ class DailyWinsGUI:
         # Enfocar de nuevo en el campo de entrada
         self.entry_descripcion.focus()
     
-    def ver_historial(self):
-        """Muestra el historial de logros."""
-        self.text_historial.delete(1.0, tk.END)
+    # ===== SUGERENCIAS DE DESCRIPCIÓN =====
+    
+    def _actualizar_sugerencias(self, evento):
+        """Muestra las descripciones que empiezan con lo escrito."""
+        if evento.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        if self.autocompletado is None:
+            return
+        
+        texto = self.entry_descripcion.get()
+        if len(texto.strip()) < 2:
+            self._ocultar_sugerencias()
+            return
+        
+        # El trie se modifica en el hilo de trabajo al registrar logros,
+        # así que también se consulta allí
+        self.en_segundo_plano(
+            lambda: self.autocompletado.sugerir(texto, SUGERENCIAS_VISIBLES),
+            lambda sugerencias: self._mostrar_sugerencias(texto, sugerencias),
+            mensaje=None
+        )
+    
+    def _mostrar_sugerencias(self, texto, sugerencias):
+        """
+        Muestra bajo el campo de descripción las sugerencias para un texto.
+        
+        Args:
+            texto (str): Texto para el que se pidieron las sugerencias
+            sugerencias (list[str]): Descripciones sugeridas
+        """
+        if self.entry_descripcion.get() != texto:
+            return  # Se siguió escribiendo: ya viene otra consulta
+        
+        sugerencias = [s for s in sugerencias if s != texto]
+        if not sugerencias:
+            self._ocultar_sugerencias()
+            return
+        
+        self.lista_sugerencias.delete(0, tk.END)
+        for sugerencia in sugerencias:
+            self.lista_sugerencias.insert(tk.END, sugerencia)
+        self.lista_sugerencias.config(height=len(sugerencias))
+        self.lista_sugerencias.place(in_=self.entry_descripcion, relx=0, rely=1, relwidth=1)
+        self.lista_sugerencias.lift()
+    
+    def _elegir_sugerencias(self):
+        """Pasa el foco a la lista de sugerencias (flecha abajo)."""
+        if not self.lista_sugerencias.winfo_ismapped():
+            return
+        self.lista_sugerencias.focus_set()
+        self.lista_sugerencias.selection_clear(0, tk.END)
+        self.lista_sugerencias.selection_set(0)
+        self.lista_sugerencias.activate(0)
+    
+    def _aceptar_sugerencia(self, indice=None):
+        """
+        Copia una sugerencia en el campo de descripción.
+        
+        Args:
+            indice (int): Sugerencia a usar; None = la seleccionada
+        """
+        if not self.lista_sugerencias.winfo_ismapped():
+            return None  # Tab sigue su comportamiento normal
         
-        logros = self.gestor.obtener_todos()
+        if indice is None:
+            seleccion = self.lista_sugerencias.curselection()
+            indice = seleccion[0] if seleccion else 0
         
-        if not logros:
-            self.text_historial.insert(1.0, "📭 Aún no tienes logros registrados")
+        self.entry_descripcion.delete(0, tk.END)
+        self.entry_descripcion.insert(0, self.lista_sugerencias.get(indice))
+        self._ocultar_sugerencias()
+        self.entry_descripcion.focus_set()
+        self.entry_descripcion.icursor(tk.END)
+        return "break"
+    
+    def _ocultar_sugerencias(self):
+        """Oculta la lista de sugerencias (el foco vuelve al campo)."""
+        if self.root.focus_get() == self.lista_sugerencias:
+            self.entry_descripcion.focus_set()
+        self.lista_sugerencias.place_forget()
+    
+    def _ocultar_si_sin_foco(self):
+        """Oculta las sugerencias si el foco no quedó ni en el campo ni en la lista."""
+        if self.root.focus_get() not in (self.entry_descripcion, self.lista_sugerencias):
+            self._ocultar_sugerencias()
+    
+    def ver_historial(self):
+        """
+        Muestra el historial de logros desde el principio, con el orden
+        y el filtro actuales. Solo se pide la primera página; las
+        siguientes se piden al desplazarse hasta el final. Si hay un
+        texto buscado se muestran sus resultados en lugar del historial.
+        """
+        if not self._listo():
             return
         
-        self.text_historial.insert(1.0, "═" * 70 + "\n")
-        self.text_historial.insert(tk.END, "               📋 HISTORIAL DE LOGROS\n")
-        self.text_historial.insert(tk.END, "═" * 70 + "\n\n")
+        self._consulta += 1
+        self._cargados = 0
+        self._hay_mas = True
+        self._cargando_pagina = False
+        self.tabla_historial.delete(*self.tabla_historial.get_children())
+        if self._busqueda:
+            self._hay_mas = False  # Los resultados llegan de una vez
+            self._cargar_busqueda()
+        else:
+            self._cargar_pagina_historial()
+    
+    def filtrar_historial(self):
+        """Aplica el filtro de categoría elegido en el combo."""
+        seleccion = self.combo_filtro.get()
+        self._filtro = None if seleccion == "Todas" else seleccion.lower()
+        self.ver_historial()
+    
+    def buscar_historial(self):
+        """Busca el texto ingresado (junto con el filtro de categoría)."""
+        self._busqueda = self.entry_busqueda.get().strip()
+        self.ver_historial()
+    
+    def _cargar_busqueda(self):
+        """Ejecuta la búsqueda en segundo plano."""
+        consulta = self._consulta
+        texto, categoria = self._busqueda, self._filtro
+        
+        def buscar():
+            if self.buscador is None:
+                from busqueda import IndiceTexto
+                self.buscador = IndiceTexto(self.gestor)  # Se actualiza con cada logro nuevo
+            return self.buscador.buscar(texto, categoria=categoria, limite=LIMITE_BUSQUEDA)
+        
+        self.en_segundo_plano(
+            buscar,
+            lambda resultado: self._mostrar_busqueda(consulta, resultado),
+            "🔍 Buscando..."
+        )
+    
+    def _mostrar_busqueda(self, consulta, resultado):
+        """Muestra los resultados de una búsqueda en la tabla (hilo de Tk)."""
+        if consulta != self._consulta:
+            return  # Resultado de una búsqueda anterior
+        
+        total, logros = resultado
+        logros.sort(key=CLAVES_ORDEN[self._orden], reverse=self._descendente)
+        for numero, logro in enumerate(logros, 1):
+            self.tabla_historial.insert("", tk.END, values=(
+                numero, logro.fecha, logro.hora,
+                logro.categoria.capitalize(), logro.descripcion
+            ))
+        self._cargados = len(logros)
+        
+        if total == 0:
+            self.label_historial.config(text="📭 No se encontraron logros")
+        elif total > len(logros):
+            self.label_historial.config(text=f"Mostrando {len(logros)} de {total} resultados")
+        else:
+            self.label_historial.config(text=f"{total} resultado(s)")
+    
+    def ordenar_historial(self, orden):
+        """
+        Ordena el historial por una columna; repetir la misma columna
+        invierte el sentido.
+        
+        Args:
+            orden (str): "fecha", "categoria" o "descripcion"
+        """
+        if orden == self._orden:
+            self._descendente = not self._descendente
+        else:
+            self._orden = orden
+            self._descendente = (orden == "fecha")  # Fecha: más recientes primero
+        self.ver_historial()
+    
+    def _al_desplazar_historial(self, scroll, primero, ultimo):
+        """Sincroniza la barra y pide otra página al acercarse al final."""
+        scroll.set(primero, ultimo)
+        if float(ultimo) > 0.9:
+            self._cargar_pagina_historial()
+    
+    def _cargar_pagina_historial(self):
+        """Pide la siguiente página del historial en segundo plano."""
+        if self._cargando_pagina or not self._hay_mas:
+            return
         
-        for i, logro in enumerate(reversed(logros), 1):
-            self.text_historial.insert(tk.END, f"{i}. {logro}\n")
+        self._cargando_pagina = True
+        consulta = self._consulta
+        filtro = self._filtro
+        parametros = (self._cargados, TAMANO_PAGINA, filtro, self._orden, self._descendente)
+        
+        def cargar():
+            # El total se lee junto con la página, en el hilo de trabajo
+            if filtro is None:
+                total = self.vivas.contar_total()
+            else:
+                total = self.vivas.contar_por_categoria().get(filtro, 0)
+            return self.gestor.obtener_pagina(*parametros), total
+        
+        self.en_segundo_plano(
+            cargar,
+            lambda resultado: self._agregar_pagina_historial(consulta, *resultado)
+        )
+    
+    def _agregar_pagina_historial(self, consulta, logros, total):
+        """Agrega una página de logros a la tabla (hilo de Tk)."""
+        if consulta != self._consulta:
+            return  # Página de un filtro u orden anterior
+        
+        for numero, logro in enumerate(logros, self._cargados + 1):
+            self.tabla_historial.insert("", tk.END, values=(
+                numero, logro.fecha, logro.hora,
+                logro.categoria.capitalize(), logro.descripcion
+            ))
+        
+        self._cargados += len(logros)
+        self._hay_mas = len(logros) == TAMANO_PAGINA
+        self._cargando_pagina = False
+        
+        if total == 0:
+            self.label_historial.config(text="📭 Aún no tienes logros registrados")
+        else:
+            self.label_historial.config(text=f"Mostrando {self._cargados} de {total}")
     
     def ver_estadisticas(self):
         """Muestra el reporte completo de estadísticas."""
-        self.text_stats.delete(1.0, tk.END)
-        
-        stats = Estadisticas(self.gestor.obtener_todos())
-        reporte = stats.generar_reporte()
+        if not self._listo():
+            return
         
+        self.en_segundo_plano(self.stats.generar_reporte, self._mostrar_reporte,
+                              "📊 Calculando estadísticas...")
+    
+    def _mostrar_reporte(self, reporte):
+        """Escribe el reporte en el área de estadísticas (hilo de Tk)."""
+        self.text_stats.delete(1.0, tk.END)
         self.text_stats.insert(1.0, reporte)
     
-    def mostrar_dashboard_completo(self):
-        """Muestra el dashboard completo con todos los gráficos."""
-        stats = Estadisticas(self.gestor.obtener_todos())
+    def _mostrar_grafico(self, grafico, titulo):
+        """
+        Genera el gráfico como PNG en el hilo de trabajo (sin ventanas,
+        pasando por la caché) y lo muestra en una ventana en el hilo de Tk.
+        Si los datos no cambiaron, volver a abrirlo no lo redibuja: la
+        imagen sale de la caché.
+        
+        Args:
+            grafico (str): Método de Visualizador a llamar
+            titulo (str): Título de la ventana
+        """
+        if not self._listo():
+            return
         
-        if self.gestor.contar_total() == 0:
+        def renderizar():
+            if self.vivas.contar_total() == 0:
+                return None
+            viz = Visualizador(self.stats, headless=True, cache=self.cache_graficos)
+            imagen = getattr(viz, grafico)(destino=io.BytesIO())
+            return imagen.getvalue() if imagen is not None else None
+        
+        self.en_segundo_plano(
+            renderizar,
+            lambda imagen: self._ventana_grafico(titulo, imagen),
+            "📈 Preparando gráfico..."
+        )
+    
+    def _ventana_grafico(self, titulo, imagen):
+        """Muestra la imagen PNG de un gráfico en una ventana (hilo de Tk)."""
+        if imagen is None:
             messagebox.showinfo(
                 "Sin datos",
                 "📭 Registra algunos logros primero para ver los gráficos"
             )
             return
         
-        viz = Visualizador(stats)
-        viz.dashboard_completo()
+        ventana = tk.Toplevel(self.root)
+        ventana.title(titulo)
+        foto = tk.PhotoImage(master=ventana, data=base64.b64encode(imagen))
+        etiqueta = tk.Label(ventana, image=foto)
+        etiqueta.image = foto  # Tk no guarda la referencia a la imagen
+        etiqueta.pack()
+    
+    def mostrar_dashboard_completo(self):
+        """Muestra el dashboard completo con todos los gráficos."""
+        self._mostrar_grafico("dashboard_completo", "📊 Dashboard completo")
     
     def mostrar_grafico_categorias(self):
         """Muestra el gráfico de distribución por categorías."""
-        stats = Estadisticas(self.gestor.obtener_todos())
-        
-        if self.gestor.contar_total() == 0:
-            messagebox.showinfo(
-                "Sin datos",
-                "📭 Registra algunos logros primero para ver los gráficos"
-            )
-            return
-        
-        viz = Visualizador(stats)
-        viz.grafico_categorias()
+        self._mostrar_grafico("grafico_categorias", "📊 Logros por categoría")
     
     def mostrar_grafico_tendencia(self):
         """Muestra el gráfico de tendencia temporal."""
-        stats = Estadisticas(self.gestor.obtener_todos())
-        
-        if self.gestor.contar_total() == 0:
-            messagebox.showinfo(
-                "Sin datos",
-                "📭 Registra algunos logros primero para ver los gráficos"
-            )
-            return
-        
-        viz = Visualizador(stats)
-        viz.grafico_tendencia()
+        self._mostrar_grafico("grafico_tendencia", "📈 Tendencia")
     
     def mostrar_grafico_calendario(self):
         """Muestra el calendario de actividad."""
-        stats = Estadisticas(self.gestor.obtener_todos())
-        
-        if self.gestor.contar_total() == 0:
-            messagebox.showinfo(
-                "Sin datos",
-                "📭 Registra algunos logros primero para ver los gráficos"
-            )
-            return
-        
-        viz = Visualizador(stats)
-        viz.grafico_calendario()
+        self._mostrar_grafico("grafico_calendario", "📅 Calendario de actividad")
     
     def ejecutar(self):
         """Inicia el bucle principal de la GUI."""
         self.root.mainloop()
+    
+    def cerrar(self):
+        """Espera las escrituras pendientes, libera el almacenamiento y cierra."""
+        if self.gestor is not None:
+            self.ejecutor.submit(self.gestor.cerrar)
+        self.ejecutor.shutdown(wait=True)
+        self.root.destroy()
 
 
 # ===== PUNTO DE ENTRADA =====
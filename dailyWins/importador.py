@@ -0,0 +1,140 @@
+import csv
+import json
+from logro import Logro, minuto_desde
+
+
+def validar_registro(item):
+    """
+    Valida un registro importado y construye su Logro.
+    Se conservan la fecha y hora del registro.
+
+    Args:
+        item (dict): Registro con descripcion, categoria, fecha y hora
+
+    Returns:
+        Logro: Logro equivalente al registro
+
+    Raises:
+        ValueError: Si falta un campo o la fecha/hora no es válida
+    """
+    descripcion = (item.get('descripcion') or '').strip()
+    if not descripcion:
+        raise ValueError("la descripción no puede estar vacía")
+
+    categoria = (item.get('categoria') or '').strip()
+    if not categoria:
+        raise ValueError("la categoría no puede estar vacía")
+
+    fecha = (item.get('fecha') or '').strip()
+    hora = (item.get('hora') or '').strip()
+    try:
+        if len(fecha) != 10 or len(hora) != 5 or hora[2] != ':':
+            raise ValueError
+        horas, minutos = int(hora[:2]), int(hora[3:])
+        if not (0 <= horas < 24 and 0 <= minutos < 60):
+            raise ValueError
+        minuto = minuto_desde(fecha, hora)
+    except ValueError:
+        raise ValueError(f"fecha u hora inválida: '{fecha} {hora}'") from None
+
+    return Logro(descripcion, categoria, minuto)
+
+
+def _importar(gestor, registros):
+    """
+    Valida registros numerados y los agrega al gestor en un único lote.
+    Con la política de duplicados "rechazar", los registros repetidos
+    (en el historial o en el mismo archivo) se reportan como errores.
+
+    Args:
+        gestor (GestorLogros): Gestor destino
+        registros (Iterable[tuple]): Pares (numero_linea, dict o Exception)
+
+    Returns:
+        tuple: (cantidad importada, list[(numero_linea, mensaje)] de errores)
+    """
+    errores = []
+
+    def validos():
+        for linea, item in registros:
+            if isinstance(item, Exception):
+                errores.append((linea, str(item)))
+                continue
+            try:
+                logro = validar_registro(item)
+            except ValueError as e:
+                errores.append((linea, str(e)))
+                continue
+            # agregar_logros_lote registra cada logro al recibirlo, así que
+            # el índice también detecta los repetidos dentro del archivo
+            if gestor.duplicados == "rechazar" and gestor.es_duplicado(logro):
+                errores.append((linea, "logro duplicado"))
+                continue
+            yield logro
+
+    importados = gestor.agregar_logros_lote(validos())
+    return importados, errores
+
+
+def importar_csv(gestor, archivo):
+    """
+    Importa logros desde un CSV con encabezado descripcion,categoria,fecha,hora.
+    Las filas inválidas se omiten y se reportan; el resto se guarda una vez.
+
+    Args:
+        gestor (GestorLogros): Gestor destino
+        archivo (str): Ruta del CSV
+
+    Returns:
+        tuple: (cantidad importada, list[(numero_linea, mensaje)] de errores)
+    """
+    with open(archivo, 'r', encoding='utf-8', newline='') as f:
+        lector = csv.DictReader(f)
+        return _importar(gestor, ((lector.line_num, fila) for fila in lector))
+
+
+def importar_jsonl(gestor, archivo):
+    """
+    Importa logros desde un archivo JSON Lines (un objeto por línea).
+    Las líneas inválidas se omiten y se reportan; el resto se guarda una vez.
+
+    Args:
+        gestor (GestorLogros): Gestor destino
+        archivo (str): Ruta del archivo JSONL
+
+    Returns:
+        tuple: (cantidad importada, list[(numero_linea, mensaje)] de errores)
+    """
+    def registros(f):
+        for numero, linea in enumerate(f, 1):
+            if not linea.strip():
+                continue
+            try:
+                item = json.loads(linea)
+                if not isinstance(item, dict):
+                    raise ValueError("se esperaba un objeto JSON")
+                yield numero, item
+            except ValueError as e:
+                yield numero, e
+
+    with open(archivo, 'r', encoding='utf-8') as f:
+        return _importar(gestor, registros(f))
+
+
+# ===== PUNTO DE ENTRADA =====
+if __name__ == "__main__":
+    import sys
+    from gestor_logros import GestorLogros
+
+    if len(sys.argv) != 2:
+        print("Uso: python importador.py <archivo.csv|archivo.jsonl>")
+        sys.exit(1)
+
+    origen = sys.argv[1]
+    gestor = GestorLogros(modo="segmentos")  # El mismo almacenamiento que main.py y gui.py
+    importar = importar_csv if origen.lower().endswith(".csv") else importar_jsonl
+    importados, errores = importar(gestor, origen)
+
+    print(f"✅ {importados} logros importados en '{gestor.archivo}'")
+    for linea, mensaje in errores:
+        print(f"❌ Línea {linea}: {mensaje}")
@@ -0,0 +1,101 @@
+from bisect import bisect_left, bisect_right
+from logro import minuto_desde, MINUTOS_POR_DIA
+
+
+def limites_en_minutos(desde=None, hasta=None):
+    """
+    Convierte un rango de fechas inclusivo a minutos [inicio, fin).
+
+    Args:
+        desde (str): Primera fecha del rango (YYYY-MM-DD) o None
+        hasta (str): Última fecha del rango (YYYY-MM-DD) o None
+
+    Returns:
+        tuple: (inicio, fin) en minutos desde la época; None si no hay límite
+    """
+    inicio = minuto_desde(desde, "00:00") if desde is not None else None
+    fin = minuto_desde(hasta, "00:00") + MINUTOS_POR_DIA if hasta is not None else None
+    return inicio, fin
+
+
+class IndiceFechas:
+    """
+    Índice de logros ordenados por fecha y hora.
+    Permite contar logros en un rango en O(log n) y obtenerlos en
+    O(log n + k) mediante búsqueda binaria.
+    """
+
+    def __init__(self, logros=()):
+        """
+        Construye el índice a partir de logros existentes.
+
+        Args:
+            logros (Iterable[Logro]): Logros a indexar (en cualquier orden)
+        """
+        # Orden estable: a igual momento se respeta el orden de registro
+        self.logros = sorted(logros, key=lambda logro: logro.minuto)
+        self.claves = [logro.minuto for logro in self.logros]
+
+    def agregar(self, logro):
+        """
+        Incorpora un logro al índice. Si es el más reciente (el caso
+        habitual) es O(1); si no, se inserta en su posición.
+
+        Args:
+            logro (Logro): Logro a indexar
+        """
+        if not self.claves or logro.minuto >= self.claves[-1]:
+            self.claves.append(logro.minuto)
+            self.logros.append(logro)
+        else:
+            i = bisect_right(self.claves, logro.minuto)
+            self.claves.insert(i, logro.minuto)
+            self.logros.insert(i, logro)
+
+    def _posiciones(self, desde, hasta):
+        """Calcula las posiciones [i, j) de los logros dentro del rango."""
+        inicio, fin = limites_en_minutos(desde, hasta)
+        i = 0 if inicio is None else bisect_left(self.claves, inicio)
+        j = len(self.claves) if fin is None else bisect_left(self.claves, fin)
+        return i, max(i, j)
+
+    def contar_en_rango(self, desde=None, hasta=None):
+        """
+        Cuenta los logros entre dos fechas (ambas inclusive).
+
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD); None para no limitar
+            hasta (str): Última fecha (YYYY-MM-DD); None para no limitar
+
+        Returns:
+            int: Cantidad de logros en el rango
+        """
+        i, j = self._posiciones(desde, hasta)
+        return j - i
+
+    def obtener_en_rango(self, desde=None, hasta=None):
+        """
+        Obtiene los logros entre dos fechas (ambas inclusive).
+
+        Args:
+            desde (str): Primera fecha (YYYY-MM-DD); None para no limitar
+            hasta (str): Última fecha (YYYY-MM-DD); None para no limitar
+
+        Returns:
+            list[Logro]: Logros del rango, ordenados por fecha y hora
+        """
+        i, j = self._posiciones(desde, hasta)
+        return self.logros[i:j]
+
+
+# ===== PRUEBA DE LA CLASE (Eliminar después) =====
+if __name__ == "__main__":
+    from gestor_logros import GestorLogros
+
+    gestor = GestorLogros()
+    indice = IndiceFechas(gestor.obtener_todos())
+
+    print(f"Total indexado: {indice.contar_en_rango()}")
+    print(f"Desde 2026-02-01: {indice.contar_en_rango('2026-02-01')}")
+    for logro in indice.obtener_en_rango('2026-01-01', '2026-01-31'):
+        print(logro)
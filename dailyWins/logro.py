@@ -1,26 +1,113 @@
-from datetime import datetime
+import sys
+from datetime import datetime, date
+from functools import lru_cache
+
+# Ordinal del 1970-01-01: los timestamps se guardan como minutos desde esa fecha
+EPOCA = date(1970, 1, 1).toordinal()
+MINUTOS_POR_DIA = 24 * 60
+
+
+@lru_cache(maxsize=4096)
+def _fecha_de_dia(dia):
+    """Formatea un ordinal de fecha como YYYY-MM-DD (cacheado por día)."""
+    return date.fromordinal(dia).isoformat()
+
+
+@lru_cache(maxsize=4096)
+def _dia_de_fecha(fecha):
+    """Convierte una fecha YYYY-MM-DD a ordinal (cacheado por fecha)."""
+    return date.fromisoformat(fecha).toordinal()
+
+
+def minuto_desde(fecha, hora):
+    """
+    Convierte fecha y hora en texto a minutos desde la época.
+
+    Args:
+        fecha (str): Fecha en formato YYYY-MM-DD
+        hora (str): Hora en formato HH:MM
+
+    Returns:
+        int: Minutos transcurridos desde 1970-01-01 00:00
+    """
+    horas, minutos = hora.split(":")
+    return (_dia_de_fecha(fecha) - EPOCA) * MINUTOS_POR_DIA + int(horas) * 60 + int(minutos)
+
 
 class Logro:
     """
     Representa un logro diario del usuario.
     Registra automáticamente la fecha y hora de creación.
+    
+    Para ocupar poca memoria usa __slots__, comparte (interna) el texto
+    de la categoría y guarda el momento como un único entero de minutos
+    desde la época; `fecha` y `hora` se derivan al consultarlas.
     """
     
-    def __init__(self, descripcion, categoria):
+    __slots__ = ("descripcion", "categoria", "minuto")
+    
+    def __init__(self, descripcion, categoria, minuto=None):
         """
         Constructor de la clase Logro.
         
         Args:
             descripcion (str): Breve descripción del logro
             categoria (str): Categoría (trabajo, salud, aprendizaje, personal)
+            minuto (int): Minutos desde 1970-01-01 00:00; si no se indica
+                se usa el momento actual
         """
         self.descripcion = descripcion
-        self.categoria = categoria
+        self.categoria = sys.intern(categoria)
         
         # Captura automática de fecha y hora
-        ahora = datetime.now()
-        self.fecha = ahora.strftime("%Y-%m-%d")  # Formato: 2026-01-23
-        self.hora = ahora.strftime("%H:%M")       # Formato: 14:30
+        if minuto is None:
+            ahora = datetime.now()
+            minuto = ((ahora.toordinal() - EPOCA) * MINUTOS_POR_DIA
+                      + ahora.hour * 60 + ahora.minute)
+        self.minuto = minuto
+    
+    @classmethod
+    def desde_dict(cls, item):
+        """
+        Reconstruye un logro desde su diccionario serializado.
+        
+        Args:
+            item (dict): Diccionario con descripcion, categoria, fecha y hora
+        
+        Returns:
+            Logro: Logro con su fecha y hora originales
+        """
+        return cls(item['descripcion'], item['categoria'],
+                   minuto_desde(item['fecha'], item['hora']))
+    
+    @property
+    def clave(self):
+        """tuple: (descripcion, categoria, minuto); igual en dos logros duplicados."""
+        return (self.descripcion, self.categoria, self.minuto)
+    
+    @property
+    def dia(self):
+        """int: Ordinal de la fecha del logro."""
+        return EPOCA + self.minuto // MINUTOS_POR_DIA
+    
+    @property
+    def fecha(self):
+        """str: Fecha del logro. Formato: 2026-01-23"""
+        return _fecha_de_dia(self.dia)
+    
+    @fecha.setter
+    def fecha(self, fecha):
+        self.minuto = minuto_desde(fecha, self.hora)
+    
+    @property
+    def hora(self):
+        """str: Hora del logro. Formato: 14:30"""
+        horas, minutos = divmod(self.minuto % MINUTOS_POR_DIA, 60)
+        return f"{horas:02d}:{minutos:02d}"
+    
+    @hora.setter
+    def hora(self, hora):
+        self.minuto = minuto_desde(self.fecha, hora)
     
     def __str__(self):
         """
@@ -50,9 +137,12 @@ class Logro:
 if __name__ == "__main__":
     # Crear un logro de prueba
     logro1 = Logro("Completé 30 minutos de ejercicio", "salud")
-    
+
     # Probar __str__()
     print(logro1)
-    
+
     # Probar to_dict()
-    print(logro1.to_dict())
\ No newline at end of file
+    print(logro1.to_dict())
+
+    # Probar ida y vuelta desde diccionario
+    print(Logro.desde_dict(logro1.to_dict()).to_dict() == logro1.to_dict())
\ No newline at end of file
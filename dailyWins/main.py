@@ -1,5 +1,9 @@
+import perfilado
+perfilado.activar_desde_argumentos()  # --profile: antes de importar los módulos medidos
+
 from gestor_logros import GestorLogros
 from estadisticas import Estadisticas
+from estadisticas_vivas import EstadisticasVivas
 import os
 
 class DailyWinsApp:
@@ -10,7 +14,11 @@ class DailyWinsApp:
     
     def __init__(self):
         """Constructor de la aplicación."""
-        self.gestor = GestorLogros()
+        # Solo se abren los meses consultados; no se registra dos veces el mismo logro
+        self.gestor = GestorLogros(modo="segmentos", duplicados="rechazar")
+        self.vivas = EstadisticasVivas(self.gestor)  # Se actualiza con cada logro
+        self.stats = Estadisticas(fuente=self.vivas)  # Memoriza hasta el próximo cambio
+        self.buscador = None  # Índice de texto, se construye con la primera búsqueda
         self.categorias = ["trabajo", "salud", "aprendizaje", "personal"]
     
     def limpiar_pantalla(self):
@@ -19,20 +27,20 @@ class DailyWinsApp:
     
     def mostrar_menu(self):
         """Muestra el menú principal."""
-        # Calcular racha actual para mostrar en el menú
-        stats = Estadisticas(self.gestor.obtener_todos())
-        racha = stats.calcular_racha()
+        # Racha actual mantenida en vivo (sin recorrer el historial)
+        racha = self.vivas.calcular_racha()
         
         print("\n" + "="*40)
         print("        🎯 DAILYWINS 🎯")
         print("="*40)
-        print(f"📊 Total de logros: {self.gestor.contar_total()}")
+        print(f"📊 Total de logros: {self.vivas.contar_total()}")
         print(f"🔥 Racha actual: {racha} día(s)")
         print("="*40)
         print("1. ✅ Registrar logro")
         print("2. 📋 Ver últimos logros")
         print("3. 📈 Ver reporte completo")
-        print("4. 🚪 Salir")
+        print("4. 🔍 Buscar logros")
+        print("5. 🚪 Salir")
         print("="*40)
     
     def registrar_logro(self):
@@ -65,12 +73,16 @@ class DailyWinsApp:
         
         # Agregar logro
         logro = self.gestor.agregar_logro(descripcion, categoria)
+        if logro is None:
+            print("\n⚠️ Ese logro ya está registrado (misma descripción, categoría, fecha y hora)")
+            input("Presiona ENTER para continuar...")
+            return
+        
         print(f"\n✅ ¡Logro registrado exitosamente!")
         print(f"   {logro}")
         
         # Mostrar motivación según racha
-        stats = Estadisticas(self.gestor.obtener_todos())
-        racha = stats.calcular_racha()
+        racha = self.vivas.calcular_racha()
         if racha >= 7:
             print(f"\n🔥🔥🔥 ¡INCREÍBLE! ¡{racha} días de racha!")
         elif racha >= 3:
@@ -92,13 +104,42 @@ class DailyWinsApp:
         
         input("\nPresiona ENTER para continuar...")
     
+    def buscar_logros(self):
+        """Busca logros por palabras de su descripción."""
+        print("\n--- BUSCAR LOGROS ---")
+        print("Palabras (todas deben aparecer), \"frase exacta\" y filtros opcionales:")
+        print("categoria:salud  desde:2025-01-01  hasta:2025-01-31")
+        
+        consulta = input("\nBuscar: ").strip()
+        if not consulta:
+            return
+        
+        if self.buscador is None:
+            from busqueda import IndiceTexto
+            self.buscador = IndiceTexto(self.gestor)  # Se actualiza con cada logro nuevo
+        
+        try:
+            total, logros = self.buscador.buscar(consulta, limite=20)
+        except ValueError as e:
+            print(f"❌ {e}")
+            input("\nPresiona ENTER para continuar...")
+            return
+        
+        if total == 0:
+            print("📭 No se encontraron logros")
+        else:
+            print(f"\n{total} resultado(s), los más recientes primero:")
+            for i, logro in enumerate(logros, 1):
+                print(f"{i}. {logro}")
+            if total > len(logros):
+                print(f"... y {total - len(logros)} más")
+        
+        input("\nPresiona ENTER para continuar...")
+    
     def mostrar_estadisticas(self):
         """Muestra el reporte completo de estadísticas."""
-        # Crear objeto estadísticas con todos los logros
-        stats = Estadisticas(self.gestor.obtener_todos())
-        
-        # Generar y mostrar reporte
-        reporte = stats.generar_reporte()
+        # Generar y mostrar reporte (se reutiliza si no hubo cambios)
+        reporte = self.stats.generar_reporte()
         print(reporte)
         
         input("\nPresiona ENTER para continuar...")
@@ -118,10 +159,11 @@ class DailyWinsApp:
             elif opcion == "3":
                 self.mostrar_estadisticas()
             elif opcion == "4":
+                self.buscar_logros()
+            elif opcion == "5":
                 # Mostrar mensaje de despedida con estadísticas finales
-                stats = Estadisticas(self.gestor.obtener_todos())
-                total = self.gestor.contar_total()
-                racha = stats.calcular_racha()
+                total = self.vivas.contar_total()
+                racha = self.vivas.calcular_racha()
                 
                 print(f"\n{'='*40}")
                 print(f"   📊 Sesión finalizada")
@@ -0,0 +1,127 @@
+import atexit
+import os
+import sys
+import time
+from functools import wraps
+
+# Se activa con DAILYWINS_PROFILE=1 (main.py y gui.py lo fijan con --profile).
+# Se decide al importar: desactivado, @medido deja el método intacto y no
+# agrega ni una llamada.
+VARIABLE_ENTORNO = "DAILYWINS_PROFILE"
+ACTIVO = os.environ.get(VARIABLE_ENTORNO, "") not in ("", "0")
+
+_muestras = {}  # {operacion: [segundos, ...]}
+
+
+def activar_desde_argumentos(argumentos=None):
+    """
+    Activa el perfilado si se pasó la opción --profile. Debe llamarse
+    antes de importar los módulos medidos (gestor, estadísticas, gráficos).
+
+    Args:
+        argumentos (list[str]): Argumentos de la línea de comandos;
+            por defecto sys.argv (se quita --profile de la lista)
+    """
+    global ACTIVO
+    argumentos = sys.argv if argumentos is None else argumentos
+    if "--profile" not in argumentos:
+        return
+
+    argumentos.remove("--profile")
+    os.environ[VARIABLE_ENTORNO] = "1"  # También para los subprocesos
+    if not ACTIVO:
+        ACTIVO = True
+        atexit.register(volcar)
+
+
+def medido(metodo):
+    """
+    Mide cada llamada al método y la registra bajo su nombre calificado
+    (p. ej. "Estadisticas.calcular_racha").
+
+    Args:
+        metodo (callable): Función o método a medir
+
+    Returns:
+        callable: El mismo método si el perfilado está desactivado;
+            si no, una envoltura que registra la duración
+    """
+    if not ACTIVO:
+        return metodo
+
+    muestras = _muestras.setdefault(metodo.__qualname__, [])
+
+    @wraps(metodo)
+    def envoltura(*args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return metodo(*args, **kwargs)
+        finally:
+            muestras.append(time.perf_counter() - inicio)
+    return envoltura
+
+
+def _percentil(ordenadas, p):
+    """Percentil p (0-100) por rango más cercano de una lista ordenada."""
+    return ordenadas[max(0, -(-len(ordenadas) * p // 100) - 1)]
+
+
+def resumen():
+    """
+    Resume las latencias registradas por operación.
+
+    Returns:
+        dict: {operacion: {llamadas, p50, p95, max, total}} en milisegundos,
+            solo con las operaciones que se llamaron al menos una vez
+    """
+    resultado = {}
+    for operacion, muestras in _muestras.items():
+        if not muestras:
+            continue
+        ordenadas = sorted(muestras)
+        resultado[operacion] = {
+            "llamadas": len(ordenadas),
+            "p50": _percentil(ordenadas, 50) * 1e3,
+            "p95": _percentil(ordenadas, 95) * 1e3,
+            "max": ordenadas[-1] * 1e3,
+            "total": sum(ordenadas) * 1e3,
+        }
+    return resultado
+
+
+def volcar(salida=None):
+    """
+    Imprime la tabla de latencias (p50/p95/max), de la operación que
+    más tiempo total consumió a la que menos.
+
+    Args:
+        salida (io.TextIOBase): Donde escribir; por defecto stderr
+    """
+    salida = sys.stderr if salida is None else salida
+    datos = resumen()
+    if not datos:
+        return
+
+    print(f"\n{'Operación':>40} | {'llamadas':>8} | {'p50 ms':>9} | {'p95 ms':>9} | "
+          f"{'max ms':>9} | {'total ms':>10}", file=salida)
+    print("-" * 100, file=salida)
+    for operacion, d in sorted(datos.items(), key=lambda par: -par[1]["total"]):
+        print(f"{operacion:>40} | {d['llamadas']:>8} | {d['p50']:>9.3f} | {d['p95']:>9.3f} | "
+              f"{d['max']:>9.3f} | {d['total']:>10.1f}", file=salida)
+
+
+if ACTIVO:
+    atexit.register(volcar)
+
+
+# ===== PRUEBA DEL MÓDULO (Eliminar después) =====
+if __name__ == "__main__":
+    if not ACTIVO:
+        print(f"Ejecuta con {VARIABLE_ENTORNO}=1 para ver la tabla")
+
+    @medido
+    def dormir(segundos):
+        time.sleep(segundos)
+
+    for i in range(20):
+        dormir(0.001 * (i % 5))
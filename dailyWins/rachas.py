@@ -0,0 +1,160 @@
+from bisect import bisect_right
+from datetime import date, datetime
+
+
+class MotorRachas:
+    """
+    Índice de rachas sobre días representados como ordinales enteros.
+    Guarda los intervalos de días consecutivos con logros (run-length)
+    ordenados, y se actualiza incrementalmente con cada día nuevo.
+    """
+
+    def __init__(self):
+        """Constructor de un motor sin días registrados."""
+        self.inicios = []   # Primer día de cada racha (ordenado)
+        self.fines = []     # Último día de cada racha (inclusive)
+        self.mas_larga = 0
+
+    @classmethod
+    def desde_dias(cls, dias):
+        """
+        Construye el índice a partir de días activos.
+
+        Args:
+            dias (Iterable[int]): Ordinales de fecha (pueden repetirse)
+
+        Returns:
+            MotorRachas: Motor con todas las rachas calculadas
+        """
+        motor = cls()
+        for dia in sorted(set(int(d) for d in dias)):
+            motor.agregar_dia(dia)
+        return motor
+
+    @classmethod
+    def desde_intervalos(cls, inicios, fines):
+        """
+        Construye el índice a partir de rachas ya calculadas.
+
+        Args:
+            inicios (Iterable[int]): Primer día de cada racha, ordenados
+            fines (Iterable[int]): Último día de cada racha (inclusive)
+
+        Returns:
+            MotorRachas: Motor con esas rachas
+        """
+        motor = cls()
+        motor.inicios = [int(dia) for dia in inicios]
+        motor.fines = [int(dia) for dia in fines]
+        motor.mas_larga = max(
+            (fin - inicio + 1 for inicio, fin in zip(motor.inicios, motor.fines)), default=0
+        )
+        return motor
+
+    @classmethod
+    def desde_fechas(cls, fechas):
+        """
+        Construye el índice a partir de fechas en texto.
+
+        Args:
+            fechas (Iterable[str]): Fechas en formato YYYY-MM-DD
+
+        Returns:
+            MotorRachas: Motor con todas las rachas calculadas
+        """
+        return cls.desde_dias(date.fromisoformat(fecha).toordinal() for fecha in fechas)
+
+    def agregar_dia(self, dia):
+        """
+        Registra un día con logros, extendiendo o uniendo rachas.
+        Agregar el día siguiente a la última racha es O(1); un día
+        anterior cuesta O(log R) para ubicarlo más el reacomodo de listas.
+
+        Args:
+            dia (int): Ordinal de la fecha
+
+        Returns:
+            bool: True si el día no estaba registrado
+        """
+        i = bisect_right(self.inicios, dia)  # Rachas que empiezan <= dia
+
+        if i > 0 and dia <= self.fines[i - 1]:
+            return False  # Ya pertenece a una racha
+
+        une_anterior = i > 0 and self.fines[i - 1] == dia - 1
+        une_siguiente = i < len(self.inicios) and self.inicios[i] == dia + 1
+
+        if une_anterior and une_siguiente:
+            self.fines[i - 1] = self.fines[i]
+            del self.inicios[i]
+            del self.fines[i]
+            i -= 1
+        elif une_anterior:
+            self.fines[i - 1] = dia
+            i -= 1
+        elif une_siguiente:
+            self.inicios[i] = dia
+        else:
+            self.inicios.insert(i, dia)
+            self.fines.insert(i, dia)
+
+        self.mas_larga = max(self.mas_larga, self.fines[i] - self.inicios[i] + 1)
+        return True
+
+    def racha_al(self, dia):
+        """
+        Largo de la racha vigente en un día dado (contando hasta ese día).
+
+        Args:
+            dia (int): Ordinal de la fecha
+
+        Returns:
+            int: Días consecutivos con logros que terminan en `dia`
+        """
+        i = bisect_right(self.inicios, dia) - 1
+        if i < 0 or dia > self.fines[i]:
+            return 0
+        return dia - self.inicios[i] + 1
+
+    def racha_actual(self, hoy=None):
+        """
+        Racha de días consecutivos con logros hasta hoy.
+
+        Args:
+            hoy (int): Ordinal del día de referencia (por defecto, hoy)
+
+        Returns:
+            int: Número de días consecutivos
+        """
+        if hoy is None:
+            hoy = datetime.now().date().toordinal()
+        if not self.fines or self.fines[-1] != hoy:
+            return 0
+        return hoy - self.inicios[-1] + 1
+
+    def intervalos(self):
+        """
+        Lista todas las rachas registradas.
+
+        Returns:
+            list[tuple]: (fecha_inicio, fecha_fin, dias) por racha, en orden
+        """
+        return [
+            (date.fromordinal(inicio), date.fromordinal(fin), fin - inicio + 1)
+            for inicio, fin in zip(self.inicios, self.fines)
+        ]
+
+
+# ===== PRUEBA DE LA CLASE (Eliminar después) =====
+if __name__ == "__main__":
+    hoy = datetime.now().date().toordinal()
+    motor = MotorRachas.desde_dias([hoy - 10, hoy - 9, hoy - 2, hoy])
+
+    print(f"Racha actual: {motor.racha_actual()} día(s)")      # 1
+    motor.agregar_dia(hoy - 1)
+    print(f"Racha actual: {motor.racha_actual()} día(s)")      # 3
+    print(f"Racha más larga: {motor.mas_larga} día(s)")        # 3
+    print(f"Racha al día -9: {motor.racha_al(hoy - 9)} día(s)")  # 2
+
+    for inicio, fin, dias in motor.intervalos():
+        print(f"{inicio} → {fin}: {dias} día(s)")
@@ -0,0 +1,110 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from gestor_logros import GestorLogros
+from estadisticas import Estadisticas
+from estadisticas_vivas import EstadisticasVivas
+from visualizador import Visualizador
+
+# Gráfico -> método de Visualizador que lo genera
+GRAFICOS = {
+    "categorias": "grafico_categorias",
+    "tendencia": "grafico_tendencia",
+    "calendario": "grafico_calendario",
+    "dashboard": "dashboard_completo",
+}
+
+
+def renderizar_historial(archivo, prefijo, formato="png", modo="segmentos"):
+    """
+    Genera todos los gráficos de un historial sin abrir ventanas.
+    Se ejecuta en un proceso del pool, por lo que solo recibe y
+    retorna datos simples.
+
+    Args:
+        archivo (str): Ruta del logros.json del usuario
+        prefijo (str): Ruta base de salida; cada gráfico se escribe como
+            <prefijo>_<grafico>.<formato>
+        formato (str): "png", "svg" o cualquier formato de matplotlib
+        modo (str): Modo de almacenamiento del historial (el de las
+            aplicaciones por defecto)
+
+    Returns:
+        int: Cantidad de gráficos generados (se omiten los que no tienen datos)
+    """
+    gestor = GestorLogros(archivo, modo=modo)
+    viz = Visualizador(Estadisticas(fuente=EstadisticasVivas(gestor)), headless=True)
+
+    generados = 0
+    for grafico, metodo in GRAFICOS.items():
+        destino = f"{prefijo}_{grafico}.{formato}"
+        if getattr(viz, metodo)(destino=destino, formato=formato) is not None:
+            generados += 1
+    return generados
+
+
+def nombres_de_salida(archivos):
+    """
+    Asigna un nombre de salida único a cada historial (el nombre del
+    archivo, numerado si se repite entre carpetas).
+
+    Args:
+        archivos (list[str]): Rutas de los historiales
+
+    Returns:
+        list[str]: Nombre base para cada archivo, en el mismo orden
+    """
+    usados = {}
+    nombres = []
+    for archivo in archivos:
+        nombre = os.path.splitext(os.path.basename(archivo))[0]
+        usados[nombre] = usados.get(nombre, 0) + 1
+        nombres.append(nombre if usados[nombre] == 1 else f"{nombre}_{usados[nombre]}")
+    return nombres
+
+
+def renderizar_lote(archivos, directorio_salida, formato="png", procesos=None, modo="segmentos"):
+    """
+    Reparte la generación de gráficos de muchos historiales entre
+    varios procesos.
+
+    Args:
+        archivos (list[str]): Rutas de los logros.json a procesar
+        directorio_salida (str): Carpeta donde se escriben los gráficos
+        formato (str): Formato de imagen ("png", "svg"...)
+        procesos (int): Procesos del pool; None = uno por CPU
+        modo (str): Modo de almacenamiento de los historiales
+
+    Returns:
+        dict: {graficos, segundos, graficos_por_segundo}
+    """
+    os.makedirs(directorio_salida, exist_ok=True)
+    prefijos = [os.path.join(directorio_salida, nombre) for nombre in nombres_de_salida(archivos)]
+
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        graficos = sum(pool.map(renderizar_historial, archivos, prefijos,
+                                [formato] * len(archivos), [modo] * len(archivos)))
+    segundos = time.perf_counter() - inicio
+
+    return {
+        "graficos": graficos,
+        "segundos": segundos,
+        "graficos_por_segundo": graficos / segundos if segundos > 0 else 0.0,
+    }
+
+
+# ===== PUNTO DE ENTRADA =====
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera gráficos de muchos historiales en paralelo")
+    parser.add_argument("salida", help="Carpeta de salida")
+    parser.add_argument("archivos", nargs="+", help="Archivos logros.json a procesar")
+    parser.add_argument("--formato", default="png", help="png, svg, pdf...")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos del pool")
+    parser.add_argument("--modo", default="segmentos", help="Modo de almacenamiento de los historiales")
+    args = parser.parse_args()
+
+    resultado = renderizar_lote(args.archivos, args.salida, args.formato, args.procesos, args.modo)
+    print(f"✅ {resultado['graficos']} gráficos en {resultado['segundos']:.2f} s "
+          f"({resultado['graficos_por_segundo']:.1f} gráficos/s)")
@@ -0,0 +1,127 @@
+import struct
+import sys
+from logro import Logro
+from escritura_atomica import archivo_atomico
+
+# Formato del snapshot (little-endian):
+#   cabecera   : MAGIA, versión, cantidad de categorías, cantidad de
+#                logros y posición donde empiezan los registros
+#   categorías : por cada una, largo (uint16) + nombre en UTF-8
+#   registros  : uno de ancho fijo por logro (minuto, código de
+#                categoría, posición y largo de la descripción en el heap)
+#   heap       : descripciones en UTF-8, una tras otra
+MAGIA = b"DWIN"
+VERSION_FORMATO = 1
+CABECERA = struct.Struct("<4sHHII")
+LARGO_CATEGORIA = struct.Struct("<H")
+REGISTRO = struct.Struct("<iHII")
+
+
+def escribir_snapshot(logros, destino):
+    """
+    Escribe los logros en el formato binario del snapshot.
+
+    Args:
+        logros (Iterable[Logro]): Logros a guardar, en orden de registro
+        destino (str): Ruta del archivo a generar
+
+    Returns:
+        int: Cantidad de logros escritos
+    """
+    codigos = {}
+    registros = bytearray()
+    heap = bytearray()
+
+    for logro in logros:
+        codigo = codigos.setdefault(logro.categoria, len(codigos))
+        texto = logro.descripcion.encode('utf-8')
+        registros += REGISTRO.pack(logro.minuto, codigo, len(heap), len(texto))
+        heap += texto
+
+    tabla = bytearray()
+    for categoria in codigos:
+        nombre = categoria.encode('utf-8')
+        tabla += LARGO_CATEGORIA.pack(len(nombre)) + nombre
+
+    cantidad = len(registros) // REGISTRO.size
+    inicio_registros = CABECERA.size + len(tabla)
+    # Se escribe aparte y se reemplaza: los lectores que tienen el
+    # archivo mapeado (modo "mapeado") conservan la versión anterior
+    with archivo_atomico(destino, 'wb') as f:
+        f.write(CABECERA.pack(MAGIA, VERSION_FORMATO, len(codigos), cantidad, inicio_registros))
+        f.write(tabla)
+        f.write(registros)
+        f.write(heap)
+    return cantidad
+
+
+def leer_cabecera(datos):
+    """
+    Interpreta la cabecera y la tabla de categorías de un snapshot.
+
+    Args:
+        datos (bytes | mmap.mmap): Contenido del snapshot
+
+    Returns:
+        tuple: (categorias, cantidad, inicio_registros, inicio_heap)
+
+    Raises:
+        ValueError: Si el contenido no es un snapshot válido
+    """
+    if len(datos) < CABECERA.size:
+        raise ValueError("Snapshot binario incompleto")
+
+    magia, version, n_categorias, cantidad, inicio_registros = CABECERA.unpack_from(datos, 0)
+    if magia != MAGIA or version != VERSION_FORMATO:
+        raise ValueError("No es un snapshot binario de DailyWins compatible")
+
+    categorias = []
+    pos = CABECERA.size
+    for _ in range(n_categorias):
+        (largo,) = LARGO_CATEGORIA.unpack_from(datos, pos)
+        pos += LARGO_CATEGORIA.size
+        categorias.append(sys.intern(bytes(datos[pos:pos + largo]).decode('utf-8')))
+        pos += largo
+
+    inicio_heap = inicio_registros + cantidad * REGISTRO.size
+    if pos != inicio_registros or len(datos) < inicio_heap:
+        raise ValueError("Snapshot binario incompleto")
+    return categorias, cantidad, inicio_registros, inicio_heap
+
+
+def leer_snapshot(archivo):
+    """
+    Carga todos los logros de un snapshot binario.
+    Los registros se leen con struct en bloque, sin parsear texto.
+
+    Args:
+        archivo (str): Ruta del snapshot
+
+    Returns:
+        list[Logro]: Logros en orden de registro
+
+    Raises:
+        ValueError: Si el archivo no es un snapshot válido
+    """
+    with open(archivo, 'rb') as f:
+        datos = f.read()
+
+    categorias, _, inicio_registros, inicio_heap = leer_cabecera(datos)
+    registros = memoryview(datos)[inicio_registros:inicio_heap]
+    heap = datos[inicio_heap:]
+
+    return [
+        Logro(heap[inicio:inicio + largo].decode('utf-8'), categorias[codigo], minuto)
+        for minuto, codigo, inicio, largo in REGISTRO.iter_unpack(registros)
+    ]
+
+
+# ===== PRUEBA DE LAS FUNCIONES (Eliminar después) =====
+if __name__ == "__main__":
+    from gestor_logros import GestorLogros
+
+    gestor = GestorLogros(perezoso=True)
+    print(f"Escritos: {escribir_snapshot(gestor.iterar_logros(), 'logros.dwb')} logros")
+
+    for logro in leer_snapshot('logros.dwb')[-3:]:
+        print(logro)
@@ -1,8 +1,40 @@
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from datetime import datetime, timedelta
+import io
+import os
+from datetime import date, datetime, timedelta
 from collections import Counter
-import numpy as np
+from perfilado import medido
+
+# matplotlib y numpy se importan con el primer gráfico (ver _cargar_graficos)
+_graficos = None
+
+
+def _cargar_graficos(headless=False):
+    """
+    Importa matplotlib y numpy y aplica el estilo una única vez, la
+    primera vez que se pide un gráfico, para no demorar el inicio.
+    
+    Args:
+        headless (bool): Si es True se usa el backend Agg (sin ventanas),
+            para generar archivos en un servidor
+    
+    Returns:
+        tuple: (pyplot, matplotlib.dates, numpy)
+    """
+    global _graficos
+    if _graficos is None:
+        import matplotlib
+        if headless:
+            matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        import numpy as np
+        
+        # Configuración de estilo
+        plt.style.use('seaborn-v0_8-darkgrid')
+        _graficos = (plt, mdates, np)
+    elif headless and _graficos[0].get_backend().lower() != "agg":
+        _graficos[0].switch_backend("Agg")
+    return _graficos
 
 class Visualizador:
     """
@@ -10,29 +42,140 @@ class Visualizador:
     Responsable de la visualización de datos y análisis gráfico.
     """
     
-    def __init__(self, estadisticas):
+    def __init__(self, estadisticas, headless=False, cache=None):
         """
         Constructor del visualizador.
         
         Args:
             estadisticas (Estadisticas): Objeto con datos procesados
+            headless (bool): Si es True los gráficos se generan sin
+                ventanas (backend Agg) y solo se escriben en `destino`
+            cache (CacheGraficos): Caché de imágenes renderizadas; si se
+                indica, un gráfico exportado (o generado sin ventanas) con
+                los mismos datos no se vuelve a dibujar. Los gráficos en
+                pantalla se dibujan siempre en vivo, sin caché
         """
         self.stats = estadisticas
-        
-        # Configuración de estilo
-        plt.style.use('seaborn-v0_8-darkgrid')
+        self.headless = headless
+        self.cache = cache
         self.colores = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6']
     
-    def grafico_categorias(self):
+    @staticmethod
+    def _formato(destino, formato):
+        """Formato de imagen pedido, o el de la extensión del destino (png por defecto)."""
+        if destino is None:
+            return "png"  # Lo que se muestra en pantalla se guarda como png
+        if formato is not None:
+            return formato
+        if isinstance(destino, str):
+            return os.path.splitext(destino)[1][1:].lower() or "png"
+        return "png"
+    
+    def _huella(self, grafico, destino, formato, *datos):
+        """
+        Huella de un gráfico para la caché: su nombre, los datos
+        agregados que dibuja, la fecha de hoy y el formato de salida.
+        
+        Returns:
+            str: Huella, o None si no hay caché configurada o el gráfico
+                se muestra en una ventana (siempre se dibuja en vivo)
+        """
+        if self.cache is None or (destino is None and not self.headless):
+            return None
+        return self.cache.huella(grafico, date.today().isoformat(),
+                                 self._formato(destino, formato), *datos)
+    
+    def _entregar(self, datos, destino):
+        """
+        Escribe una imagen ya renderizada en el destino (sin destino,
+        en modo headless, no hay nada que entregar).
+        
+        Returns:
+            str | file: El destino, o None si no había destino
+        """
+        if destino is None:
+            return None
+        
+        if isinstance(destino, str):
+            with open(destino, 'wb') as f:
+                f.write(datos)
+        else:
+            destino.write(datos)
+        return destino
+    
+    def _desde_cache(self, huella, destino):
+        """
+        Entrega el gráfico desde la caché si ya fue renderizado.
+        
+        Returns:
+            bool: True si se encontró en la caché
+        """
+        if huella is None:
+            return False
+        datos = self.cache.obtener(huella)
+        if datos is None:
+            return False
+        self._entregar(datos, destino)
+        return True
+    
+    def _finalizar(self, fig, destino=None, formato=None, huella=None):
+        """
+        Muestra la figura en una ventana o la escribe en un destino.
+        Si se indica una huella, la imagen se guarda además en la caché.
+        
+        Args:
+            fig (Figure): Figura terminada
+            destino (str | file): Ruta o buffer (p. ej. io.BytesIO);
+                si es None se muestra en pantalla
+            formato (str): "png", "svg", "pdf"...; si no se indica se
+                deduce de la extensión (png para buffers)
+            huella (str): Huella con la que se guarda en la caché
+        
+        Returns:
+            str | file: El destino, o None si se mostró en pantalla
+        """
+        plt = _graficos[0]
+        if destino is None and not self.headless:
+            plt.show()  # En pantalla: la figura interactiva, sin pasar por la caché
+            return None
+        
+        if huella is not None:
+            # Se dibuja una sola vez: la misma imagen va a la caché y al destino
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=self._formato(destino, formato))
+            self.cache.guardar(huella, buffer.getvalue())
+            plt.close(fig)
+            return self._entregar(buffer.getvalue(), destino)
+        
+        if destino is not None:
+            fig.savefig(destino, format=self._formato(destino, formato))
+        plt.close(fig)  # Liberar la figura: en lotes se generan muchas
+        return destino
+    
+    @medido
+    def grafico_categorias(self, destino=None, formato=None):
         """
         Crea un gráfico de barras con logros por categoría.
+        
+        Args:
+            destino (str | file): Ruta o buffer de salida; None = mostrar
+            formato (str): Formato de imagen (por defecto según extensión)
+        
+        Returns:
+            str | file: El destino escrito, o None
         """
+        plt, mdates, np = _cargar_graficos(self.headless)
+        
         conteo = self.stats.contar_por_categoria()
         
         if not conteo:
             print("⚠️ No hay datos para mostrar")
             return
         
+        huella = self._huella("categorias", destino, formato, conteo)
+        if self._desde_cache(huella, destino):
+            return destino
+        
         categorias = list(conteo.keys())
         valores = list(conteo.values())
         
@@ -60,32 +203,40 @@ class Visualizador:
         ax2.set_title('Gráfico Circular', fontsize=14)
         
         plt.tight_layout()
-        plt.show()
+        return self._finalizar(fig, destino, formato, huella)
     
-    def grafico_tendencia(self, dias=30):
+    @medido
+    def grafico_tendencia(self, dias=30, destino=None, formato=None):
         """
         Crea un gráfico de líneas con la tendencia de logros en el tiempo.
         
         Args:
             dias (int): Número de días a mostrar
+            destino (str | file): Ruta o buffer de salida; None = mostrar
+            formato (str): Formato de imagen (por defecto según extensión)
+        
+        Returns:
+            str | file: El destino escrito, o None
         """
-        logros_dia = self.stats.logros_por_dia()
+        plt, mdates, np = _cargar_graficos(self.headless)
         
-        if not logros_dia:
+        if self.stats.contar_total() == 0:
             print("⚠️ No hay datos para mostrar")
             return
         
-        # Preparar datos
-        fechas = sorted(logros_dia.keys())
-        
-        # Filtrar últimos N días
+        # Consultar solo los últimos N días (rango sobre el índice por fecha)
         fecha_limite = (datetime.now() - timedelta(days=dias)).strftime("%Y-%m-%d")
-        fechas = [f for f in fechas if f >= fecha_limite]
+        logros_dia = self.stats.logros_por_dia_en_rango(fecha_limite)
+        fechas = sorted(logros_dia.keys())
         
         if not fechas:
             print(f"⚠️ No hay datos en los últimos {dias} días")
             return
         
+        huella = self._huella("tendencia", destino, formato, dias, logros_dia)
+        if self._desde_cache(huella, destino):
+            return destino
+        
         # Convertir a datetime
         fechas_dt = [datetime.strptime(f, "%Y-%m-%d") for f in fechas]
         cantidades = [logros_dia[f] for f in fechas]
@@ -116,21 +267,34 @@ class Visualizador:
         plt.xticks(rotation=45)
         
         plt.tight_layout()
-        plt.show()
+        return self._finalizar(fig, destino, formato, huella)
     
-    def grafico_calendario(self):
+    @medido
+    def grafico_calendario(self, destino=None, formato=None):
         """
         Crea un mapa de calor tipo calendario (últimos 30 días).
+        
+        Args:
+            destino (str | file): Ruta o buffer de salida; None = mostrar
+            formato (str): Formato de imagen (por defecto según extensión)
+        
+        Returns:
+            str | file: El destino escrito, o None
         """
-        logros_dia = self.stats.logros_por_dia()
+        plt, mdates, np = _cargar_graficos(self.headless)
         
         # Generar últimos 30 días
         hoy = datetime.now()
         dias = [(hoy - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(29, -1, -1)]
+        logros_dia = self.stats.logros_por_dia_en_rango(dias[0], dias[-1])
         
         # Obtener cantidades (0 si no hay logros ese día)
         cantidades = [logros_dia.get(dia, 0) for dia in dias]
         
+        huella = self._huella("calendario", destino, formato, dias[0], cantidades)
+        if self._desde_cache(huella, destino):
+            return destino
+        
         # Crear matriz 5x6 (5 semanas de 6 días)
         matriz = np.array(cantidades[:30]).reshape(5, 6)
         
@@ -162,12 +326,22 @@ class Visualizador:
         cbar.set_label('Logros por día', rotation=270, labelpad=20, fontweight='bold')
         
         plt.tight_layout()
-        plt.show()
+        return self._finalizar(fig, destino, formato, huella)
     
-    def dashboard_completo(self):
+    @medido
+    def dashboard_completo(self, destino=None, formato=None):
         """
         Crea un dashboard con múltiples gráficos en una sola ventana.
+        
+        Args:
+            destino (str | file): Ruta o buffer de salida; None = mostrar
+            formato (str): Formato de imagen (por defecto según extensión)
+        
+        Returns:
+            str | file: El destino escrito, o None
         """
+        plt, mdates, np = _cargar_graficos(self.headless)
+        
         conteo = self.stats.contar_por_categoria()
         logros_dia = self.stats.logros_por_dia()
         
@@ -175,6 +349,19 @@ class Visualizador:
             print("⚠️ No hay datos suficientes para mostrar el dashboard")
             return
         
+        total = self.stats.contar_total()
+        racha = self.stats.calcular_racha()
+        semana = self.stats.logros_ultima_semana()
+        mes = self.stats.logros_ultimo_mes()
+        cat_fav, cat_cant = self.stats.categoria_favorita()
+        promedio = self.stats.promedio_diario()
+        
+        huella = self._huella("dashboard", destino, formato, conteo,
+                              sorted(logros_dia.items())[-14:], total, racha,
+                              semana, mes, cat_fav, cat_cant, promedio)
+        if self._desde_cache(huella, destino):
+            return destino
+        
         # Crear figura con subplots
         fig = plt.figure(figsize=(16, 10))
         fig.suptitle('🎯 DAILYWINS - Dashboard Completo', 
@@ -220,13 +407,6 @@ class Visualizador:
         ax4 = plt.subplot(2, 2, 4)
         ax4.axis('off')
         
-        total = len(self.stats.logros)
-        racha = self.stats.calcular_racha()
-        semana = self.stats.logros_ultima_semana()
-        mes = self.stats.logros_ultimo_mes()
-        cat_fav, cat_cant = self.stats.categoria_favorita()
-        promedio = self.stats.promedio_diario()
-        
         stats_text = f"""
         📊 RESUMEN EJECUTIVO
         
@@ -248,7 +428,7 @@ class Visualizador:
                 bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.3))
         
         plt.tight_layout()
-        plt.show()
+        return self._finalizar(fig, destino, formato, huella)
 
 
 # ===== PRUEBA DE LA CLASE (Eliminar después) =====
@@ -258,7 +438,7 @@ if __name__ == "__main__":
     
     # Cargar datos
     gestor = GestorLogros()
-    stats = Estadisticas(gestor.obtener_todos())
+    stats = Estadisticas(fuente=gestor)
     
     # Crear visualizador
     viz = Visualizador(stats)